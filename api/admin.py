@@ -3,12 +3,12 @@ from .models import CustomUser, Hobby
 
 @admin.register(Hobby)
 class HobbyAdmin(admin.ModelAdmin):
-    list_display = ('name', 'created_at')
+    list_display = ('name', 'user_count', 'recent_adds', 'created_at')
     search_fields = ('name',)
 
 @admin.register(CustomUser)
 class CustomUserAdmin(admin.ModelAdmin):
-    list_display = ('username', 'email', 'date_of_birth', 'is_staff')
+    list_display = ('username', 'email', 'date_of_birth', 'friend_count', 'pending_in_count', 'is_staff')
     search_fields = ('username', 'email')
     filter_horizontal = ('hobbies',)  # Makes it easier to manage many-to-many relationships
     list_filter = ('is_staff', 'is_superuser', 'date_of_birth')
@@ -0,0 +1,212 @@
+"""
+ASGI-native versions of the read endpoints that the SPA hits most.
+
+They return the same payloads as the DRF viewsets in api.views but use the
+async ORM, so under an ASGI server a request waiting on the database does not
+hold a worker thread. They are routed in place of the DRF actions when
+ASYNC_API is enabled.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import ensure_csrf_cookie
+from django.views.decorators.http import require_GET, require_safe
+from rest_framework.request import Request
+
+from .catalog import hobby_catalog
+from .events import Event, Subscription, get_broker
+from .conditional import FRIENDS, PENDING, PROFILE, etag_for, is_fresh, set_validators
+from .models import CustomUser, FriendRequest
+from .pagination import FriendPagination, FriendRequestPagination
+from .search import (
+    SearchParams, annotate_results, other_party_ids, page_users, paginate_ranked, parse_search_params,
+    pending_between
+)
+from .search_cache import search_cache
+from .serializers import FriendRequestSerializer, FriendSerializer, UserProfileSerializer, friends_with_hobbies
+from .views import HobbyViewSet
+
+_NOT_AUTHENTICATED: Dict[str, str] = {'detail': 'Authentication credentials were not provided.'}
+
+_sync_hobby_view = HobbyViewSet.as_view({'get': 'list', 'post': 'create'})
+
+
+async def _authenticated_user(request: HttpRequest) -> Optional[CustomUser]:
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+async def _alist(queryset: QuerySet) -> list:
+    return [item async for item in queryset]
+
+
+def _not_modified(etag: Optional[str]) -> HttpResponse:
+    return set_validators(HttpResponseNotModified(), etag)
+
+
+@require_GET
+@ensure_csrf_cookie
+async def profile_me(request: HttpRequest) -> HttpResponse:
+    user: Optional[CustomUser] = await _authenticated_user(request)
+    if user is None:
+        return JsonResponse(_NOT_AUTHENTICATED, status=403)
+
+    etag: Optional[str] = await sync_to_async(etag_for)(user.id, (PROFILE,), True)
+    if is_fresh(request, etag):
+        return _not_modified(etag)
+
+    profile: CustomUser = await CustomUser.objects.prefetch_related('hobbies').aget(pk=user.pk)
+    return set_validators(JsonResponse(UserProfileSerializer(profile).data), etag)
+
+
+@require_GET
+@ensure_csrf_cookie
+async def search_users(request: HttpRequest) -> HttpResponse:
+    """Search for users with similar hobbies and optional age filtering."""
+    user: Optional[CustomUser] = await _authenticated_user(request)
+    if user is None:
+        return JsonResponse(_NOT_AUTHENTICATED, status=403)
+
+    try:
+        try:
+            params: SearchParams = parse_search_params(request.GET)
+            # Ranking is in-process and CPU bound, but may rebuild the index from the database
+            ranked: List[Tuple[int, float]] = await sync_to_async(search_cache.ranked)(
+                user.id, params.min_birth_date, params.max_birth_date, params.score, params.approximate
+            )
+            page_ranked: List[Tuple[int, float]]
+            pagination: Dict[str, Any]
+            page_ranked, pagination = paginate_ranked(ranked, request.GET)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        page_ids: List[int] = [user_id for user_id, _ in page_ranked]
+
+        # The page, friendships and pending requests do not depend on each other
+        users_by_id: Dict[int, CustomUser]
+        friend_ids: List[int]
+        pending_pairs: List[Tuple[int, int]]
+        users_by_id, friend_ids, pending_pairs = await asyncio.gather(
+            CustomUser.objects.prefetch_related('hobbies').ain_bulk(page_ids),
+            _alist(user.friends.filter(id__in=page_ids).values_list('id', flat=True)),
+            _alist(pending_between(user.id, page_ids).values_list('sender_id', 'receiver_id')),
+        )
+
+        users_page: List[CustomUser] = page_users(page_ranked, users_by_id, user.id, params.score)
+        data: List[Dict[str, Any]] = UserProfileSerializer(users_page, many=True).data
+        annotate_results(data, users_page, set(friend_ids), other_party_ids(user.id, pending_pairs))
+
+        return JsonResponse({'users': data, **pagination})
+
+    except Exception as e:
+        # The same failure response as the DRF view
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@require_GET
+async def pending_friend_requests(request: HttpRequest) -> HttpResponse:
+    """Get all pending friend requests for the current user"""
+    user: Optional[CustomUser] = await _authenticated_user(request)
+    if user is None:
+        return JsonResponse(_NOT_AUTHENTICATED, status=403)
+
+    etag: Optional[str] = await sync_to_async(etag_for)(user.id, (PENDING,))
+    if is_fresh(request, etag):
+        return _not_modified(etag)
+
+    pending_requests: QuerySet[FriendRequest] = FriendRequest.objects.filter(
+        receiver=user, status=FriendRequest.PENDING
+    ).select_related('sender', 'receiver')
+    # The paginator evaluates the page synchronously
+    paginator: FriendRequestPagination = FriendRequestPagination()
+    drf_request: Request = Request(request)
+    page: Optional[List[FriendRequest]] = await sync_to_async(paginator.paginate_queryset)(
+        pending_requests, drf_request
+    )
+    if page is None:
+        page = await sync_to_async(paginator.unpaginated_list)(pending_requests, drf_request)
+        return set_validators(JsonResponse(FriendRequestSerializer(page, many=True).data, safe=False), etag)
+    data: Dict[str, Any] = paginator.get_paginated_response(FriendRequestSerializer(page, many=True).data).data
+    return set_validators(JsonResponse(data), etag)
+
+
+@require_GET
+async def friends(request: HttpRequest) -> HttpResponse:
+    """Get all friends of the current user"""
+    user: Optional[CustomUser] = await _authenticated_user(request)
+    if user is None:
+        return JsonResponse(_NOT_AUTHENTICATED, status=403)
+
+    etag: Optional[str] = await sync_to_async(etag_for)(user.id, (FRIENDS,), True)
+    if is_fresh(request, etag):
+        return _not_modified(etag)
+
+    paginator: FriendPagination = FriendPagination()
+    drf_request: Request = Request(request)
+    page: Optional[List[CustomUser]] = await sync_to_async(paginator.paginate_queryset)(
+        friends_with_hobbies(user), drf_request
+    )
+    if page is None:
+        page = await sync_to_async(paginator.unpaginated_list)(friends_with_hobbies(user), drf_request)
+        return set_validators(JsonResponse(FriendSerializer(page, many=True).data, safe=False), etag)
+    data: Dict[str, Any] = paginator.get_paginated_response(FriendSerializer(page, many=True).data).data
+    return set_validators(JsonResponse(data), etag)
+
+
+async def hobby_list(request: HttpRequest) -> HttpResponse:
+    if request.method != 'GET':
+        # Writes keep going through the DRF viewset
+        return await sync_to_async(_sync_hobby_view)(request)
+
+    user: Optional[CustomUser] = await _authenticated_user(request)
+    if user is None:
+        return JsonResponse(_NOT_AUTHENTICATED, status=403)
+
+    etag: Optional[str] = await sync_to_async(etag_for)(user.id, (PROFILE,), True)
+    if is_fresh(request, etag):
+        return _not_modified(etag)
+
+    user_hobby_ids: List[int] = await _alist(user.hobbies.values_list('id', flat=True))
+    data: List[Dict[str, Any]] = await sync_to_async(hobby_catalog.for_user)(user_hobby_ids)
+    return set_validators(JsonResponse(data, safe=False), etag)
+
+
+@require_safe
+async def event_stream(request: HttpRequest) -> HttpResponse:
+    """
+    Server-sent events for the current user's friend requests and friendships
+    (see api.events). Needs an ASGI server, so it is only routed with
+    ASYNC_API; a HEAD request tells clients that push is available.
+    """
+    user: Optional[CustomUser] = await _authenticated_user(request)
+    if user is None:
+        return JsonResponse(_NOT_AUTHENTICATED, status=403)
+    if request.method == 'HEAD':
+        return HttpResponse(content_type='text/event-stream')
+
+    heartbeat: float = getattr(settings, 'EVENTS_HEARTBEAT', 15)
+
+    async def stream():
+        subscription: Subscription = get_broker().subscribe(user.id)
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                event: Optional[Event] = await subscription.get(timeout=heartbeat)
+                if event is None:
+                    # Keeps proxies from timing the connection out
+                    yield ': keep-alive\n\n'
+                else:
+                    yield f'event: {event["type"]}\ndata: {json.dumps(event)}\n\n'
+        finally:
+            subscription.close()
+
+    response: StreamingHttpResponse = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
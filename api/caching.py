@@ -0,0 +1,28 @@
+import time
+from typing import Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.memcached import PyLibMCCache, PyMemcacheCache
+from django.core.cache.backends.redis import RedisCache
+
+# Backends whose incr is a single atomic operation. DatabaseCache's is a read
+# followed by a write, so two concurrent bumps could both land on the same value.
+ATOMIC_INCR_BACKENDS = (RedisCache, PyMemcacheCache, PyLibMCCache, LocMemCache)
+
+
+def cache_is_shared(alias: str = 'default') -> bool:
+    """Whether every worker process sees the same cache, which stamps and versions kept there rely on."""
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def bump_stamp(key: str, timeout: Optional[int], alias: str = 'default') -> None:
+    """Move a version stamp to a value no reader has seen, even with concurrent bumps."""
+    cache = caches[alias]
+    # Time based, so a stamp lost to eviction never restarts from an old value
+    if isinstance(cache, ATOMIC_INCR_BACKENDS):
+        cache.add(key, time.time_ns(), timeout=timeout)
+        cache.incr(key)
+    else:
+        cache.set(key, time.time_ns(), timeout=timeout)
@@ -0,0 +1,69 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .caching import bump_stamp, cache_is_shared
+from .models import Hobby
+from .serializers import HobbySerializer
+
+VERSION_KEY: str = 'hobby-catalog:version'
+CATALOG_TIMEOUT: int = 24 * 60 * 60  # Superseded versions expire on their own
+
+
+class HobbyCatalog:
+    """
+    The serialized hobby catalog, shared by every user.
+
+    The catalog is cached in memory and in the configured Django cache under a
+    catalog version that is bumped whenever a hobby is created, updated or
+    deleted (see api.signals), so it is only serialized once per change. With a
+    per-process cache the version only lives for HOBBY_INDEX_MAX_AGE seconds, as
+    bumps made by other worker processes never reach it.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._local: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+
+    def _timeout(self) -> Optional[int]:
+        return None if cache_is_shared() else getattr(settings, 'HOBBY_INDEX_MAX_AGE', 300)
+
+    def _initial_version(self) -> int:
+        # Time based, so a version lost to cache eviction never reuses an old number
+        initial: int = time.time_ns()
+        cache.add(VERSION_KEY, initial, timeout=self._timeout())
+        return cache.get(VERSION_KEY, initial)
+
+    def version(self) -> int:
+        version: Optional[int] = cache.get(VERSION_KEY)
+        return version if version is not None else self._initial_version()
+
+    def bump(self) -> None:
+        bump_stamp(VERSION_KEY, self._timeout())
+
+    def serialized(self) -> List[Dict[str, Any]]:
+        version: int = self.version()
+        with self._lock:
+            if self._local and self._local[0] == version:
+                return self._local[1]
+
+        key: str = f'hobby-catalog:{version}'
+        data: Optional[List[Dict[str, Any]]] = cache.get(key)
+        if data is None:
+            data = [dict(hobby) for hobby in HobbySerializer(Hobby.objects.all(), many=True).data]
+            cache.set(key, data, timeout=CATALOG_TIMEOUT)
+
+        with self._lock:
+            self._local = (version, data)
+        return data
+
+    def for_user(self, user_hobby_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """The catalog with user_has_hobby set from the user's hobby IDs."""
+        owned: set[int] = set(user_hobby_ids)
+        return [{**hobby, 'user_has_hobby': hobby['id'] in owned} for hobby in self.serialized()]
+
+
+hobby_catalog: HobbyCatalog = HobbyCatalog()
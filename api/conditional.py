@@ -0,0 +1,100 @@
+"""
+Conditional GET for the per-user read endpoints.
+
+Each endpoint's response is described by a few version stamps kept in the
+Django cache: per-user stamps that the signal handlers in api.signals bump
+after the changing transaction commits, and optionally the hobby catalog
+version. The ETag is derived from the stamps alone, so a matching
+If-None-Match is answered with 304 before the view runs any query or
+serializer. The stamps are only trustworthy if every worker sees the same
+cache (see CACHES in the settings); with a per-process cache no ETags are sent.
+"""
+
+import hashlib
+import time
+from functools import wraps
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .caching import bump_stamp, cache_is_shared
+from .catalog import hobby_catalog
+
+PROFILE: str = 'profile'  # The user's own fields and hobby set
+FRIENDS: str = 'friends'  # The user's friend set and the friends' profiles
+PENDING: str = 'pending'  # Pending requests received and their senders' names
+
+STAMP_TIMEOUT: int = 7 * 24 * 60 * 60  # Evicted stamps restart from a new time based value
+
+
+class ResourceVersions:
+    def _key(self, name: str, user_id: int) -> str:
+        return f'versions:{name}:{user_id}'
+
+    def get(self, user_id: int, names: Sequence[str]) -> List[int]:
+        keys: List[str] = [self._key(name, user_id) for name in names]
+        found = cache.get_many(keys)
+        for key in keys:
+            if key not in found:
+                # Time based, so a stamp lost to eviction never reuses an old value
+                cache.add(key, time.time_ns(), timeout=STAMP_TIMEOUT)
+                found[key] = cache.get(key, 0)
+        return [found[key] for key in keys]
+
+    def bump(self, name: str, user_ids: Iterable[int]) -> None:
+        for user_id in set(user_ids):
+            bump_stamp(self._key(name, user_id), STAMP_TIMEOUT)
+
+
+resource_versions: ResourceVersions = ResourceVersions()
+
+
+def etag_for(user_id: int, names: Sequence[str], catalog: bool = False) -> Optional[str]:
+    """None when the cache is per process, as another worker may have missed a bump."""
+    if not cache_is_shared():
+        return None
+    parts: List[int] = [user_id, *resource_versions.get(user_id, names)]
+    if catalog:
+        parts.append(hobby_catalog.version())
+    digest: str = hashlib.sha1('-'.join(map(str, parts)).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def is_fresh(request: HttpRequest, etag: Optional[str]) -> bool:
+    """Whether the request's If-None-Match already names etag (weak comparison)."""
+    header: Optional[str] = request.headers.get('If-None-Match')
+    if not header or etag is None:
+        return False
+    candidates: List[str] = parse_etags(header)
+    return '*' in candidates or any(tag.removeprefix('W/') == etag.removeprefix('W/') for tag in candidates)
+
+
+def set_validators(response: HttpResponse, etag: Optional[str]) -> HttpResponse:
+    if etag is None:
+        return response
+    response['ETag'] = etag
+    # Per-user data: browsers may keep it but must revalidate on every use
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def conditional_get(*names: str, catalog: bool = False) -> Callable:
+    """Decorator for viewset actions serving a GET that is described by the given stamps."""
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapped(self, request: Request, *args, **kwargs) -> Response:
+            # Taken before the view reads anything, so a concurrent change can only make it stale
+            etag: Optional[str] = etag_for(request.user.id, names, catalog)
+            if is_fresh(request, etag):
+                return set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+            response: Response = view(self, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                set_validators(response, etag)
+            return response
+        return wrapped
+    return decorator
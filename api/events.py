@@ -0,0 +1,111 @@
+"""
+Push notifications for friend requests and friendships.
+
+Signal handlers in api.signals publish events to the users involved through
+the broker named by the EVENT_BROKER setting; the SSE view in api.async_views
+and the WebSocket endpoint in api.websocket relay them to the browser. The
+default InProcessBroker only reaches connections served by the same process,
+so deployments with several workers plug in a broker backed by a shared
+message bus (implementing EventBroker) instead.
+"""
+
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Set
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+Event = Dict[str, Any]
+
+FRIEND_REQUEST_CREATED: str = 'friend_request.created'
+FRIEND_REQUEST_ACCEPTED: str = 'friend_request.accepted'
+FRIEND_REQUEST_REJECTED: str = 'friend_request.rejected'
+FRIENDSHIP_REMOVED: str = 'friendship.removed'
+
+
+class Subscription:
+    """One connection's queue of events. Iterate with get() from the event loop it was opened on."""
+
+    MAX_QUEUED: int = 100
+
+    def __init__(self, broker: 'EventBroker', user_id: int) -> None:
+        self.broker = broker
+        self.user_id: int = user_id
+        self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUED)
+
+    def deliver(self, event: Event) -> None:
+        """Queue an event; safe to call from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The connection's event loop has gone away
+            self.close()
+
+    def _put(self, event: Event) -> None:
+        if self._queue.full():
+            # A client that stopped reading loses its oldest events, not the newest
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """The next event, or None if none arrives within timeout seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class EventBroker:
+    def publish(self, user_ids: Iterable[int], event: Event) -> None:
+        raise NotImplementedError
+
+    def subscribe(self, user_id: int) -> Subscription:
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        raise NotImplementedError
+
+
+class InProcessBroker(EventBroker):
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+
+    def publish(self, user_ids: Iterable[int], event: Event) -> None:
+        with self._lock:
+            targets = [subscription for user_id in set(user_ids)
+                       for subscription in self._subscriptions.get(user_id, ())]
+        for subscription in targets:
+            subscription.deliver(event)
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription: Subscription = Subscription(self, user_id)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions: Set[Subscription] = self._subscriptions.get(subscription.user_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.user_id, None)
+
+
+@lru_cache(maxsize=None)
+def get_broker() -> EventBroker:
+    return import_string(getattr(settings, 'EVENT_BROKER', 'api.events.InProcessBroker'))()
+
+
+@receiver(setting_changed)
+def reset_broker(setting: str, **kwargs) -> None:
+    if setting == 'EVENT_BROKER':
+        get_broker.cache_clear()
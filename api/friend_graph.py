@@ -0,0 +1,172 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from .models import CustomUser
+from .search_index import hobby_index
+
+FriendsThrough = CustomUser.friends.through
+
+
+class FriendGraph:
+    """
+    In-process friendship graph for mutual friend counts and 2-hop suggestions.
+
+    Friendships are held as a compressed sparse row adjacency: the friend IDs
+    of the user at row r are neighbors[offsets[r]:offsets[r + 1]], sorted.
+    Changes from m2m_changed go into a small overlay of added and removed
+    edges, which is folded back into the arrays once it passes COMPACT_AFTER
+    edges. Like the hobby index, the graph is rebuilt from the database once it
+    is older than FRIEND_GRAPH_MAX_AGE, so other workers' changes show up.
+    """
+
+    COMPACT_AFTER: int = 10_000
+
+    def __init__(self) -> None:
+        self._lock: threading.RLock = threading.RLock()
+        self._loaded: bool = False
+        self._loaded_at: float = 0.0
+        self._rows: Dict[int, int] = {}
+        self._offsets: np.ndarray = np.zeros(1, dtype=np.int64)
+        self._neighbors: np.ndarray = np.empty(0, dtype=np.int64)
+        self._added: Dict[int, Set[int]] = {}
+        self._removed: Dict[int, Set[int]] = {}
+        self._overlay_size: int = 0
+
+    @property
+    def max_age(self) -> float:
+        return getattr(settings, 'FRIEND_GRAPH_MAX_AGE', 300)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded = False
+
+    def _load_edges(self, sources: np.ndarray, targets: np.ndarray) -> None:
+        order: np.ndarray = np.lexsort((targets, sources))
+        sources, targets = sources[order], targets[order]
+        user_ids, starts = np.unique(sources, return_index=True)
+        self._rows = {user_id: row for row, user_id in enumerate(user_ids.tolist())}
+        self._offsets = np.append(starts, len(sources)).astype(np.int64)
+        self._neighbors = targets
+        self._added, self._removed, self._overlay_size = {}, {}, 0
+
+    def rebuild(self) -> None:
+        # The through table holds both directions of every friendship
+        edges: np.ndarray = np.array(
+            list(FriendsThrough.objects.values_list('from_customuser_id', 'to_customuser_id').iterator()),
+            dtype=np.int64
+        ).reshape(-1, 2)
+        with self._lock:
+            self._load_edges(edges[:, 0], edges[:, 1])
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+
+    def ensure_loaded(self) -> None:
+        with self._lock:
+            if not self._loaded or time.monotonic() - self._loaded_at >= self.max_age:
+                self.rebuild()
+
+    def _base(self, user_id: int) -> np.ndarray:
+        row: Optional[int] = self._rows.get(user_id)
+        if row is None:
+            return self._neighbors[:0]
+        return self._neighbors[self._offsets[row]:self._offsets[row + 1]]
+
+    def _friends(self, user_id: int) -> np.ndarray:
+        base: np.ndarray = self._base(user_id)
+        added: Set[int] = self._added.get(user_id, set())
+        removed: Set[int] = self._removed.get(user_id, set())
+        if not added and not removed:
+            return base
+        if removed:
+            base = base[~np.isin(base, list(removed))]
+        return np.union1d(base, np.fromiter(added, dtype=np.int64, count=len(added)))
+
+    def _compact(self) -> None:
+        user_ids: Set[int] = set(self._rows) | set(self._added)
+        rows: List[Tuple[int, np.ndarray]] = [(user_id, self._friends(user_id)) for user_id in user_ids]
+        sources: np.ndarray = np.concatenate(
+            [np.full(len(friends), user_id, dtype=np.int64) for user_id, friends in rows] or [np.empty(0, np.int64)]
+        )
+        targets: np.ndarray = np.concatenate([friends for _, friends in rows] or [np.empty(0, np.int64)])
+        self._load_edges(sources, targets)
+
+    def _set_edge(self, user_id: int, friend_id: int, present: bool) -> None:
+        in_base: bool = bool(np.isin(friend_id, self._base(user_id)))
+        overlay, undo = (self._added, self._removed) if present else (self._removed, self._added)
+        undo.get(user_id, set()).discard(friend_id)
+        if in_base != present:
+            overlay.setdefault(user_id, set()).add(friend_id)
+            self._overlay_size += 1
+
+    # Incremental updates, called from signal handlers
+
+    def set_friends(self, user_id: int, friend_ids: Iterable[int], present: bool) -> None:
+        """Add (present=True) or remove friendships between user_id and each of friend_ids."""
+        with self._lock:
+            if not self._loaded:
+                return
+            for friend_id in friend_ids:
+                self._set_edge(user_id, friend_id, present)
+                self._set_edge(friend_id, user_id, present)
+            if self._overlay_size > self.COMPACT_AFTER:
+                self._compact()
+
+    def remove_user(self, user_id: int) -> None:
+        with self._lock:
+            if self._loaded:
+                self.set_friends(user_id, self._friends(user_id).tolist(), present=False)
+
+    # Queries
+
+    def friend_ids(self, user_id: int) -> np.ndarray:
+        self.ensure_loaded()
+        with self._lock:
+            return self._friends(user_id)
+
+    def mutual_friend_ids(self, user_id: int, other_id: int) -> np.ndarray:
+        self.ensure_loaded()
+        with self._lock:
+            return np.intersect1d(self._friends(user_id), self._friends(other_id), assume_unique=True)
+
+    def suggestions(
+            self,
+            user_id: int,
+            limit: int = 10,
+            hobby_weight: float = 0.0,
+            exclude: Iterable[int] = ()
+    ) -> List[Tuple[int, int, int, float]]:
+        """
+        Friends of friends ranked by mutual friends, plus hobby_weight times the
+        hobbies in common. Returns (user_id, mutual friends, common hobbies,
+        score) tuples, best first; common hobbies are 0 when hobby_weight is 0.
+        """
+        self.ensure_loaded()
+        with self._lock:
+            own: np.ndarray = self._friends(user_id)
+            if not len(own):
+                return []
+            reachable: np.ndarray = np.concatenate([self._friends(friend_id) for friend_id in own.tolist()])
+
+        excluded: np.ndarray = np.union1d(own, np.array([user_id, *exclude], dtype=np.int64))
+        candidates, mutual = np.unique(reachable[~np.isin(reachable, excluded)], return_counts=True)
+        common: np.ndarray = np.zeros(len(candidates), dtype=np.int64)
+        if hobby_weight:
+            hobby_index.ensure_loaded()
+            common = np.fromiter(
+                (hobby_index.common_count(user_id, candidate) for candidate in candidates.tolist()),
+                dtype=np.int64, count=len(candidates)
+            )
+        scores: np.ndarray = mutual + hobby_weight * common
+
+        top: np.ndarray = np.lexsort((candidates, -scores))[:limit]
+        return [
+            (int(candidates[i]), int(mutual[i]), int(common[i]), float(scores[i]))
+            for i in top.tolist()
+        ]
+
+
+friend_graph: FriendGraph = FriendGraph()
@@ -0,0 +1,169 @@
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+
+from .models import Hobby
+from .search_index import hobby_index
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded: str = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _word_starts(key: str) -> List[int]:
+    return [0] + [i + 1 for i, char in enumerate(key) if char == ' ']
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance between a and b, or limit + 1 once it is known to exceed limit."""
+    previous: List[int] = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current: List[int] = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class _TrieNode:
+    __slots__ = ('children', 'hobby_ids')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        # Every hobby with a word starting with the path to this node
+        self.hobby_ids: Set[int] = set()
+
+
+class HobbySuggester:
+    """
+    In-memory autocomplete over hobby names.
+
+    A prefix trie over the words of each name answers prefix queries, and a
+    trigram index supplies candidates for queries with a typo, which are then
+    checked by edit distance. Results are ranked by how many users have the
+    hobby. The index is built on first use and patched from the Hobby signals
+    in api.signals once their change commits. Like the hobby search index, it is
+    rebuilt once it is older than HOBBY_INDEX_MAX_AGE seconds, so hobbies created
+    or renamed through other worker processes show up.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.RLock = threading.RLock()
+        self._loaded: bool = False
+        self._loaded_at: float = 0.0
+        self._names: Dict[int, str] = {}
+        self._root: _TrieNode = _TrieNode()
+        self._trigrams: Dict[str, Set[int]] = {}
+
+    @property
+    def max_age(self) -> float:
+        return getattr(settings, 'HOBBY_INDEX_MAX_AGE', 300)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded = False
+
+    def ensure_loaded(self) -> None:
+        with self._lock:
+            if self._loaded and time.monotonic() - self._loaded_at < self.max_age:
+                return
+            self._names = {}
+            self._root = _TrieNode()
+            self._trigrams = {}
+            for hobby_id, name in Hobby.objects.values_list('id', 'name').iterator():
+                self._insert(hobby_id, name)
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+
+    def _insert(self, hobby_id: int, name: str) -> None:
+        key: str = name.lower()
+        self._names[hobby_id] = name
+        for word_start in _word_starts(key):
+            node: _TrieNode = self._root
+            for char in key[word_start:]:
+                node = node.children.setdefault(char, _TrieNode())
+                node.hobby_ids.add(hobby_id)
+        for trigram in _trigrams(key):
+            self._trigrams.setdefault(trigram, set()).add(hobby_id)
+
+    def _remove(self, hobby_id: int) -> None:
+        name: Optional[str] = self._names.pop(hobby_id, None)
+        if name is None:
+            return
+        key: str = name.lower()
+        for word_start in _word_starts(key):
+            node: _TrieNode = self._root
+            for char in key[word_start:]:
+                node = node.children[char]
+                node.hobby_ids.discard(hobby_id)
+        for trigram in _trigrams(key):
+            self._trigrams.get(trigram, set()).discard(hobby_id)
+
+    # Incremental updates, called from signal handlers
+
+    def set_hobby(self, hobby_id: int, name: str) -> None:
+        with self._lock:
+            if not self._loaded:
+                return
+            self._remove(hobby_id)
+            self._insert(hobby_id, name)
+
+    def remove_hobby(self, hobby_id: int) -> None:
+        with self._lock:
+            if self._loaded:
+                self._remove(hobby_id)
+
+    # Queries
+
+    def _prefix_matches(self, query: str) -> Set[int]:
+        node: Optional[_TrieNode] = self._root
+        for char in query:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return set(node.hobby_ids)
+
+    def _fuzzy_matches(self, query: str, exclude: Set[int]) -> Dict[int, int]:
+        """Hobbies whose name (or a word of it) starts with query give or take a typo, by distance."""
+        limit: int = 1 if len(query) <= 5 else 2
+        candidates: Set[int] = set()
+        for trigram in _trigrams(query):
+            candidates |= self._trigrams.get(trigram, set())
+
+        distances: Dict[int, int] = {}
+        for hobby_id in candidates - exclude:
+            key: str = self._names[hobby_id].lower()
+            # Compare against prefixes one shorter or longer too, so a dropped or extra letter counts once
+            distance: int = min(
+                _edit_distance(query, key[start:start + length], limit)
+                for start in _word_starts(key)
+                for length in (len(query) - 1, len(query), len(query) + 1)
+            )
+            if distance <= limit:
+                distances[hobby_id] = distance
+        return distances
+
+    def suggest(self, query: str, limit: int = 10) -> List[Tuple[int, str]]:
+        """(id, name) pairs of the best matching hobbies, most popular first."""
+        query = ' '.join(query.lower().split())
+        if not query:
+            return []
+        self.ensure_loaded()
+        hobby_index.ensure_loaded()
+        with self._lock:
+            prefix: Set[int] = self._prefix_matches(query)
+            ranked: List[int] = sorted(prefix, key=lambda hobby_id: (-hobby_index.popularity(hobby_id), self._names[hobby_id]))
+            if len(ranked) < limit and len(query) >= 3:
+                fuzzy: Dict[int, int] = self._fuzzy_matches(query, prefix)
+                ranked += sorted(fuzzy, key=lambda hobby_id: (
+                    fuzzy[hobby_id], -hobby_index.popularity(hobby_id), self._names[hobby_id]
+                ))
+            return [(hobby_id, self._names[hobby_id]) for hobby_id in ranked[:limit]]
+
+
+hobby_suggester: HobbySuggester = HobbySuggester()
@@ -0,0 +1,108 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from django.conf import settings
+
+from .search_index import hobby_index
+
+# Mersenne prime for the universal hash family; keeps a * x + b inside int64
+_PRIME: int = (1 << 31) - 1
+
+
+class MinHashLSH:
+    """
+    Approximate candidate generation for search_users on large user bases.
+
+    Each user's hobby set is summarised by a MinHash signature which is split
+    into LSH bands. Users whose signatures collide in at least one band become
+    candidates, which the caller then re-ranks exactly. Signatures are built
+    from the in-process hobby index and updated per user from api.signals.
+    """
+
+    def __init__(self, num_perm: Optional[int] = None, bands: Optional[int] = None, seed: int = 1) -> None:
+        self.num_perm: int = num_perm or getattr(settings, 'LSH_NUM_PERM', 64)
+        self.bands: int = bands or getattr(settings, 'LSH_BANDS', 16)
+        if self.num_perm % self.bands:
+            raise ValueError('LSH_NUM_PERM must be a multiple of LSH_BANDS')
+        self.rows: int = self.num_perm // self.bands
+
+        # The same seed in every process gives the same hash family everywhere
+        rng: np.random.Generator = np.random.default_rng(seed)
+        self._a: np.ndarray = rng.integers(1, _PRIME, size=self.num_perm, dtype=np.int64)
+        self._b: np.ndarray = rng.integers(0, _PRIME, size=self.num_perm, dtype=np.int64)
+
+        self._lock: threading.RLock = threading.RLock()
+        self._generation: Optional[int] = None
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, Set[int]]] = [{} for _ in range(self.bands)]
+
+    def signature(self, hobby_ids: Iterable[int]) -> Optional[np.ndarray]:
+        values: np.ndarray = np.fromiter(hobby_ids, dtype=np.int64) % _PRIME
+        if not values.size:
+            return None
+        hashes: np.ndarray = (self._a[:, None] * values[None, :] + self._b[:, None]) % _PRIME
+        return hashes.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def _insert(self, user_id: int, signature: Optional[np.ndarray]) -> None:
+        if signature is None:
+            return
+        self._signatures[user_id] = signature
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, set()).add(user_id)
+
+    def _discard(self, user_id: int) -> None:
+        signature: Optional[np.ndarray] = self._signatures.pop(user_id, None)
+        if signature is None:
+            return
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket: Set[int] = self._buckets[band].get(key, set())
+            bucket.discard(user_id)
+            if not bucket:
+                self._buckets[band].pop(key, None)
+
+    def ensure_loaded(self) -> None:
+        """Rebuild every signature whenever the hobby index itself was rebuilt."""
+        hobby_index.ensure_loaded()
+        with self._lock:
+            if self._generation == hobby_index.generation:
+                return
+            self._signatures = {}
+            self._buckets = [{} for _ in range(self.bands)]
+            for user_id, hobby_ids in hobby_index.user_hobby_ids().items():
+                self._insert(user_id, self.signature(hobby_ids))
+            self._generation = hobby_index.generation
+
+    def update_user(self, user_id: int) -> None:
+        """Re-sign a user from the hobby index after their hobbies changed."""
+        with self._lock:
+            if self._generation != hobby_index.generation:
+                return
+            self._discard(user_id)
+            self._insert(user_id, self.signature(hobby_index.hobby_ids(user_id)))
+
+    def remove_user(self, user_id: int) -> None:
+        with self._lock:
+            self._discard(user_id)
+
+    def candidates(self, user_id: int) -> Optional[Set[int]]:
+        """
+        Users colliding with user_id in at least one band, or None when the
+        user has no hobbies and every user is a candidate.
+        """
+        self.ensure_loaded()
+        with self._lock:
+            signature: Optional[np.ndarray] = self._signatures.get(user_id)
+            if signature is None:
+                return None
+            found: Set[int] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                found |= self._buckets[band].get(key, set())
+            found.discard(user_id)
+            return found
+
+
+lsh_index: MinHashLSH = MinHashLSH()
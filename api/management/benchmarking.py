@@ -0,0 +1,16 @@
+from typing import Dict, List
+
+
+def percentile(values: List[float], percent: float) -> float:
+    ordered: List[float] = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def latency_summary(timings: List[float]) -> Dict[str, float]:
+    """p50/p95/p99 and mean of a list of durations in seconds, reported in milliseconds."""
+    return {
+        'p50': percentile(timings, 50) * 1000,
+        'p95': percentile(timings, 95) * 1000,
+        'p99': percentile(timings, 99) * 1000,
+        'mean': sum(timings) / len(timings) * 1000,
+    }
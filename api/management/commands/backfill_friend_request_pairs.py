@@ -0,0 +1,54 @@
+from typing import Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Greatest, Least
+
+from api.models import FriendRequest
+
+# Which request survives when both directions exist for a pair
+STATUS_PRIORITY: Dict[str, int] = {FriendRequest.ACCEPTED: 0, FriendRequest.PENDING: 1, FriendRequest.REJECTED: 2}
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill FriendRequest.user_low/user_high on rows that predate the columns. Where requests exist in both '
+        'directions between two users, only one is kept (accepted, then pending, then the newest). '
+        'Run after migrating an existing database to the canonical pair columns.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+
+    def handle(self, *args, **options) -> None:
+        pairs = FriendRequest.objects.annotate(
+            low=Least('sender_id', 'receiver_id'), high=Greatest('sender_id', 'receiver_id')
+        )
+        duplicated: List[Tuple[int, int]] = list(
+            pairs.values('low', 'high').annotate(count=Count('id')).filter(count__gt=1).values_list('low', 'high')
+        )
+
+        with transaction.atomic():
+            removed: int = 0
+            for low, high in duplicated:
+                requests: List[FriendRequest] = sorted(
+                    pairs.filter(low=low, high=high),
+                    key=lambda r: (STATUS_PRIORITY[r.status], -r.updated_at.timestamp())
+                )
+                removed += len(requests) - 1
+                if not options['dry_run']:
+                    FriendRequest.objects.filter(id__in=[r.id for r in requests[1:]]).delete()
+
+            missing = FriendRequest.objects.filter(user_low__isnull=True)
+            filled: int = missing.count()
+            if not options['dry_run']:
+                # Rows with the pair already set were saved after the columns existed
+                missing.update(
+                    user_low_id=Least('sender_id', 'receiver_id'), user_high_id=Greatest('sender_id', 'receiver_id')
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{"Would remove" if options["dry_run"] else "Removed"} {removed} opposite-direction duplicates, '
+            f'{"would fill" if options["dry_run"] else "filled"} {filled} pairs'
+        ))
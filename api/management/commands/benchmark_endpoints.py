@@ -0,0 +1,159 @@
+import random
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from api.management.benchmarking import latency_summary
+from api.models import CustomUser, FriendRequest, Hobby
+
+
+class Endpoint(NamedTuple):
+    name: str
+    method: str
+    # Builds (path, data) for the given user, or None when there is nothing to request
+    target: Callable[[CustomUser], Optional[tuple]]
+    writes: bool = False
+
+
+def _pending_for(user: CustomUser) -> Optional[int]:
+    return FriendRequest.objects.filter(receiver=user, status=FriendRequest.PENDING).values_list(
+        'id', flat=True
+    ).first()
+
+
+def _friend_of(user: CustomUser) -> Optional[int]:
+    return user.friends.values_list('id', flat=True).first()
+
+
+def _random_hobby() -> int:
+    return Hobby.objects.order_by('?').values_list('id', flat=True).first()
+
+
+def _stranger() -> int:
+    return CustomUser.objects.order_by('?').values_list('id', flat=True).first()
+
+
+# Every route registered on the router in api/urls.py
+ENDPOINTS: List[Endpoint] = [
+    Endpoint('hobbies list', 'get', lambda user: ('/api/hobbies/', None)),
+    Endpoint('hobbies suggest', 'get', lambda user: ('/api/hobbies/suggest/', {'q': 'phot'})),
+    Endpoint('hobbies trending', 'get', lambda user: ('/api/hobbies/trending/', None)),
+    Endpoint('hobbies retrieve', 'get', lambda user: (f'/api/hobbies/{_random_hobby()}/', None)),
+    Endpoint('hobbies add_to_profile', 'post',
+             lambda user: (f'/api/hobbies/{_random_hobby()}/add_to_profile/', None), writes=True),
+    Endpoint('hobbies remove_from_profile', 'post',
+             lambda user: (f'/api/hobbies/{_random_hobby()}/remove_from_profile/', None), writes=True),
+    Endpoint('hobbies create_hobby', 'post',
+             lambda user: ('/api/hobbies/create_hobby/', {'name': 'benchmarking'}), writes=True),
+    Endpoint('profile me', 'get', lambda user: ('/api/profile/me/', None)),
+    Endpoint('profile search_users', 'get', lambda user: ('/api/profile/search_users/', None)),
+    Endpoint('profile search_users page 5', 'get', lambda user: ('/api/profile/search_users/', {'page': 5})),
+    Endpoint('profile search_users aged', 'get',
+             lambda user: ('/api/profile/search_users/', {'min_age': 25, 'max_age': 35})),
+    Endpoint('profile hobbies', 'patch',
+             lambda user: ('/api/profile/hobbies/', {'add': [_random_hobby()]}), writes=True),
+    Endpoint('profile update_profile', 'patch',
+             lambda user: ('/api/profile/update_profile/', {'date_of_birth': '1995-01-01'}), writes=True),
+    Endpoint('friend-requests list', 'get', lambda user: ('/api/friend-requests/', {'page_size': 50})),
+    Endpoint('friend-requests pending', 'get', lambda user: ('/api/friend-requests/pending/', {'page_size': 50})),
+    Endpoint('friend-requests friends', 'get', lambda user: ('/api/friend-requests/friends/', {'page_size': 50})),
+    Endpoint('friend-requests suggestions', 'get', lambda user: ('/api/friend-requests/suggestions/', None)),
+    Endpoint('friend-requests suggest+hobbies', 'get',
+             lambda user: ('/api/friend-requests/suggestions/', {'hobby_weight': 0.5})),
+    Endpoint('friend-requests mutual_friends', 'get',
+             lambda user: ('/api/friend-requests/mutual_friends/', {'user_id': _stranger()})),
+    Endpoint('friend-requests create', 'post',
+             lambda user: ('/api/friend-requests/', {'receiver': _stranger()}), writes=True),
+    Endpoint('friend-requests accept', 'post',
+             lambda user: (f'/api/friend-requests/{pk}/accept/', None) if (pk := _pending_for(user)) else None,
+             writes=True),
+    Endpoint('friend-requests reject', 'post',
+             lambda user: (f'/api/friend-requests/{pk}/reject/', None) if (pk := _pending_for(user)) else None,
+             writes=True),
+    Endpoint('friend-requests bulk_accept', 'post',
+             lambda user: ('/api/friend-requests/bulk_accept/', {'all': True}), writes=True),
+    Endpoint('friend-requests bulk_reject', 'post',
+             lambda user: ('/api/friend-requests/bulk_reject/', {'all': True}), writes=True),
+    Endpoint('friend-requests unfollow', 'post',
+             lambda user: ('/api/friend-requests/unfollow/', {'user_id': pk}) if (pk := _friend_of(user)) else None,
+             writes=True),
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Drive every API router endpoint through the Django test client and report latency '
+        'percentiles, queries per request and throughput, optionally at several dataset sizes'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint')
+        parser.add_argument('--scales', type=int, nargs='*', default=[],
+                            help='Top the database up with generate_data to each user count (e.g. 1000 100000 '
+                                 '1000000) and benchmark at every size')
+        parser.add_argument('--endpoint', action='append', dest='endpoints', help='Only run endpoints containing this')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options) -> None:
+        scales: List[Optional[int]] = options['scales'] or [None]
+        for scale in scales:
+            if scale is not None:
+                missing: int = scale - CustomUser.objects.count()
+                if missing > 0:
+                    call_command('generate_data', users=missing, seed=options['seed'], stdout=self.stdout)
+            self._run(options)
+
+    def _run(self, options: Dict[str, Any]) -> None:
+        rng: random.Random = random.Random(options['seed'])
+        user_ids: List[int] = list(CustomUser.objects.values_list('id', flat=True))
+        self.stdout.write(f'\n{len(user_ids)} users, {options["requests"]} requests per endpoint')
+        self.stdout.write(f'{"endpoint":<32}{"req/s":>9}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"queries":>9}')
+
+        client: Client = Client()
+        for endpoint in ENDPOINTS:
+            if options['endpoints'] and not any(part in endpoint.name for part in options['endpoints']):
+                continue
+
+            timings: List[float] = []
+            query_counts: List[int] = []
+            for _ in range(options['requests']):
+                user: CustomUser = CustomUser.objects.get(id=rng.choice(user_ids))
+                client.force_login(user)
+                try:
+                    # Writes are rolled back so every run sees the same data
+                    with transaction.atomic():
+                        target: Optional[tuple] = endpoint.target(user)
+                        if target is None:
+                            raise _Rollback
+                        path, data = target
+                        with CaptureQueriesContext(connection) as queries:
+                            started: float = time.perf_counter()
+                            if endpoint.method == 'get':
+                                client.get(path, data)
+                            else:
+                                getattr(client, endpoint.method)(path, data, content_type='application/json')
+                            timings.append(time.perf_counter() - started)
+                        query_counts.append(len(queries))
+                        if endpoint.writes:
+                            raise _Rollback
+                except _Rollback:
+                    pass
+
+            if not timings:
+                self.stdout.write(f'{endpoint.name:<32}  (nothing to request)')
+                continue
+            summary: Dict[str, float] = latency_summary(timings)
+            self.stdout.write(
+                f'{endpoint.name:<32}{len(timings) / sum(timings):9.1f}{summary["p50"]:9.1f}'
+                f'{summary["p95"]:9.1f}{summary["p99"]:9.1f}{sum(query_counts) / len(query_counts):9.1f}'
+            )
+
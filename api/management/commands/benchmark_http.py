@@ -0,0 +1,81 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, OpenerDirector, Request, build_opener
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from api.management.benchmarking import latency_summary
+
+DEFAULT_PATHS: List[str] = [
+    '/api/profile/me/',
+    '/api/profile/search_users/',
+    '/api/friend-requests/pending/?page_size=50',
+    '/api/friend-requests/friends/?page_size=50',
+    '/api/hobbies/',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure concurrent throughput of running servers, e.g. the WSGI (gunicorn project.wsgi) '
+        'and ASGI (gunicorn -c project/gunicorn_asgi.py project.asgi:application) deployments'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('urls', nargs='+', help='Base URL of each server to compare')
+        parser.add_argument('--username', default='admin')
+        parser.add_argument('--password', default='admin')
+        parser.add_argument('--path', action='append', dest='paths', help='Endpoint to hit (repeatable)')
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--requests', type=int, default=1000, help='Requests per endpoint')
+
+    def _login(self, base_url: str, username: str, password: str) -> OpenerDirector:
+        cookies: CookieJar = CookieJar()
+        opener: OpenerDirector = build_opener(HTTPCookieProcessor(cookies))
+        opener.open(f'{base_url}/login/').read()
+        csrf_token: Optional[str] = next((c.value for c in cookies if c.name == 'csrftoken'), None)
+        body: bytes = urlencode({
+            'username': username,
+            'password': password,
+            'csrfmiddlewaretoken': csrf_token or '',
+        }).encode()
+        opener.open(Request(f'{base_url}/login/', data=body, headers={'Referer': f'{base_url}/login/'})).read()
+        if not any(c.name == 'sessionid' for c in cookies):
+            raise CommandError(f'Could not log in to {base_url} as {username}')
+        return opener
+
+    def handle(self, *args, **options) -> None:
+        paths: List[str] = options['paths'] or DEFAULT_PATHS
+
+        for base_url in options['urls']:
+            base_url = base_url.rstrip('/')
+            opener: OpenerDirector = self._login(base_url, options['username'], options['password'])
+            self.stdout.write(f'\n{base_url} (concurrency {options["concurrency"]})')
+
+            for path in paths:
+                def fetch(_: int) -> Tuple[float, bool]:
+                    started: float = time.perf_counter()
+                    try:
+                        opener.open(f'{base_url}{path}').read()
+                        ok: bool = True
+                    except HTTPError as e:
+                        e.read()
+                        ok = False
+                    return time.perf_counter() - started, ok
+
+                started: float = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+                    results: List[Tuple[float, bool]] = list(pool.map(fetch, range(options['requests'])))
+                elapsed: float = time.perf_counter() - started
+
+                summary: Dict[str, float] = latency_summary([duration for duration, _ in results])
+                errors: int = sum(1 for _, ok in results if not ok)
+                self.stdout.write(
+                    f'  {path:<35} {len(results) / elapsed:8.1f} req/s  '
+                    f'p50={summary["p50"]:.1f}ms p95={summary["p95"]:.1f}ms p99={summary["p99"]:.1f}ms'
+                    f'  errors={errors}'
+                )
@@ -0,0 +1,66 @@
+import random
+import time
+from typing import Dict, List, Set, Tuple
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from api.lsh import lsh_index
+from api.management.benchmarking import latency_summary
+from api.search_index import hobby_index
+
+
+class Command(BaseCommand):
+    help = 'Compare recall and latency of approximate (MinHash/LSH) search against the exact path'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--samples', type=int, default=200, help='Number of users to search as')
+        parser.add_argument('--k', type=int, default=10, help='Result page size used for recall@k')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options) -> None:
+        k: int = options['k']
+
+        started: float = time.perf_counter()
+        lsh_index.ensure_loaded()
+        self.stdout.write(f'Index build: {time.perf_counter() - started:.2f}s')
+
+        user_ids: List[int] = [
+            user_id for user_id, hobby_ids in hobby_index.user_hobby_ids().items() if hobby_ids
+        ]
+        sample: List[int] = random.Random(options['seed']).sample(user_ids, min(options['samples'], len(user_ids)))
+        if not sample:
+            self.stdout.write('No users with hobbies to benchmark')
+            return
+
+        exact_times: List[float] = []
+        approximate_times: List[float] = []
+        recalls: List[float] = []
+        candidate_counts: List[int] = []
+
+        for user_id in sample:
+            started = time.perf_counter()
+            exact: List[Tuple[int, int]] = hobby_index.rank(user_id)
+            exact_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            candidates: Set[int] = lsh_index.candidates(user_id) or set()
+            approximate: List[Tuple[int, int]] = hobby_index.rank(user_id, candidates=candidates)
+            approximate_times.append(time.perf_counter() - started)
+            candidate_counts.append(len(candidates))
+
+            if not exact:
+                continue
+            # Tie-aware recall: any approximate hit scoring at least the k-th exact score counts
+            expected: int = min(k, len(exact))
+            threshold: int = exact[expected - 1][1]
+            found: int = sum(1 for _, common in approximate[:k] if common >= threshold)
+            recalls.append(min(found, expected) / expected)
+
+        for label, timings in (('exact', exact_times), ('approximate', approximate_times)):
+            summary: Dict[str, float] = latency_summary(timings)
+            self.stdout.write(
+                f'{label:>12}: p50={summary["p50"]:.2f}ms p95={summary["p95"]:.2f}ms mean={summary["mean"]:.2f}ms'
+            )
+        self.stdout.write(f'mean candidates: {sum(candidate_counts) / len(candidate_counts):.0f} of {len(user_ids)}')
+        if recalls:
+            self.stdout.write(f'recall@{k}: {sum(recalls) / len(recalls):.3f}')
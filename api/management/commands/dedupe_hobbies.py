@@ -0,0 +1,57 @@
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from api.models import CustomUser, Hobby
+
+
+class Command(BaseCommand):
+    help = (
+        'Merge hobbies whose names differ only by case into the oldest one, moving their users across. '
+        'Run before migrating to the unique Lower(name) index on an existing database, then reconcile_hobby_counts '
+        'once migrated.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--dry-run', action='store_true', help='Report duplicates without changing anything')
+
+    def handle(self, *args, **options) -> None:
+        groups: Dict[str, List[int]] = {}
+        for hobby_id, lower_name in Hobby.objects.annotate(lower_name=Lower('name')).order_by('id').values_list(
+            'id', 'lower_name'
+        ):
+            groups.setdefault(lower_name, []).append(hobby_id)
+        duplicates: Dict[int, List[int]] = {ids[0]: ids[1:] for ids in groups.values() if len(ids) > 1}
+
+        if not duplicates:
+            self.stdout.write('No duplicate hobbies')
+            return
+
+        # Runs on the schema from before the migration: only id, name and the through table are read or
+        # written, and the model signals (which touch the newer counter columns) are bypassed
+        through = CustomUser.hobbies.through
+        names: Dict[int, str] = dict(Hobby.objects.filter(id__in=duplicates).values_list('id', 'name'))
+        with transaction.atomic():
+            for keeper_id, duplicate_ids in duplicates.items():
+                user_ids: List[int] = list(
+                    through.objects.filter(hobby_id__in=duplicate_ids).values_list('customuser_id', flat=True).distinct()
+                )
+                self.stdout.write(
+                    f'{names[keeper_id]}: merging {len(duplicate_ids)} duplicate(s), {len(user_ids)} user(s)'
+                )
+                if options['dry_run']:
+                    continue
+                # One bulk insert for the keeper, then the duplicates and their rows go
+                through.objects.bulk_create(
+                    [through(customuser_id=user_id, hobby_id=keeper_id) for user_id in user_ids],
+                    ignore_conflicts=True
+                )
+                through.objects.filter(hobby_id__in=duplicate_ids)._raw_delete(through.objects.db)
+                Hobby.objects.filter(id__in=duplicate_ids)._raw_delete(Hobby.objects.db)
+
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Removed {sum(len(ids) for ids in duplicates.values())} duplicate hobbies'
+            ))
@@ -0,0 +1,125 @@
+import random
+import time
+from bisect import bisect_left
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import List, Set, Tuple
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from api.models import CustomUser, FriendRequest, Hobby
+
+HobbyThrough = CustomUser.hobbies.through
+FriendsThrough = CustomUser.friends.through
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate synthetic users, hobbies, friendships and friend requests for benchmarking'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--users', type=int, default=1000, help='Number of users to add')
+        parser.add_argument('--hobbies', type=int, default=200, help='Size of the hobby catalog to top up to')
+        parser.add_argument('--avg-hobbies', type=float, default=4.0)
+        parser.add_argument('--avg-friends', type=float, default=10.0)
+        parser.add_argument('--avg-requests', type=float, default=3.0, help='Pending or rejected requests per user')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--prefix', default='synthetic', help='Username prefix for generated users')
+        parser.add_argument('--seed', type=int, default=None)
+
+    def handle(self, *args, **options) -> None:
+        rng: random.Random = random.Random(options['seed'])
+        batch_size: int = options['batch_size']
+        started: float = time.perf_counter()
+
+        hobby_ids: List[int] = self._hobby_catalog(options['hobbies'])
+        # Zipf-like popularity, so a few hobbies are very common and most are rare
+        hobby_weights: List[float] = list(accumulate(1 / (rank + 1) ** 1.1 for rank in range(len(hobby_ids))))
+
+        # Every user shares one precomputed hash instead of hashing per row
+        password: str = make_password('password')
+        today: date = date.today()
+        offset: int = CustomUser.objects.filter(username__startswith=options['prefix']).count()
+        user_ids: List[int] = list(CustomUser.objects.values_list('id', flat=True))
+
+        created: int = 0
+        while created < options['users']:
+            count: int = min(batch_size, options['users'] - created)
+            with transaction.atomic():
+                users: List[CustomUser] = []
+                for i in range(offset + created, offset + created + count):
+                    age_days: int = int(min(90.0, max(18.0, rng.gauss(29, 9))) * 365.25)
+                    username: str = f'{options["prefix"]}{i}'
+                    users.append(CustomUser(
+                        username=username,
+                        email=f'{username}@example.com',
+                        password=password,
+                        date_of_birth=today - timedelta(days=age_days),
+                    ))
+                new_ids: List[int] = [user.id for user in CustomUser.objects.bulk_create(users, batch_size=batch_size)]
+
+                hobby_rows: List[HobbyThrough] = []
+                for user_id in new_ids:
+                    wanted: int = min(40, max(1, round(rng.expovariate(1 / options['avg_hobbies']))))
+                    chosen: Set[int] = set()
+                    for _ in range(wanted):
+                        chosen.add(hobby_ids[bisect_left(hobby_weights, rng.random() * hobby_weights[-1])])
+                    hobby_rows.extend(HobbyThrough(customuser_id=user_id, hobby_id=hobby_id) for hobby_id in chosen)
+                HobbyThrough.objects.bulk_create(hobby_rows, batch_size=batch_size, ignore_conflicts=True)
+
+                user_ids.extend(new_ids)
+                friendships, requests = self._relationships(rng, new_ids, user_ids, options)
+                FriendsThrough.objects.bulk_create(
+                    [FriendsThrough(from_customuser_id=a, to_customuser_id=b) for a, b in friendships] +
+                    [FriendsThrough(from_customuser_id=b, to_customuser_id=a) for a, b in friendships],
+                    batch_size=batch_size, ignore_conflicts=True
+                )
+                for friend_request in requests:
+                    friend_request.set_pair()
+                FriendRequest.objects.bulk_create(requests, batch_size=batch_size, ignore_conflicts=True)
+
+            created += count
+            self.stdout.write(f'{created}/{options["users"]} users ({time.perf_counter() - started:.1f}s)')
+
+        # Rows were bulk inserted without signals, so recount the denormalized counters
+        call_command('reconcile_hobby_counts', decay=1, stdout=self.stdout)
+        call_command('reconcile_user_counts', stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {created} users in {time.perf_counter() - started:.1f}s. Running servers pick the '
+            f'data up when their search index is next rebuilt (HOBBY_INDEX_MAX_AGE).'
+        ))
+
+    def _hobby_catalog(self, size: int) -> List[int]:
+        existing: int = Hobby.objects.count()
+        if existing < size:
+            Hobby.objects.bulk_create(Hobby(name=f'hobby {i}') for i in range(existing, size))
+        return list(Hobby.objects.order_by('id').values_list('id', flat=True))
+
+    def _relationships(
+            self,
+            rng: random.Random,
+            new_ids: List[int],
+            user_ids: List[int],
+            options: dict
+    ) -> Tuple[List[Tuple[int, int]], List[FriendRequest]]:
+        """Friendships (with their accepted requests) and open or rejected requests for a batch."""
+        friendships: List[Tuple[int, int]] = []
+        requests: List[FriendRequest] = []
+        for user_id in new_ids:
+            for _ in range(round(rng.expovariate(1 / options['avg_friends']))):
+                friend_id: int = rng.choice(user_ids)
+                if friend_id != user_id:
+                    friendships.append((user_id, friend_id))
+                    requests.append(FriendRequest(
+                        sender_id=user_id, receiver_id=friend_id, status=FriendRequest.ACCEPTED
+                    ))
+            for _ in range(round(rng.expovariate(1 / options['avg_requests']))):
+                other_id: int = rng.choice(user_ids)
+                if other_id != user_id:
+                    status: str = FriendRequest.PENDING if rng.random() < 0.7 else FriendRequest.REJECTED
+                    # Incoming and outgoing requests in equal measure
+                    sender_id, receiver_id = (user_id, other_id) if rng.random() < 0.5 else (other_id, user_id)
+                    requests.append(FriendRequest(sender_id=sender_id, receiver_id=receiver_id, status=status))
+        return friendships, requests
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
+
+from api.models import CustomUser, FriendRequest, FriendRequestArchive
+
+
+class Command(BaseCommand):
+    help = (
+        'Remove resolved friend requests: accepted ones whose friendship exists (the friendship is the record), '
+        'and rejected ones not updated for --days days, optionally copying those to FriendRequestArchive. '
+        'Rows go in batches of --batch-size, each in its own short transaction. Meant to run periodically.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--days', type=int, default=settings.FRIEND_REQUEST_RETENTION_DAYS,
+                            help='Keep rejected requests updated within this many days')
+        parser.add_argument('--archive', action='store_true',
+                            help='Copy rejected requests to FriendRequestArchive before removing them')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be removed without writing')
+
+    def handle(self, *args, **options) -> None:
+        if options['days'] < 0 or options['batch_size'] < 1:
+            raise CommandError('--days must be at least 0 and --batch-size at least 1')
+
+        accepted: QuerySet[FriendRequest] = FriendRequest.objects.filter(status=FriendRequest.ACCEPTED).filter(
+            Exists(CustomUser.friends.through.objects.filter(
+                from_customuser_id=OuterRef('sender_id'), to_customuser_id=OuterRef('receiver_id')
+            ))
+        )
+        rejected: QuerySet[FriendRequest] = FriendRequest.objects.filter(
+            status=FriendRequest.REJECTED, updated_at__lt=timezone.now() - timedelta(days=options['days'])
+        )
+
+        if options['dry_run']:
+            self.stdout.write(
+                f'Would remove {accepted.count()} accepted and {rejected.count()} rejected friend requests'
+            )
+            return
+
+        removed_accepted: int = self._remove(accepted, options['batch_size'], archive=False)
+        removed_rejected: int = self._remove(rejected, options['batch_size'], archive=options['archive'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Removed {removed_accepted} accepted and {removed_rejected} rejected friend requests'
+            f'{" (rejected ones archived)" if options["archive"] else ""}'
+        ))
+
+    def _remove(self, queryset: QuerySet[FriendRequest], batch_size: int, archive: bool) -> int:
+        removed: int = 0
+        while True:
+            with transaction.atomic():
+                # Locked and re-checked against the filter, so a request reopened meanwhile is left alone
+                batch = list(queryset.select_for_update().order_by('id')[:batch_size])
+                if not batch:
+                    return removed
+                if archive:
+                    FriendRequestArchive.objects.bulk_create([
+                        FriendRequestArchive(
+                            sender_id=request.sender_id, receiver_id=request.receiver_id, status=request.status,
+                            created_at=request.created_at, updated_at=request.updated_at
+                        )
+                        for request in batch
+                    ])
+                FriendRequest.objects.filter(id__in=[request.id for request in batch]).delete()
+            removed += len(batch)
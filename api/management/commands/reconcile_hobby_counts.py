@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, PositiveIntegerField, Subquery, Value
+from django.db.models.functions import Cast, Coalesce
+
+from api.models import CustomUser, Hobby
+
+
+class Command(BaseCommand):
+    help = (
+        'Recount Hobby.user_count from the hobby membership table and decay Hobby.recent_adds. '
+        'Meant to run periodically (e.g. daily from cron): the counters are kept up to date by signals, '
+        'this repairs drift from bulk writes and ages the trending window.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--decay', type=float, default=0.5,
+                            help='Multiply recent_adds by this factor (1 keeps it, 0 resets it)')
+
+    def handle(self, *args, **options) -> None:
+        decay: float = options['decay']
+        if not 0 <= decay <= 1:
+            raise CommandError('--decay must be between 0 and 1')
+
+        actual = Coalesce(Subquery(
+            CustomUser.hobbies.through.objects.filter(hobby_id=OuterRef('pk'))
+            .values('hobby_id').annotate(count=Count('*')).values('count'),
+            output_field=IntegerField()
+        ), Value(0))
+
+        with transaction.atomic():
+            drifted = Hobby.objects.alias(actual=actual).exclude(user_count=F('actual'))
+            fixed: int = Hobby.objects.filter(id__in=list(drifted.values_list('id', flat=True))).update(
+                user_count=actual
+            )
+            if decay < 1:
+                Hobby.objects.filter(recent_adds__gt=0).update(
+                    recent_adds=Cast(F('recent_adds') * decay, output_field=PositiveIntegerField())
+                )
+
+        self.stdout.write(self.style.SUCCESS(f'Fixed user_count on {fixed} hobbies'))
@@ -0,0 +1,41 @@
+from typing import Dict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from api.models import CustomUser, FriendRequest
+
+
+def _count_of(queryset, column: str) -> Coalesce:
+    return Coalesce(Subquery(
+        queryset.filter(**{column: OuterRef('pk')}).values(column).annotate(count=Count('*')).values('count'),
+        output_field=IntegerField()
+    ), Value(0))
+
+
+class Command(BaseCommand):
+    help = (
+        'Recount CustomUser.friend_count and pending_in_count from the friendship and friend request tables. '
+        'The counters are kept up to date by signals; run this after bulk writes that bypass them, '
+        'or periodically to repair drift.'
+    )
+
+    def handle(self, *args, **options) -> None:
+        actual: Dict[str, Coalesce] = {
+            'friend_count': _count_of(CustomUser.friends.through.objects.all(), 'from_customuser_id'),
+            'pending_in_count': _count_of(FriendRequest.objects.filter(status=FriendRequest.PENDING), 'receiver_id'),
+        }
+
+        fixed: Dict[str, int] = {}
+        with transaction.atomic():
+            for field, count in actual.items():
+                drifted = CustomUser.objects.alias(actual=count).exclude(**{field: F('actual')})
+                fixed[field] = CustomUser.objects.filter(id__in=list(drifted.values_list('id', flat=True))).update(
+                    **{field: count}
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Fixed friend_count on {fixed["friend_count"]} users, pending_in_count on {fixed["pending_in_count"]}'
+        ))
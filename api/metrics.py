@@ -0,0 +1,177 @@
+"""
+Per-endpoint request metrics in Prometheus format.
+
+MetricsMiddleware records latency, DB query count and time, response size and
+status for every request, labelled by resolved URL name and method. It is a
+hybrid middleware, so under ASGI the async views are awaited without a thread
+hop; queries are attributed to the request through a context variable, which
+sync_to_async carries into the threads that run them. When the
+PROMETHEUS_MULTIPROC_DIR environment variable is set (required under gunicorn
+with several workers), prometheus_client keeps the samples in per-process files
+in that directory and metrics_view aggregates them across workers.
+
+With DATABASE_POOL enabled, the psycopg connection pool's statistics are
+exported as db_pool_* gauges (per process, labelled by pid, under multiprocess).
+"""
+
+import os
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Union
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connection, connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, REGISTRY, generate_latest, multiprocess
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+LABELS = ('view', 'method')
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Request latency', LABELS,
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter('http_requests', 'Requests by response status', LABELS + ('status',))
+DB_QUERIES = Histogram(
+    'http_db_queries', 'Database queries per request', LABELS,
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+)
+DB_TIME = Histogram(
+    'http_db_duration_seconds', 'Time spent in database queries per request', LABELS,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes', 'Response body size', LABELS,
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+
+
+class _QueryTimer:
+    """Counts a request's queries and their total time."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.duration: float = 0.0
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+        started: float = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+_current_timer: ContextVar[Optional[_QueryTimer]] = ContextVar('metrics_query_timer', default=None)
+
+
+def _time_queries(execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+    timer: Optional[_QueryTimer] = _current_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    return timer(execute, sql, params, many, context)
+
+
+def instrument(connection: BaseDatabaseWrapper, **kwargs) -> None:
+    """Install the query timing hook on a connection, once."""
+    if _time_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _time_queries)
+
+
+# New connections in any thread, and those the importing thread already has
+connection_created.connect(instrument)
+for _connection in connections.all(initialized_only=True):
+    instrument(_connection)
+
+
+class MetricsMiddleware:
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    def __init__(
+            self,
+            get_response: Callable[[HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]]
+    ) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        instrument(connection)
+        queries: _QueryTimer = _QueryTimer()
+        token: Token = _current_timer.set(queries)
+        started: float = time.perf_counter()
+        try:
+            response: HttpResponse = self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+        self._record(request, response, queries, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        queries: _QueryTimer = _QueryTimer()
+        token: Token = _current_timer.set(queries)
+        started: float = time.perf_counter()
+        try:
+            response: HttpResponse = await self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+        self._record(request, response, queries, time.perf_counter() - started)
+        return response
+
+    def _record(self, request: HttpRequest, response: HttpResponse, queries: _QueryTimer, duration: float) -> None:
+        match = getattr(request, 'resolver_match', None)
+        labels: Dict[str, str] = {
+            'view': match.view_name if match else '<unresolved>',
+            'method': request.method,
+        }
+        REQUEST_LATENCY.labels(**labels).observe(duration)
+        REQUESTS.labels(status=str(response.status_code), **labels).inc()
+        DB_QUERIES.labels(**labels).observe(queries.count)
+        DB_TIME.labels(**labels).observe(queries.duration)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(**labels).observe(len(response.content))
+
+
+class DatabasePoolCollector(Collector):
+    """Reports psycopg_pool's get_stats() for every database configured with a pool."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        families: Dict[str, GaugeMetricFamily] = {}
+        for alias in connections:
+            if not connections.settings[alias].get('OPTIONS', {}).get('pool'):
+                continue
+            pool = connections[alias].pool
+            for stat, value in pool.get_stats().items():
+                if stat not in families:
+                    families[stat] = GaugeMetricFamily(
+                        f'db_pool_{stat}', f'psycopg connection pool {stat}', labels=('alias', 'pid')
+                    )
+                families[stat].add_metric((alias, str(os.getpid())), value)
+        yield from families.values()
+
+
+POOL_COLLECTOR: DatabasePoolCollector = DatabasePoolCollector()
+REGISTRY.register(POOL_COLLECTOR)
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    token: Optional[str] = getattr(settings, 'METRICS_TOKEN', None)
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse(status=403)
+
+    registry: CollectorRegistry = REGISTRY
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        # Pool stats can't be aggregated from files; these are the serving worker's
+        registry.register(POOL_COLLECTOR)
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -1,19 +1,54 @@
-from typing import Optional, Dict, Any, Final
+from datetime import datetime
+from typing import Optional, Dict, Any, Final, Iterable, List, Set, Tuple
 
 from django.contrib.auth.base_user import AbstractBaseUser
-from django.db import models
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest, Lower
+from django.db.models.signals import m2m_changed, post_save
+from django.utils import timezone
 from django.contrib.auth.models import AbstractUser, UserManager
 
 
+class HobbyManager(models.Manager):
+    def by_name(self, name: str) -> models.QuerySet:
+        # Matches the Lower(name) unique index
+        return self.alias(lower_name=Lower('name')).filter(lower_name=name.lower())
+
+    def upsert(self, name: str) -> Tuple['Hobby', bool]:
+        """
+        Get the hobby with this name, ignoring case, or create it. The insert
+        is tried first and the unique Lower(name) index decides, so concurrent
+        requests for one name cannot create duplicates.
+        """
+        try:
+            with transaction.atomic(using=self.db):
+                return self.create(name=name), True
+        except IntegrityError:
+            return self.by_name(name).get(), False
+
+
 class Hobby(models.Model):
     name = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Maintained from m2m_changed in api.signals and by reconcile_hobby_counts
+    user_count = models.PositiveIntegerField(default=0, editable=False)
+    # Adds since the last decay by reconcile_hobby_counts, used for trending
+    recent_adds = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = HobbyManager()
 
     def __str__(self) -> str:
         return self.name
 
     class Meta:
         verbose_name_plural = "hobbies"
+        constraints = [
+            models.UniqueConstraint(Lower('name'), name='hobby_name_ci_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['-recent_adds', '-user_count'], name='hobby_trending_idx'),
+        ]
 
 
 class CustomUserManager(UserManager):
@@ -52,15 +87,164 @@ class CustomUser(AbstractUser):
     date_of_birth = models.DateField(null=True, blank=True)
     hobbies = models.ManyToManyField(Hobby, related_name='users', blank=True)
     friends = models.ManyToManyField('self', blank=True, symmetrical=True)
+    # Kept by signal handlers in api.signals; reconcile_user_counts repairs drift
+    friend_count = models.PositiveIntegerField(default=0, editable=False)
+    pending_in_count = models.PositiveIntegerField(default=0, editable=False)
 
     objects = CustomUserManager()
 
     USERNAME_FIELD = 'username'
     REQUIRED_FIELDS = ['email']  # Add email as required for superusers
 
+    COUNTER_FIELDS: Final[frozenset] = frozenset({'friend_count', 'pending_in_count'})
+
     def __str__(self) -> str:
         return self.username
 
+    def save(self, *args, **kwargs) -> None:
+        # The counters only move through F() updates, so a full save of an
+        # instance loaded earlier must not write its stale values back
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def update_hobbies(
+            self,
+            add: Iterable[int] = (),
+            remove: Iterable[int] = (),
+            replace: Optional[Iterable[int]] = None
+    ) -> Tuple[Set[int], Set[int], Set[int]]:
+        """
+        Apply a hobby diff by ID in one transaction: either add/remove lists or
+        a full replacement set. Each direction is one bulk write on the through
+        table and one m2m_changed pre/post pair carrying the whole pk_set.
+        Returns the IDs added, the IDs removed and the resulting hobby IDs.
+        """
+        through = CustomUser.hobbies.through
+        db: str = router.db_for_write(through, instance=self)
+        with transaction.atomic(using=db):
+            current: Set[int] = set(
+                through.objects.using(db).filter(customuser_id=self.id).values_list('hobby_id', flat=True)
+            )
+            if replace is not None:
+                add, remove = set(replace), current - set(replace)
+            to_add: Set[int] = set(add) - current
+            to_remove: Set[int] = set(remove) & current
+
+            if to_remove:
+                m2m_changed.send(sender=through, action='pre_remove', instance=self, reverse=False,
+                                 model=Hobby, pk_set=to_remove, using=db)
+                through.objects.using(db).filter(customuser_id=self.id, hobby_id__in=to_remove).delete()
+                m2m_changed.send(sender=through, action='post_remove', instance=self, reverse=False,
+                                 model=Hobby, pk_set=to_remove, using=db)
+            if to_add:
+                m2m_changed.send(sender=through, action='pre_add', instance=self, reverse=False,
+                                 model=Hobby, pk_set=to_add, using=db)
+                through.objects.using(db).bulk_create(
+                    [through(customuser_id=self.id, hobby_id=hobby_id) for hobby_id in to_add],
+                    ignore_conflicts=True
+                )
+                m2m_changed.send(sender=through, action='post_add', instance=self, reverse=False,
+                                 model=Hobby, pk_set=to_add, using=db)
+
+        if to_add or to_remove:
+            getattr(self, '_prefetched_objects_cache', {}).pop('hobbies', None)
+        return to_add, to_remove, (current - to_remove) | to_add
+
+
+class FriendRequestManager(models.Manager):
+    def between(self, user_id: int, other_id: int) -> models.QuerySet:
+        """The request between two users, whichever of them sent it."""
+        low, high = sorted((user_id, other_id))
+        return self.filter(user_low_id=low, user_high_id=high)
+
+    def respond(self, receiver: 'CustomUser', status: str, ids: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Accept or reject the receiver's pending requests, all of them or those
+        in ids, in one transaction: one query to lock and check the requests,
+        one UPDATE for their status, one for the receiver's pending_in_count
+        and, when accepting, one bulk insert of both directions of every
+        friendship. post_save and m2m_changed are sent as if each request had
+        been saved and the friends added. Returns the IDs of the requests changed.
+        """
+        db: str = router.db_for_write(self.model)
+        with transaction.atomic(using=db):
+            pending = self.using(db).filter(receiver=receiver, status=FriendRequest.PENDING)
+            if ids is not None:
+                pending = pending.filter(id__in=list(ids))
+            rows: List[Tuple[int, int]] = list(pending.select_for_update().values_list('id', 'sender_id'))
+            if not rows:
+                return []
+
+            updated_at = timezone.now()
+            self.using(db).filter(id__in=[request_id for request_id, _ in rows]).update(
+                status=status, updated_at=updated_at
+            )
+            self._record_responses(db, receiver, status, rows, updated_at)
+
+        return [request_id for request_id, _ in rows]
+
+    def respond_to(self, friend_request: 'FriendRequest', status: str) -> bool:
+        """
+        Accept or reject one request with a conditional UPDATE ... WHERE
+        status = 'pending', in one transaction with the counter update and the
+        idempotent friendship insert. Of concurrent or retried attempts only the
+        one whose UPDATE changed the row goes on; the others return False.
+        """
+        db: str = router.db_for_write(self.model, instance=friend_request)
+        with transaction.atomic(using=db):
+            updated_at = timezone.now()
+            changed: int = self.using(db).filter(id=friend_request.id, status=FriendRequest.PENDING).update(
+                status=status, updated_at=updated_at
+            )
+            if not changed:
+                return False
+            self._record_responses(
+                db, friend_request.receiver, status, [(friend_request.id, friend_request.sender_id)], updated_at
+            )
+
+        friend_request.status = friend_request.saved_status = status
+        friend_request.updated_at = updated_at
+        return True
+
+    def _record_responses(
+            self,
+            db: str,
+            receiver: 'CustomUser',
+            status: str,
+            rows: List[Tuple[int, int]],
+            updated_at: datetime
+    ) -> None:
+        """The writes and signals that follow the status UPDATE of rows, (request ID, sender ID) pairs."""
+        # One counter update for the batch, so the post_save below reports no pending transition
+        CustomUser.objects.using(db).filter(id=receiver.id).update(
+            pending_in_count=Greatest(F('pending_in_count') - len(rows), 0)
+        )
+        for request_id, sender_id in rows:
+            instance: FriendRequest = self.model(
+                id=request_id, sender_id=sender_id, receiver_id=receiver.id, status=status, updated_at=updated_at
+            )
+            instance.saved_status = status
+            post_save.send(sender=self.model, instance=instance, created=False,
+                           update_fields=frozenset({'status', 'updated_at'}), raw=False, using=db)
+
+        if status == FriendRequest.ACCEPTED:
+            through = CustomUser.friends.through
+            sender_ids: Set[int] = {sender_id for _, sender_id in rows}
+            m2m_changed.send(sender=through, action='pre_add', instance=receiver, reverse=False,
+                             model=CustomUser, pk_set=sender_ids, using=db)
+            # ignore_conflicts makes the insert a no-op for friendships that already exist
+            through.objects.using(db).bulk_create(
+                [through(from_customuser_id=receiver.id, to_customuser_id=sender_id) for sender_id in sender_ids] +
+                [through(from_customuser_id=sender_id, to_customuser_id=receiver.id) for sender_id in sender_ids],
+                ignore_conflicts=True
+            )
+            m2m_changed.send(sender=through, action='post_add', instance=receiver, reverse=False,
+                             model=CustomUser, pk_set=sender_ids, using=db)
+
 
 class FriendRequest(models.Model):
     PENDING: Final[str] = 'pending'
@@ -78,24 +262,65 @@ class FriendRequest(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # The two user IDs in canonical order, so either direction is one equality
+    # lookup and only one request can exist per pair. Null only on rows that
+    # predate the columns, until backfill_friend_request_pairs has run.
+    user_low = models.ForeignKey('CustomUser', related_name='+', on_delete=models.CASCADE, null=True, editable=False)
+    user_high = models.ForeignKey('CustomUser', related_name='+', on_delete=models.CASCADE, null=True, editable=False)
+
+    objects = FriendRequestManager()
+
+    # Status as last loaded or saved, so signal handlers can tell which transition a save made
+    saved_status: Optional[str] = None
 
     class Meta:
         unique_together = ('sender', 'receiver')
+        constraints = [
+            models.UniqueConstraint(fields=['user_low', 'user_high'], name='friendrequest_pair_unique'),
+        ]
+        indexes = [
+            # Every status-filtered read is for pending requests, so these index
+            # only those rows and stay small as resolved requests accumulate.
+            # Pending requests for a receiver, newest first (the inbox pages)
+            models.Index(fields=['receiver', '-created_at', '-id'], name='friendrequest_pending_in_idx',
+                         condition=models.Q(status='pending')),
+            # Pending requests a user has sent
+            models.Index(fields=['sender'], name='friendrequest_pending_out_idx',
+                         condition=models.Q(status='pending')),
+        ]
 
     def __str__(self) -> str:
         return f"{self.sender} -> {self.receiver} ({self.status})"
 
+    def set_pair(self) -> None:
+        self.user_low_id, self.user_high_id = sorted((self.sender_id, self.receiver_id))
+
+    @classmethod
+    def from_db(cls, db, field_names, values) -> 'FriendRequest':
+        instance: FriendRequest = super().from_db(db, field_names, values)
+        instance.saved_status = instance.__dict__.get('status')
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        self.set_pair()
+        super().save(*args, **kwargs)
+        self.saved_status = self.status
+
     def accept(self) -> bool:
-        if self.status == self.PENDING:
-            self.status = self.ACCEPTED
-            self.save()
-            self.sender.friends.add(self.receiver)
-            return True
-        return False
+        return FriendRequest.objects.respond_to(self, self.ACCEPTED)
 
     def reject(self) -> bool:
-        if self.status == self.PENDING:
-            self.status = self.REJECTED
-            self.save()
-            return True
-        return False
+        return FriendRequest.objects.respond_to(self, self.REJECTED)
+
+
+class FriendRequestArchive(models.Model):
+    """Resolved requests moved out of FriendRequest by prune_friend_requests --archive."""
+    sender = models.ForeignKey('CustomUser', related_name='+', on_delete=models.CASCADE)
+    receiver = models.ForeignKey('CustomUser', related_name='+', on_delete=models.CASCADE)
+    status = models.CharField(max_length=10, choices=FriendRequest.STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.sender} -> {self.receiver} ({self.status}, archived)"
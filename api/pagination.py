@@ -0,0 +1,43 @@
+from typing import Optional, Tuple
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.request import Request
+
+
+class CappedCursorPagination(CursorPagination):
+    """
+    Cursor pages of page_size rows by default. ?unpaginated=true asks for a plain
+    array instead, the shape clients written before pagination (including the
+    built SPA bundle) read; it holds at most max_page_size rows, in page order.
+    """
+    unpaginated_query_param: str = 'unpaginated'
+
+    def paginate_queryset(self, queryset, request: Request, view=None) -> Optional[list]:
+        if request.query_params.get(self.unpaginated_query_param) == 'true':
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def unpaginated_list(self, queryset, request: Request, view=None) -> list:
+        """The rows returned when paginate_queryset declines to paginate."""
+        ordering: Tuple[str, ...] = self.get_ordering(request, queryset, view)
+        return list(queryset.order_by(*ordering)[:self.max_page_size])
+
+
+class FriendRequestPagination(CappedCursorPagination):
+    """Newest friend requests first, in bounded pages addressed by an opaque cursor."""
+    ordering: Tuple[str, ...] = ('-created_at', '-id')
+    page_size: int = 50
+    page_size_query_param: str = 'page_size'
+    max_page_size: int = 200
+
+
+class FriendPagination(CappedCursorPagination):
+    """Friends by username (?ordering=-username for descending), in bounded cursor pages."""
+    ordering: str = 'username'
+    page_size: int = 50
+    page_size_query_param: str = 'page_size'
+    max_page_size: int = 200
+
+    def get_ordering(self, request: Request, queryset, view) -> Tuple[str, ...]:
+        ordering: str = request.query_params.get('ordering', self.ordering)
+        return (ordering if ordering in ('username', '-username') else self.ordering,)
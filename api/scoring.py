@@ -0,0 +1,190 @@
+import threading
+from datetime import date
+from typing import Dict, Final, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from .search_index import hobby_index
+
+COUNT: Final[str] = 'count'
+JACCARD: Final[str] = 'jaccard'
+COSINE: Final[str] = 'cosine'
+IDF: Final[str] = 'idf'
+
+SCORES: Final[Tuple[str, ...]] = (COUNT, JACCARD, COSINE, IDF)
+
+
+class SimilarityEngine:
+    """
+    Scores every user against the requesting user in one vectorized pass.
+
+    Users' hobbies are held in a sparse user x hobby CSR matrix built from the
+    in-process hobby index, alongside an array of birth dates used for the age
+    filters. When the index has changed, only the rows of the changed users are
+    replaced; the matrix is rebuilt when the index is, or when a user is removed.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self._revision: Optional[int] = None
+        self._user_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self._rows: Dict[int, int] = {}
+        self._matrix: sparse.csr_matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self._sizes: np.ndarray = np.empty(0, dtype=np.float32)
+        self._idf: np.ndarray = np.empty(0, dtype=np.float32)
+        self._birth_dates: np.ndarray = np.empty(0, dtype='datetime64[D]')
+
+    @staticmethod
+    def _positions(bits: int) -> List[int]:
+        positions: List[int] = []
+        while bits:
+            lowest: int = bits & -bits
+            positions.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return positions
+
+    def _build(self) -> None:
+        hobby_index.ensure_loaded()
+        if hobby_index.generation == self._generation and hobby_index.revision == self._revision:
+            return
+
+        if self._revision is not None:
+            changes = hobby_index.changes_since(self._generation, self._revision)
+            # Removed users would leave holes in the matrix, so those rebuild it
+            if changes is not None and None not in changes[0].values():
+                self._patch(*changes)
+                return
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        generation: int = hobby_index.generation
+        user_bits, birth_dates, n_hobbies, revision = hobby_index.snapshot()
+
+        user_ids: np.ndarray = np.fromiter(sorted(user_bits), dtype=np.int64, count=len(user_bits))
+        indptr: List[int] = [0]
+        indices: List[int] = []
+        for user_id in user_ids.tolist():
+            indices.extend(self._positions(user_bits[user_id]))
+            indptr.append(len(indices))
+
+        matrix: sparse.csr_matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(user_ids), n_hobbies)
+        )
+        self._user_ids = user_ids
+        self._rows = {user_id: row for row, user_id in enumerate(user_ids.tolist())}
+        self._birth_dates = np.array(
+            [birth_dates.get(user_id) or 'NaT' for user_id in user_ids.tolist()],
+            dtype='datetime64[D]'
+        )
+        self._set_matrix(matrix)
+        self._generation = generation
+        self._revision = revision
+
+    def _patch(
+            self,
+            user_bits: Dict[int, Optional[int]],
+            birth_dates: Dict[int, Optional[date]],
+            n_hobbies: int,
+            revision: int
+    ) -> None:
+        """Replace the rows of the changed users, appending rows for new users."""
+        new_ids: List[int] = [user_id for user_id in user_bits if user_id not in self._rows]
+        for user_id in new_ids:
+            self._rows[user_id] = len(self._rows)
+        n_rows: int = len(self._rows)
+        self._user_ids = np.concatenate([self._user_ids, np.array(new_ids, dtype=np.int64)])
+
+        changed_rows: List[int] = [self._rows[user_id] for user_id in user_bits]
+        old: sparse.csr_matrix = self._matrix
+        grown: sparse.csr_matrix = sparse.csr_matrix(
+            (old.data, old.indices, np.concatenate([old.indptr, np.full(len(new_ids), old.indptr[-1])])),
+            shape=(n_rows, n_hobbies)
+        )
+        keep: np.ndarray = np.ones(n_rows, dtype=np.float32)
+        keep[changed_rows] = 0
+
+        rows: List[int] = []
+        indices: List[int] = []
+        for row, bits in zip(changed_rows, user_bits.values()):
+            positions: List[int] = self._positions(bits)
+            rows.extend([row] * len(positions))
+            indices.extend(positions)
+        replacement: sparse.csr_matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), (np.array(rows, dtype=np.int64), np.array(indices, dtype=np.int64))),
+            shape=(n_rows, n_hobbies)
+        )
+        matrix: sparse.csr_matrix = (sparse.diags(keep) @ grown + replacement).tocsr()
+        matrix.eliminate_zeros()
+
+        self._birth_dates = np.concatenate(
+            [self._birth_dates, np.full(len(new_ids), 'NaT', dtype='datetime64[D]')]
+        )
+        self._birth_dates[changed_rows] = np.array(
+            [birth_dates[user_id] or 'NaT' for user_id in user_bits], dtype='datetime64[D]'
+        )
+        self._set_matrix(matrix)
+        self._revision = revision
+
+    def _set_matrix(self, matrix: sparse.csr_matrix) -> None:
+        document_frequency: np.ndarray = np.asarray(matrix.sum(axis=0), dtype=np.float32).ravel()
+        self._matrix = matrix
+        self._sizes = np.diff(matrix.indptr).astype(np.float32)
+        # Smoothed inverse document frequency, so rare hobbies count for more
+        self._idf = np.log((1 + len(self._user_ids)) / (1 + document_frequency)) + 1
+
+    def rank(
+            self,
+            user_id: int,
+            score: str = COUNT,
+            min_birth_date: Optional[date] = None,
+            max_birth_date: Optional[date] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Return (user_id, score) pairs ordered by score descending, then by id.
+        Filtering follows HobbyIndex.rank.
+        """
+        if score not in SCORES:
+            raise ValueError(f'Unknown score: {score}')
+
+        with self._lock:
+            self._build()
+            row: Optional[int] = self._rows.get(user_id)
+            own: np.ndarray = np.zeros(self._matrix.shape[1], dtype=np.float32)
+            if row is not None:
+                own[self._matrix.indices[self._matrix.indptr[row]:self._matrix.indptr[row + 1]]] = 1
+
+            common: np.ndarray = self._matrix @ own
+            mask: np.ndarray = common > 0 if own.any() else np.ones(len(self._user_ids), dtype=bool)
+            if row is not None:
+                mask[row] = False
+            if min_birth_date or max_birth_date:
+                mask &= ~np.isnat(self._birth_dates)
+                if min_birth_date:
+                    mask &= self._birth_dates > np.datetime64(min_birth_date, 'D')
+                if max_birth_date:
+                    mask &= self._birth_dates <= np.datetime64(max_birth_date, 'D')
+
+            scores: np.ndarray
+            if score == COUNT:
+                scores = common
+            elif score == JACCARD:
+                union: np.ndarray = self._sizes + own.sum() - common
+                scores = np.divide(common, union, out=np.zeros_like(common), where=union > 0)
+            elif score == COSINE:
+                norms: np.ndarray = np.sqrt(self._sizes * own.sum())
+                scores = np.divide(common, norms, out=np.zeros_like(common), where=norms > 0)
+            else:
+                scores = self._matrix @ (own * self._idf)
+
+            selected: np.ndarray = np.flatnonzero(mask)
+            user_ids: np.ndarray = self._user_ids[selected]
+            selected_scores: np.ndarray = scores[selected]
+
+        order: np.ndarray = np.lexsort((user_ids, -selected_scores))
+        return list(zip(user_ids[order].tolist(), selected_scores[order].tolist()))
+
+
+similarity_engine: SimilarityEngine = SimilarityEngine()
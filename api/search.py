@@ -0,0 +1,175 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import Any, Dict, Final, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from django.db import models
+
+from .models import CustomUser, FriendRequest
+from .scoring import COUNT, SCORES
+from .search_index import hobby_index
+
+PER_PAGE: Final[int] = 10  # Fixed page size
+
+
+class SearchParams(NamedTuple):
+    score: str
+    approximate: bool
+    min_birth_date: Optional[date]
+    max_birth_date: Optional[date]
+
+
+def parse_search_params(query_params: Mapping[str, str]) -> SearchParams:
+    """Validate search_users query parameters, raising ValueError with a message for the client."""
+    score: str = query_params.get('score', COUNT)
+    if score not in SCORES:
+        raise ValueError(f'Invalid score, expected one of: {", ".join(SCORES)}')
+
+    # Approximate mode ranks MinHash/LSH candidates instead of every user
+    approximate: bool = query_params.get('mode') == 'approximate'
+    if approximate and score != COUNT:
+        raise ValueError('Approximate mode only supports the count score')
+
+    # Convert the age filters into date of birth bounds
+    min_age: Optional[str] = query_params.get('min_age')
+    max_age: Optional[str] = query_params.get('max_age')
+    min_date: Optional[date] = None
+    max_date: Optional[date] = None
+    today: date = date.today()
+
+    if min_age:
+        try:
+            max_date = today - timedelta(days=int(min_age) * 365)
+        except ValueError:
+            raise ValueError('Invalid minimum age value')
+
+    if max_age:
+        try:
+            min_date = today - timedelta(days=(int(max_age) + 1) * 365)
+        except ValueError:
+            raise ValueError('Invalid maximum age value')
+
+    return SearchParams(score, approximate, min_date, max_date)
+
+
+def encode_cursor(user_id: int, score: float) -> str:
+    return urlsafe_b64encode(f'{score!r}:{user_id}'.encode()).decode()
+
+
+def cursor_position(ranked: List[Tuple[int, float]], cursor: str) -> int:
+    """Index of the first ranked entry after the cursor, or 0 for an empty cursor."""
+    if not cursor:
+        return 0
+    try:
+        score, user_id = urlsafe_b64decode(cursor.encode()).decode().split(':')
+        key: Tuple[float, int] = (-float(score), int(user_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+    return bisect_right(ranked, key, key=lambda item: (-item[1], item[0]))
+
+
+def paginate_ranked(
+        ranked: List[Tuple[int, float]],
+        query_params: Mapping[str, str]
+) -> Tuple[List[Tuple[int, float]], Dict[str, Any]]:
+    """
+    Slice one page out of a ranked list. Returns the page and the pagination
+    fields of the response.
+    """
+    cursor: Optional[str] = query_params.get('cursor')
+    pagination: Dict[str, Any]
+    if cursor is not None:
+        # Keyset pagination: resume right after the last (score, id) key seen
+        start: int = cursor_position(ranked, cursor)
+        page_ranked: List[Tuple[int, float]] = ranked[start:start + PER_PAGE]
+        has_next: bool = start + PER_PAGE < len(ranked)
+        pagination = {'next': encode_cursor(*page_ranked[-1]) if has_next else None}
+        if query_params.get('include_total') == 'true':
+            pagination['total_users'] = len(ranked)
+        return page_ranked, pagination
+
+    # Page number pagination kept for older clients
+    try:
+        page: int = int(query_params.get('page', 1))
+    except ValueError:
+        raise ValueError('Invalid page value')
+    total_users: int = len(ranked)
+    total_pages: int = (total_users + PER_PAGE - 1) // PER_PAGE
+
+    # Validate page number
+    if page < 1:
+        page = 1
+    elif page > total_pages and total_pages > 0:
+        page = total_pages
+
+    start = (page - 1) * PER_PAGE
+    pagination = {
+        'total_users': total_users,
+        'total_pages': total_pages,
+        'current_page': page
+    }
+    return ranked[start:start + PER_PAGE], pagination
+
+
+def page_users(
+        page_ranked: List[Tuple[int, float]],
+        users_by_id: Mapping[int, CustomUser],
+        user_id: int,
+        score: str
+) -> List[CustomUser]:
+    """Put loaded users back in ranked order and attach their scores."""
+    users_page: List[CustomUser] = []
+    for other_id, user_score in page_ranked:
+        if other_id in users_by_id:
+            user_obj: CustomUser = users_by_id[other_id]
+            user_obj.score = user_score
+            user_obj.common_hobbies_count = (
+                int(user_score) if score == COUNT
+                else hobby_index.common_count(user_id, other_id)
+            )
+            users_page.append(user_obj)
+    return users_page
+
+
+def pending_between(user_id: int, page_ids: List[int]) -> models.QuerySet[FriendRequest]:
+    """Pending requests in either direction between a user and a page of users."""
+    # Probes of the canonical (user_low, user_high) pair, with the user on either side
+    return FriendRequest.objects.filter(
+        (models.Q(user_low_id=user_id) & models.Q(user_high_id__in=[i for i in page_ids if i > user_id])) |
+        (models.Q(user_high_id=user_id) & models.Q(user_low_id__in=[i for i in page_ids if i < user_id])),
+        status=FriendRequest.PENDING
+    )
+
+
+def other_party_ids(user_id: int, pairs: Iterable[Tuple[int, int]]) -> Set[int]:
+    return {receiver_id if sender_id == user_id else sender_id for sender_id, receiver_id in pairs}
+
+
+def annotate_results(
+        data: List[Dict[str, Any]],
+        users_page: List[CustomUser],
+        friend_ids: Set[int],
+        pending_ids: Set[int]
+) -> None:
+    """Add the common hobbies count, age, and friendship status to each user."""
+    today: date = date.today()
+    for user_data, user_obj in zip(data, users_page):
+        user_data['common_hobbies_count'] = user_obj.common_hobbies_count
+        user_data['score'] = round(user_obj.score, 4)
+
+        # Add age
+        if user_obj.date_of_birth:
+            age: int = today.year - user_obj.date_of_birth.year
+            if today.month < user_obj.date_of_birth.month or (
+                    today.month == user_obj.date_of_birth.month and
+                    today.day < user_obj.date_of_birth.day
+            ):
+                age -= 1
+            user_data['age'] = age
+
+        # Check if users are friends
+        user_data['is_friend'] = user_obj.id in friend_ids
+
+        # Check for pending friend requests
+        user_data['has_pending_request'] = user_obj.id in pending_ids
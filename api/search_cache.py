@@ -0,0 +1,115 @@
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from django.conf import settings
+
+from .lsh import lsh_index
+from .scoring import COUNT, similarity_engine
+from .search_index import hobby_index
+
+
+class SearchCache:
+    """
+    Bounded LRU cache of ranked search_users results.
+
+    Entries are keyed by the requesting user's hobby set, the date of birth
+    bounds from the age filters and the current version counters. Signal
+    handlers bump the counters when hobbies or birth dates change, which makes
+    older entries unreachable until they are evicted. Friend and request status
+    is annotated per page, after the ranking, so it is not part of the key.
+
+    The entries and the counters live in this process. A change only bumps the
+    counters of the worker that made it; other workers keep serving their
+    entries until they are evicted.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, List[Tuple[int, float]]] = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        return getattr(settings, 'SEARCH_CACHE_SIZE', 1024)
+
+    def bump(self, name: str) -> None:
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+            }
+
+    def _key(
+            self,
+            user_id: int,
+            score: str,
+            approximate: bool,
+            min_birth_date: Optional[date],
+            max_birth_date: Optional[date]
+    ) -> Hashable:
+        return (
+            user_id,
+            score,
+            approximate,
+            tuple(sorted(hobby_index.hobby_ids(user_id))),
+            min_birth_date,
+            max_birth_date,
+            hobby_index.generation,
+            self._versions.get('hobbies', 0),
+            self._versions.get('birth_dates', 0),
+        )
+
+    def ranked(
+            self,
+            user_id: int,
+            min_birth_date: Optional[date] = None,
+            max_birth_date: Optional[date] = None,
+            score: str = COUNT,
+            approximate: bool = False
+    ) -> List[Tuple[int, float]]:
+        """
+        Cached version of HobbyIndex.rank, or of SimilarityEngine.rank for
+        scores other than the plain common hobby count. In approximate mode
+        only the MinHash/LSH candidates are ranked, by common hobby count.
+        """
+        hobby_index.ensure_loaded()
+        with self._lock:
+            key: Hashable = self._key(user_id, score, approximate, min_birth_date, max_birth_date)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        ranked: List[Tuple[int, float]]
+        if approximate:
+            ranked = hobby_index.rank(user_id, min_birth_date, max_birth_date, lsh_index.candidates(user_id))
+        elif score == COUNT:
+            ranked = hobby_index.rank(user_id, min_birth_date, max_birth_date)
+        else:
+            ranked = similarity_engine.rank(user_id, score, min_birth_date, max_birth_date)
+
+        with self._lock:
+            self._entries[key] = ranked
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return ranked
+
+
+search_cache: SearchCache = SearchCache()
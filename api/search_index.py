@@ -0,0 +1,245 @@
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+
+from .models import CustomUser
+
+
+class HobbyIndex:
+    """
+    In-process index of users' hobbies used to rank search results.
+
+    Each user maps to a bitset (a Python int) with one bit per hobby, and each
+    hobby keeps a posting list of the users who have it. Hobby IDs are mapped to
+    dense bit positions so the bitsets stay small. The index is kept up to date
+    by the signal handlers in api.signals and is rebuilt from the database when
+    it is older than HOBBY_INDEX_MAX_AGE seconds, so changes made by other worker
+    processes are eventually picked up.
+
+    The revision is bumped whenever a user's hobbies or birth date actually
+    change, and the users changed at each revision are remembered until the next
+    rebuild, so bulk consumers can patch their copies instead of starting over.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.RLock = threading.RLock()
+        self._loaded: bool = False
+        self._loaded_at: float = 0.0
+        self.generation: int = 0
+        self.revision: int = 0
+        self._user_bits: Dict[int, int] = {}
+        self._birth_dates: Dict[int, Optional[date]] = {}
+        self._postings: Dict[int, Set[int]] = {}
+        self._positions: Dict[int, int] = {}
+        self._changed: Dict[int, int] = {}  # User ID to the revision of its last change, oldest first
+
+    @property
+    def max_age(self) -> float:
+        return getattr(settings, 'HOBBY_INDEX_MAX_AGE', 300)
+
+    def invalidate(self) -> None:
+        """Drop the index so it is rebuilt on next use."""
+        with self._lock:
+            self._loaded = False
+
+    def rebuild(self) -> None:
+        user_bits: Dict[int, int] = {}
+        birth_dates: Dict[int, Optional[date]] = {}
+        postings: Dict[int, Set[int]] = {}
+        positions: Dict[int, int] = {}
+
+        for user_id, date_of_birth in CustomUser.objects.values_list('id', 'date_of_birth').iterator():
+            user_bits[user_id] = 0
+            birth_dates[user_id] = date_of_birth
+
+        through = CustomUser.hobbies.through.objects.values_list('customuser_id', 'hobby_id')
+        for user_id, hobby_id in through.iterator():
+            position: int = positions.setdefault(hobby_id, len(positions))
+            user_bits[user_id] = user_bits.get(user_id, 0) | (1 << position)
+            postings.setdefault(hobby_id, set()).add(user_id)
+
+        with self._lock:
+            self._user_bits = user_bits
+            self._birth_dates = birth_dates
+            self._postings = postings
+            self._positions = positions
+            self._changed = {}
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+            self.generation += 1
+            self.revision += 1
+
+    def ensure_loaded(self) -> None:
+        with self._lock:
+            fresh: bool = self._loaded and time.monotonic() - self._loaded_at < self.max_age
+        if not fresh:
+            self.rebuild()
+
+    def _bit(self, hobby_id: int) -> int:
+        return 1 << self._positions.setdefault(hobby_id, len(self._positions))
+
+    def _touch(self, user_id: int) -> None:
+        self.revision += 1
+        self._changed.pop(user_id, None)
+        self._changed[user_id] = self.revision
+
+    # Incremental updates, called from signal handlers
+
+    def set_user(self, user_id: int, date_of_birth: Optional[date]) -> None:
+        with self._lock:
+            if not self._loaded:
+                return
+            # Most saves (last_login, username, ...) change nothing indexed
+            if user_id in self._user_bits and self._birth_dates.get(user_id) == date_of_birth:
+                return
+            self._touch(user_id)
+            self._user_bits.setdefault(user_id, 0)
+            self._birth_dates[user_id] = date_of_birth
+
+    def remove_user(self, user_id: int) -> None:
+        with self._lock:
+            if not self._loaded:
+                return
+            self.remove_hobbies(user_id, self.hobby_ids(user_id))
+            if user_id in self._user_bits:
+                self._touch(user_id)
+            self._user_bits.pop(user_id, None)
+            self._birth_dates.pop(user_id, None)
+
+    def add_hobbies(self, user_id: int, hobby_ids: Iterable[int]) -> None:
+        with self._lock:
+            if not self._loaded:
+                return
+            bits: int = self._user_bits.get(user_id, 0)
+            for hobby_id in hobby_ids:
+                bits |= self._bit(hobby_id)
+                self._postings.setdefault(hobby_id, set()).add(user_id)
+            if self._user_bits.get(user_id) != bits:
+                self._touch(user_id)
+            self._user_bits[user_id] = bits
+
+    def remove_hobbies(self, user_id: int, hobby_ids: Iterable[int]) -> None:
+        with self._lock:
+            if not self._loaded:
+                return
+            bits: int = self._user_bits.get(user_id, 0)
+            for hobby_id in hobby_ids:
+                if hobby_id in self._positions:
+                    bits &= ~(1 << self._positions[hobby_id])
+                self._postings.get(hobby_id, set()).discard(user_id)
+            if user_id in self._user_bits and self._user_bits[user_id] != bits:
+                self._touch(user_id)
+                self._user_bits[user_id] = bits
+
+    def remove_hobby(self, hobby_id: int) -> None:
+        """Remove a hobby from every user that has it."""
+        with self._lock:
+            if not self._loaded:
+                return
+            for user_id in list(self._postings.get(hobby_id, ())):
+                self.remove_hobbies(user_id, [hobby_id])
+            self._postings.pop(hobby_id, None)
+
+    # Queries
+
+    def snapshot(self) -> Tuple[Dict[int, int], Dict[int, Optional[date]], int, int]:
+        """Copy of (user bitsets, birth dates, bit count, revision) for bulk consumers."""
+        self.ensure_loaded()
+        with self._lock:
+            return dict(self._user_bits), dict(self._birth_dates), len(self._positions), self.revision
+
+    def changes_since(
+            self, generation: int, revision: int
+    ) -> Optional[Tuple[Dict[int, Optional[int]], Dict[int, Optional[date]], int, int]]:
+        """
+        Like snapshot, but only for the users changed after revision, with None
+        bitsets for removed users. None if the index was rebuilt since, as its
+        generation then no longer matches.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return None
+            user_bits: Dict[int, Optional[int]] = {}
+            birth_dates: Dict[int, Optional[date]] = {}
+            for user_id in reversed(self._changed):
+                if self._changed[user_id] <= revision:
+                    break
+                user_bits[user_id] = self._user_bits.get(user_id)
+                birth_dates[user_id] = self._birth_dates.get(user_id)
+            return user_bits, birth_dates, len(self._positions), self.revision
+
+    def common_count(self, user_id: int, other_id: int) -> int:
+        with self._lock:
+            return (self._user_bits.get(user_id, 0) & self._user_bits.get(other_id, 0)).bit_count()
+
+    def user_hobby_ids(self) -> Dict[int, List[int]]:
+        """Hobby IDs of every indexed user, including users with no hobbies."""
+        self.ensure_loaded()
+        with self._lock:
+            user_hobbies: Dict[int, List[int]] = {user_id: [] for user_id in self._user_bits}
+            for hobby_id, user_ids in self._postings.items():
+                for user_id in user_ids:
+                    user_hobbies.setdefault(user_id, []).append(hobby_id)
+            return user_hobbies
+
+    def user_ids_with(self, hobby_id: int) -> List[int]:
+        with self._lock:
+            return list(self._postings.get(hobby_id, ()))
+
+    def popularity(self, hobby_id: int) -> int:
+        """Number of users with the hobby."""
+        with self._lock:
+            return len(self._postings.get(hobby_id, ()))
+
+    def hobby_ids(self, user_id: int) -> List[int]:
+        with self._lock:
+            bits: int = self._user_bits.get(user_id, 0)
+            return [hobby_id for hobby_id, position in self._positions.items() if bits >> position & 1]
+
+    def rank(
+            self,
+            user_id: int,
+            min_birth_date: Optional[date] = None,
+            max_birth_date: Optional[date] = None,
+            candidates: Optional[Iterable[int]] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Return (user_id, common_hobbies_count) pairs ordered by count descending,
+        then by id. Users born on or before min_birth_date or after
+        max_birth_date are left out. When candidates is given only those users
+        are ranked, otherwise every user sharing a hobby is.
+        """
+        self.ensure_loaded()
+        with self._lock:
+            own_bits: int = self._user_bits.get(user_id, 0)
+            if candidates is None and own_bits:
+                candidates = set()
+                for hobby_id, position in self._positions.items():
+                    if own_bits >> position & 1:
+                        candidates |= self._postings.get(hobby_id, set())
+            elif candidates is None:
+                candidates = self._user_bits.keys()
+
+            ranked: List[Tuple[int, int]] = []
+            for candidate_id in candidates:
+                if candidate_id == user_id:
+                    continue
+                if min_birth_date or max_birth_date:
+                    date_of_birth: Optional[date] = self._birth_dates.get(candidate_id)
+                    if date_of_birth is None:
+                        continue
+                    if min_birth_date and date_of_birth <= min_birth_date:
+                        continue
+                    if max_birth_date and date_of_birth > max_birth_date:
+                        continue
+                common: int = (self._user_bits.get(candidate_id, 0) & own_bits).bit_count()
+                ranked.append((candidate_id, common))
+
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
+
+
+hobby_index: HobbyIndex = HobbyIndex()
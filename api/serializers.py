@@ -1,6 +1,6 @@
 from typing import List, Dict, Any
 
-from django.db.models import Model
+from django.db.models import Model, Prefetch, QuerySet
 from rest_framework import serializers
 from .models import CustomUser, Hobby, FriendRequest
 
@@ -16,7 +16,10 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CustomUser
-        fields = ['id', 'username', 'email', 'date_of_birth', 'hobbies', 'current_password', 'new_password']
+        fields = [
+            'id', 'username', 'email', 'date_of_birth', 'hobbies', 'friend_count', 'pending_in_count',
+            'current_password', 'new_password'
+        ]
         extra_kwargs = {
             'username': {'required': False},
             'email': {'required': False},
@@ -53,6 +56,21 @@ class UserProfileSerializer(serializers.ModelSerializer):
         instance.save()
         return instance
 
+class FriendSerializer(serializers.ModelSerializer):
+    # Read-only and without the email or password fields of UserProfileSerializer
+    hobbies: HobbySerializer = HobbySerializer(many=True, read_only=True)
+
+    class Meta:
+        model = CustomUser
+        fields = ['id', 'username', 'date_of_birth', 'hobbies']
+        read_only_fields = fields
+
+def friends_with_hobbies(user: CustomUser) -> QuerySet[CustomUser]:
+    """The user's friends with only the FriendSerializer columns, hobbies prefetched in one query."""
+    return user.friends.only('id', 'username', 'date_of_birth').prefetch_related(
+        Prefetch('hobbies', queryset=Hobby.objects.only('id', 'name'))
+    )
+
 class FriendRequestSerializer(serializers.ModelSerializer):
     sender_username: serializers.CharField = serializers.CharField(source='sender.username', read_only=True)
     receiver_username: serializers.CharField = serializers.CharField(source='receiver.username', read_only=True)
@@ -1,12 +1,29 @@
-from django.db.models.signals import post_migrate
+from django.db.models.signals import post_migrate, post_save, post_delete, pre_delete, m2m_changed
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.dispatch import receiver
 from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
 from datetime import datetime, timedelta
-from api.models import CustomUser, Hobby
+from api.catalog import hobby_catalog
+from api.conditional import FRIENDS, PENDING, PROFILE, resource_versions
+from api.events import (
+    FRIEND_REQUEST_ACCEPTED, FRIEND_REQUEST_CREATED, FRIEND_REQUEST_REJECTED, FRIENDSHIP_REMOVED, get_broker
+)
+from api.friend_graph import friend_graph
+from api.hobby_suggest import hobby_suggester
+from api.lsh import lsh_index
+from api.models import CustomUser, Hobby, FriendRequest
+from api.search_cache import search_cache
+from api.search_index import hobby_index
 
 
 @receiver(post_migrate)
 def create_default_data(sender, **kwargs):
+    # The handlers below write to the shared cache when hobbies and users are created
+    call_command('createcachetable', database=kwargs.get('using', 'default'), verbosity=0)
+
     if Hobby.objects.count() == 0:
         default_hobbies = [
             'Reading', 'Gaming', 'Sports', 'Music', 'Cooking',
@@ -191,4 +208,322 @@ def create_default_data(sender, **kwargs):
             hobbies = Hobby.objects.filter(name__in=hobby_names)
             user.hobbies.add(*hobbies)
 
-            print(f'Created user: {user_data["username"]} with hobbies: {", ".join(hobby_names)}')
\ No newline at end of file
+            print(f'Created user: {user_data["username"]} with hobbies: {", ".join(hobby_names)}')
+
+
+@receiver(post_save, sender=CustomUser)
+def index_user(sender, instance, created, update_fields, **kwargs):
+    user_id, date_of_birth = instance.id, instance.date_of_birth
+
+    # The in-process indexes only see committed changes, like the other workers do
+    def apply():
+        hobby_index.set_user(user_id, date_of_birth)
+        if created:
+            search_cache.bump('hobbies')
+        elif update_fields is None or 'date_of_birth' in update_fields:
+            search_cache.bump('birth_dates')
+    transaction.on_commit(apply)
+
+
+@receiver(post_delete, sender=CustomUser)
+def unindex_user(sender, instance, **kwargs):
+    user_id = instance.id
+
+    def apply():
+        hobby_index.remove_user(user_id)
+        lsh_index.remove_user(user_id)
+        friend_graph.remove_user(user_id)
+        search_cache.bump('hobbies')
+    transaction.on_commit(apply)
+
+
+@receiver(post_save, sender=Hobby)
+@receiver(post_delete, sender=Hobby)
+def invalidate_hobby_catalog(sender, instance, **kwargs):
+    transaction.on_commit(hobby_catalog.bump)
+
+
+@receiver(post_save, sender=Hobby)
+def index_hobby_name(sender, instance, **kwargs):
+    hobby_id, name = instance.id, instance.name
+    transaction.on_commit(lambda: hobby_suggester.set_hobby(hobby_id, name))
+
+
+@receiver(post_delete, sender=Hobby)
+def unindex_hobby(sender, instance, **kwargs):
+    hobby_id = instance.id
+
+    def apply():
+        affected_users = hobby_index.user_ids_with(hobby_id)
+        hobby_index.remove_hobby(hobby_id)
+        # Re-signed from the index, so only once it has the change
+        for user_id in affected_users:
+            lsh_index.update_user(user_id)
+        search_cache.bump('hobbies')
+        hobby_suggester.remove_hobby(hobby_id)
+    transaction.on_commit(apply)
+
+
+@receiver(m2m_changed, sender=CustomUser.hobbies.through)
+def index_user_hobbies(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    instance_id = instance.id
+    pk_set = set(pk_set) if pk_set is not None else None
+
+    def apply():
+        if reverse:
+            affected_users = pk_set if pk_set is not None else hobby_index.user_ids_with(instance_id)
+        else:
+            affected_users = [instance_id]
+
+        if action == 'post_add':
+            if reverse:
+                for user_id in pk_set:
+                    hobby_index.add_hobbies(user_id, [instance_id])
+            else:
+                hobby_index.add_hobbies(instance_id, pk_set)
+        elif action == 'post_remove':
+            if reverse:
+                for user_id in pk_set:
+                    hobby_index.remove_hobbies(user_id, [instance_id])
+            else:
+                hobby_index.remove_hobbies(instance_id, pk_set)
+        elif action == 'post_clear':
+            if reverse:
+                hobby_index.remove_hobby(instance_id)
+            else:
+                hobby_index.remove_hobbies(instance_id, hobby_index.hobby_ids(instance_id))
+
+        # Re-signed from the index, so only once it has the change
+        for user_id in affected_users:
+            lsh_index.update_user(user_id)
+        search_cache.bump('hobbies')
+
+    # A rolled back add or remove never reaches the index
+    transaction.on_commit(apply)
+
+
+@receiver(m2m_changed, sender=CustomUser.friends.through)
+def index_friendships(sender, instance, action, pk_set, **kwargs):
+    # friends is symmetrical, so one signal covers both directions
+    user_id = instance.id
+    if action == 'post_add':
+        friend_ids = set(pk_set)
+        transaction.on_commit(lambda: friend_graph.set_friends(user_id, friend_ids, present=True))
+    elif action == 'post_remove':
+        friend_ids = set(pk_set)
+        transaction.on_commit(lambda: friend_graph.set_friends(user_id, friend_ids, present=False))
+    elif action == 'post_clear':
+        transaction.on_commit(lambda: friend_graph.remove_user(user_id))
+
+
+def _uncount(hobbies, by=1):
+    hobbies.update(user_count=Greatest(F('user_count') - by, 0))
+
+
+@receiver(m2m_changed, sender=CustomUser.hobbies.through)
+def count_hobby_users(sender, instance, action, reverse, pk_set, **kwargs):
+    # Runs inside the add/remove/clear transaction, so the counters move with the rows
+    if action == 'post_add':
+        if reverse:
+            Hobby.objects.filter(id=instance.id).update(
+                user_count=F('user_count') + len(pk_set), recent_adds=F('recent_adds') + len(pk_set)
+            )
+        else:
+            Hobby.objects.filter(id__in=pk_set).update(
+                user_count=F('user_count') + 1, recent_adds=F('recent_adds') + 1
+            )
+    elif action == 'pre_remove':
+        # pk_set may name rows that don't exist, so only the rows about to go are counted
+        if reverse:
+            removed = sender.objects.filter(hobby_id=instance.id, customuser_id__in=pk_set).count()
+            if removed:
+                _uncount(Hobby.objects.filter(id=instance.id), removed)
+        else:
+            _uncount(Hobby.objects.filter(
+                id__in=sender.objects.filter(customuser_id=instance.id, hobby_id__in=pk_set).values('hobby_id')
+            ))
+    elif action == 'pre_clear':
+        if reverse:
+            Hobby.objects.filter(id=instance.id).update(user_count=0)
+        else:
+            _uncount(Hobby.objects.filter(
+                id__in=sender.objects.filter(customuser_id=instance.id).values('hobby_id')
+            ))
+
+
+@receiver(pre_delete, sender=CustomUser)
+def uncount_deleted_user(sender, instance, **kwargs):
+    # The cascade deletes the user's hobby rows without sending m2m_changed
+    _uncount(Hobby.objects.filter(
+        id__in=CustomUser.hobbies.through.objects.filter(customuser_id=instance.id).values('hobby_id')
+    ))
+
+
+def _move_counter(user_ids, field, by):
+    # by may be negative; clamped so drift never takes a counter below zero
+    user_ids = set(user_ids)
+    if user_ids and by:
+        CustomUser.objects.filter(id__in=user_ids).update(**{field: Greatest(F(field) + by, 0)})
+        # The counters are part of the profile payload
+        _bump_after_commit(PROFILE, user_ids)
+
+
+def _friend_ids(through, user_id, among=None):
+    rows = through.objects.filter(from_customuser_id=user_id)
+    if among is not None:
+        rows = rows.filter(to_customuser_id__in=among)
+    return set(rows.values_list('to_customuser_id', flat=True))
+
+
+@receiver(m2m_changed, sender=CustomUser.friends.through)
+def count_friends(sender, instance, action, pk_set, **kwargs):
+    if action == 'pre_add':
+        # add() on the symmetrical relation sends pre_add once per direction, so
+        # only friends with no row either way yet are new
+        reverse_rows = sender.objects.filter(to_customuser_id=instance.id, from_customuser_id__in=pk_set)
+        new = set(pk_set) - _friend_ids(sender, instance.id, pk_set) - set(
+            reverse_rows.values_list('from_customuser_id', flat=True)
+        )
+        _move_counter(new, 'friend_count', 1)
+        _move_counter([instance.id], 'friend_count', len(new))
+    elif action == 'pre_remove':
+        removed = _friend_ids(sender, instance.id, pk_set)
+        _move_counter(removed, 'friend_count', -1)
+        _move_counter([instance.id], 'friend_count', -len(removed))
+    elif action == 'pre_clear':
+        friend_ids = _friend_ids(sender, instance.id)
+        _move_counter(friend_ids, 'friend_count', -1)
+        _move_counter([instance.id], 'friend_count', -len(friend_ids))
+
+
+@receiver(pre_delete, sender=CustomUser)
+def uncount_deleted_friend(sender, instance, **kwargs):
+    # As with hobbies, the cascade removes the friendship rows without m2m_changed
+    _move_counter(_friend_ids(CustomUser.friends.through, instance.id), 'friend_count', -1)
+
+
+@receiver(post_save, sender=FriendRequest)
+def count_pending_requests(sender, instance, created, **kwargs):
+    was_pending = not created and instance.saved_status == FriendRequest.PENDING
+    is_pending = instance.status == FriendRequest.PENDING
+    if was_pending != is_pending:
+        _move_counter([instance.receiver_id], 'pending_in_count', 1 if is_pending else -1)
+
+
+@receiver(post_delete, sender=FriendRequest)
+def uncount_deleted_pending_request(sender, instance, **kwargs):
+    if instance.saved_status == FriendRequest.PENDING:
+        _move_counter([instance.receiver_id], 'pending_in_count', -1)
+
+
+# Version stamps behind the conditional GETs in api.conditional. They are bumped
+# after commit, so a response can never carry a new ETag with old data.
+
+PROFILE_FIELDS = {'username', 'email', 'date_of_birth'}
+
+
+def _bump_after_commit(name, user_ids):
+    user_ids = set(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: resource_versions.bump(name, user_ids))
+
+
+def _profiles_changed(user_ids, username=True):
+    # A profile also shows in the friends lists of the user's friends, and the
+    # username in the pending requests the user has sent
+    user_ids = set(user_ids)
+
+    def bump():
+        resource_versions.bump(PROFILE, user_ids)
+        resource_versions.bump(FRIENDS, CustomUser.friends.through.objects.filter(
+            from_customuser_id__in=user_ids
+        ).values_list('to_customuser_id', flat=True))
+        if username:
+            resource_versions.bump(PENDING, FriendRequest.objects.filter(
+                sender_id__in=user_ids, status=FriendRequest.PENDING
+            ).values_list('receiver_id', flat=True))
+
+    if user_ids:
+        transaction.on_commit(bump)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_profile_version(sender, instance, update_fields, **kwargs):
+    if update_fields is None or PROFILE_FIELDS & set(update_fields):
+        _profiles_changed([instance.id], username=update_fields is None or 'username' in update_fields)
+
+
+@receiver(m2m_changed, sender=CustomUser.hobbies.through)
+def invalidate_hobby_set_versions(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ('post_add', 'post_remove'):
+        _profiles_changed(pk_set if reverse else [instance.id], username=False)
+    elif action == 'pre_clear':
+        user_ids = sender.objects.filter(hobby_id=instance.id).values_list('customuser_id', flat=True)
+        _profiles_changed(user_ids if reverse else [instance.id], username=False)
+
+
+@receiver(m2m_changed, sender=CustomUser.friends.through)
+def invalidate_friends_versions(sender, instance, action, pk_set, **kwargs):
+    if action in ('post_add', 'post_remove'):
+        _bump_after_commit(FRIENDS, {instance.id, *pk_set})
+    elif action == 'pre_clear':
+        friend_ids = sender.objects.filter(from_customuser_id=instance.id).values_list('to_customuser_id', flat=True)
+        _bump_after_commit(FRIENDS, {instance.id, *friend_ids})
+
+
+@receiver(pre_delete, sender=CustomUser)
+def invalidate_deleted_user_versions(sender, instance, **kwargs):
+    # Friendship rows go with the cascade, without m2m_changed
+    _bump_after_commit(FRIENDS, CustomUser.friends.through.objects.filter(
+        from_customuser_id=instance.id
+    ).values_list('to_customuser_id', flat=True))
+
+
+@receiver(post_save, sender=FriendRequest)
+@receiver(post_delete, sender=FriendRequest)
+def invalidate_pending_version(sender, instance, **kwargs):
+    _bump_after_commit(PENDING, [instance.receiver_id])
+    # The profile carries the receiver's pending_in_count
+    _bump_after_commit(PROFILE, [instance.receiver_id])
+
+
+# Push events for api.events, published once the change is committed
+
+FRIEND_REQUEST_EVENTS = {
+    FriendRequest.PENDING: FRIEND_REQUEST_CREATED,
+    FriendRequest.ACCEPTED: FRIEND_REQUEST_ACCEPTED,
+    FriendRequest.REJECTED: FRIEND_REQUEST_REJECTED,
+}
+
+
+def _publish_after_commit(user_ids, event):
+    transaction.on_commit(lambda: get_broker().publish(user_ids, event))
+
+
+@receiver(post_save, sender=FriendRequest)
+def publish_friend_request_event(sender, instance, **kwargs):
+    # Both sides, so every open tab of either user can refresh
+    _publish_after_commit([instance.sender_id, instance.receiver_id], {
+        'type': FRIEND_REQUEST_EVENTS[instance.status],
+        'request_id': instance.id,
+        'sender_id': instance.sender_id,
+        'receiver_id': instance.receiver_id,
+        'status': instance.status,
+    })
+
+
+@receiver(m2m_changed, sender=CustomUser.friends.through)
+def publish_friendship_removals(sender, instance, action, pk_set, **kwargs):
+    if action == 'post_remove':
+        friend_ids = pk_set
+    elif action == 'pre_clear':
+        friend_ids = set(sender.objects.filter(from_customuser_id=instance.id).values_list('to_customuser_id', flat=True))
+    else:
+        return
+    for friend_id in friend_ids:
+        _publish_after_commit([instance.id, friend_id], {
+            'type': FRIENDSHIP_REMOVED,
+            'user_ids': sorted([instance.id, friend_id]),
+        })
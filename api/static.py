@@ -0,0 +1,43 @@
+"""
+WhiteNoise as a hybrid middleware.
+
+WhiteNoise's own middleware is sync-only, and under ASGI Django then runs it
+and every middleware above it through sync_to_async, a thread hop on every
+request. Looking a static file up is a dict lookup (or a stat with
+WHITENOISE_AUTOREFRESH), so the async path does it in place and awaits the
+rest of the stack for everything else.
+"""
+
+from typing import Awaitable, Callable, Optional, Union
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class HybridWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    def __init__(
+            self,
+            get_response: Callable[[HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]],
+            settings=settings
+    ) -> None:
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        static_file: Optional[object] = (
+            self.find_file(request.path_info) if self.autorefresh else self.files.get(request.path_info)
+        )
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
@@ -22,7 +22,7 @@
   * vue-router v4.4.5
   * (c) 2024 Eduardo San Martin Morote
   * @license MIT
-  */const wn=typeof document<"u";function sc(t){return typeof t=="object"||"displayName"in t||"props"in t||"__vccOpts"in t}function Qd(t){return t.__esModule||t[Symbol.toStringTag]==="Module"||t.default&&sc(t.default)}const ce=Object.assign;function kr(t,e){const n={};for(const s in e){const r=e[s];n[s]=at(r)?r.map(t):t(r)}return n}const os=()=>{},at=Array.isArray,rc=/#/g,Jd=/&/g,Zd=/\//g,eh=/=/g,th=/\?/g,ic=/\+/g,nh=/%5B/g,sh=/%5D/g,oc=/%5E/g,rh=/%60/g,ac=/%7B/g,ih=/%7C/g,lc=/%7D/g,oh=/%20/g;function Ki(t){return encodeURI(""+t).replace(ih,"|").replace(nh,"[").replace(sh,"]")}function ah(t){return Ki(t).replace(ac,"{").replace(lc,"}").replace(oc,"^")}function _i(t){return Ki(t).replace(ic,"%2B").replace(oh,"+").replace(rc,"%23").replace(Jd,"%26").replace(rh,"`").replace(ac,"{").replace(lc,"}").replace(oc,"^")}function lh(t){return _i(t).replace(eh,"%3D")}function ch(t){return Ki(t).replace(rc,"%23").replace(th,"%3F")}function uh(t){return t==null?"":ch(t).replace(Zd,"%2F")}function _s(t){try{return decodeURIComponent(""+t)}catch{}return""+t}const fh=/\/$/,dh=t=>t.replace(fh,"");function Hr(t,e,n="/"){let s,r={},i="",o="";const a=e.indexOf("#");let l=e.indexOf("?");return a<l&&a>=0&&(l=-1),l>-1&&(s=e.slice(0,l),i=e.slice(l+1,a>-1?a:e.length),r=t(i)),a>-1&&(s=s||e.slice(0,a),o=e.slice(a,e.length)),s=gh(s??e,n),{fullPath:s+(i&&"?")+i+o,path:s,query:r,hash:_s(o)}}function hh(t,e){const n=e.query?t(e.query):"";return e.path+(n&&"?")+n+(e.hash||"")}function qo(t,e){return!e||!t.toLowerCase().startsWith(e.toLowerCase())?t:t.slice(e.length)||"/"}function ph(t,e,n){const s=e.matched.length-1,r=n.matched.length-1;return s>-1&&s===r&&Rn(e.matched[s],n.matched[r])&&cc(e.params,n.params)&&t(e.query)===t(n.query)&&e.hash===n.hash}function Rn(t,e){return(t.aliasOf||t)===(e.aliasOf||e)}function cc(t,e){if(Object.keys(t).length!==Object.keys(e).length)return!1;for(const n in t)if(!_h(t[n],e[n]))return!1;return!0}function _h(t,e){return at(t)?Yo(t,e):at(e)?Yo(e,t):t===e}function Yo(t,e){return at(e)?t.length===e.length&&t.every((n,s)=>n===e[s]):t.length===1&&t[0]===e}function gh(t,e){if(t.startsWith("/"))return t;if(!t)return e;const n=e.split("/"),s=t.split("/"),r=s[s.length-1];(r===".."||r===".")&&s.push("");let i=n.length-1,o,a;for(o=0;o<s.length;o++)if(a=s[o],a!==".")if(a==="..")i>1&&i--;else break;return n.slice(0,i).join("/")+"/"+s.slice(o).join("/")}const Pt={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var gs;(function(t){t.pop="pop",t.push="push"})(gs||(gs={}));var as;(function(t){t.back="back",t.forward="forward",t.unknown=""})(as||(as={}));function mh(t){if(!t)if(wn){const e=document.querySelector("base");t=e&&e.getAttribute("href")||"/",t=t.replace(/^\w+:\/\/[^\/]+/,"")}else t="/";return t[0]!=="/"&&t[0]!=="#"&&(t="/"+t),dh(t)}const vh=/^[^#]+#/;function bh(t,e){return t.replace(vh,"#")+e}function Eh(t,e){const n=document.documentElement.getBoundingClientRect(),s=t.getBoundingClientRect();return{behavior:e.behavior,left:s.left-n.left-(e.left||0),top:s.top-n.top-(e.top||0)}}const _r=()=>({left:window.scrollX,top:window.scrollY});function yh(t){let e;if("el"in t){const n=t.el,s=typeof n=="string"&&n.startsWith("#"),r=typeof n=="string"?s?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!r)return;e=Eh(r,t)}else e=t;"scrollBehavior"in document.documentElement.style?window.scrollTo(e):window.scrollTo(e.left!=null?e.left:window.scrollX,e.top!=null?e.top:window.scrollY)}function Go(t,e){return(history.state?history.state.position-e:-1)+t}const gi=new Map;function wh(t,e){gi.set(t,e)}function Ah(t){const e=gi.get(t);return gi.delete(t),e}let Th=()=>location.protocol+"//"+location.host;function uc(t,e){const{pathname:n,search:s,hash:r}=e,i=t.indexOf("#");if(i>-1){let a=r.includes(t.slice(i))?t.slice(i).length:1,l=r.slice(a);return l[0]!=="/"&&(l="/"+l),qo(l,"")}return qo(n,t)+s+r}function Sh(t,e,n,s){let r=[],i=[],o=null;const a=({state:_})=>{const p=uc(t,location),v=n.value,m=e.value;let C=0;if(_){if(n.value=p,e.value=_,o&&o===v){o=null;return}C=m?_.position-m.position:0}else s(p);r.forEach(D=>{D(n.value,v,{delta:C,type:gs.pop,direction:C?C>0?as.forward:as.back:as.unknown})})};function l(){o=n.value}function u(_){r.push(_);const p=()=>{const v=r.indexOf(_);v>-1&&r.splice(v,1)};return i.push(p),p}function c(){const{history:_}=window;_.state&&_.replaceState(ce({},_.state,{scroll:_r()}),"")}function d(){for(const _ of i)_();i=[],window.removeEventListener("popstate",a),window.removeEventListener("beforeunload",c)}return window.addEventListener("popstate",a),window.addEventListener("beforeunload",c,{passive:!0}),{pauseListeners:l,listen:u,destroy:d}}function zo(t,e,n,s=!1,r=!1){return{back:t,current:e,forward:n,replaced:s,position:window.history.length,scroll:r?_r():null}}function Ch(t){const{history:e,location:n}=window,s={value:uc(t,n)},r={value:e.state};r.value||i(s.value,{back:null,current:s.value,forward:null,position:e.length-1,replaced:!0,scroll:null},!0);function i(l,u,c){const d=t.indexOf("#"),_=d>-1?(n.host&&document.querySelector("base")?t:t.slice(d))+l:Th()+t+l;try{e[c?"replaceState":"pushState"](u,"",_),r.value=u}catch(p){console.error(p),n[c?"replace":"assign"](_)}}function o(l,u){const c=ce({},e.state,zo(r.value.back,l,r.value.forward,!0),u,{position:r.value.position});i(l,c,!0),s.value=l}function a(l,u){const c=ce({},r.value,e.state,{forward:l,scroll:_r()});i(c.current,c,!0);const d=ce({},zo(s.value,l,null),{position:c.position+1},u);i(l,d,!1),s.value=l}return{location:s,state:r,push:a,replace:o}}function Oh(t){t=mh(t);const e=Ch(t),n=Sh(t,e.state,e.location,e.replace);function s(i,o=!0){o||n.pauseListeners(),history.go(i)}const r=ce({location:"",base:t,go:s,createHref:bh.bind(null,t)},e,n);return Object.defineProperty(r,"location",{enumerable:!0,get:()=>e.location.value}),Object.defineProperty(r,"state",{enumerable:!0,get:()=>e.state.value}),r}function $h(t){return typeof t=="string"||t&&typeof t=="object"}function fc(t){return typeof t=="string"||typeof t=="symbol"}const dc=Symbol("");var Xo;(function(t){t[t.aborted=4]="aborted",t[t.cancelled=8]="cancelled",t[t.duplicated=16]="duplicated"})(Xo||(Xo={}));function xn(t,e){return ce(new Error,{type:t,[dc]:!0},e)}function yt(t,e){return t instanceof Error&&dc in t&&(e==null||!!(t.type&e))}const Qo="[^/]+?",Nh={sensitive:!1,strict:!1,start:!0,end:!0},Ph=/[.+*?^${}()[\]/\\]/g;function Dh(t,e){const n=ce({},Nh,e),s=[];let r=n.start?"^":"";const i=[];for(const u of t){const c=u.length?[]:[90];n.strict&&!u.length&&(r+="/");for(let d=0;d<u.length;d++){const _=u[d];let p=40+(n.sensitive?.25:0);if(_.type===0)d||(r+="/"),r+=_.value.replace(Ph,"\\$&"),p+=40;else if(_.type===1){const{value:v,repeatable:m,optional:C,regexp:D}=_;i.push({name:v,repeatable:m,optional:C});const $=D||Qo;if($!==Qo){p+=10;try{new RegExp(`(${$})`)}catch(A){throw new Error(`Invalid custom RegExp for param "${v}" (${$}): `+A.message)}}let R=m?`((?:${$})(?:/(?:${$}))*)`:`(${$})`;d||(R=C&&u.length<2?`(?:/${R})`:"/"+R),C&&(R+="?"),r+=R,p+=20,C&&(p+=-8),m&&(p+=-20),$===".*"&&(p+=-50)}c.push(p)}s.push(c)}if(n.strict&&n.end){const u=s.length-1;s[u][s[u].length-1]+=.7000000000000001}n.strict||(r+="/?"),n.end?r+="$":n.strict&&(r+="(?:/|$)");const o=new RegExp(r,n.sensitive?"":"i");function a(u){const c=u.match(o),d={};if(!c)return null;for(let _=1;_<c.length;_++){const p=c[_]||"",v=i[_-1];d[v.name]=p&&v.repeatable?p.split("/"):p}return d}function l(u){let c="",d=!1;for(const _ of t){(!d||!c.endsWith("/"))&&(c+="/"),d=!1;for(const p of _)if(p.type===0)c+=p.value;else if(p.type===1){const{value:v,repeatable:m,optional:C}=p,D=v in u?u[v]:"";if(at(D)&&!m)throw new Error(`Provided param "${v}" is an array but it is not repeatable (* or + modifiers)`);const $=at(D)?D.join("/"):D;if(!$)if(C)_.length<2&&(c.endsWith("/")?c=c.slice(0,-1):d=!0);else throw new Error(`Missing required param "${v}"`);c+=$}}return c||"/"}return{re:o,score:s,keys:i,parse:a,stringify:l}}function Rh(t,e){let n=0;for(;n<t.length&&n<e.length;){const s=e[n]-t[n];if(s)return s;n++}return t.length<e.length?t.length===1&&t[0]===80?-1:1:t.length>e.length?e.length===1&&e[0]===80?1:-1:0}function hc(t,e){let n=0;const s=t.score,r=e.score;for(;n<s.length&&n<r.length;){const i=Rh(s[n],r[n]);if(i)return i;n++}if(Math.abs(r.length-s.length)===1){if(Jo(s))return 1;if(Jo(r))return-1}return r.length-s.length}function Jo(t){const e=t[t.length-1];return t.length>0&&e[e.length-1]<0}const xh={type:0,value:""},Lh=/[a-zA-Z0-9_]/;function Ih(t){if(!t)return[[]];if(t==="/")return[[xh]];if(!t.startsWith("/"))throw new Error(`Invalid path "${t}"`);function e(p){throw new Error(`ERR (${n})/"${u}": ${p}`)}let n=0,s=n;const r=[];let i;function o(){i&&r.push(i),i=[]}let a=0,l,u="",c="";function d(){u&&(n===0?i.push({type:0,value:u}):n===1||n===2||n===3?(i.length>1&&(l==="*"||l==="+")&&e(`A repeatable param (${u}) must be alone in its segment. eg: '/:ids+.`),i.push({type:1,value:u,regexp:c,repeatable:l==="*"||l==="+",optional:l==="*"||l==="?"})):e("Invalid state to consume buffer"),u="")}function _(){u+=l}for(;a<t.length;){if(l=t[a++],l==="\\"&&n!==2){s=n,n=4;continue}switch(n){case 0:l==="/"?(u&&d(),o()):l===":"?(d(),n=1):_();break;case 4:_(),n=s;break;case 1:l==="("?n=2:Lh.test(l)?_():(d(),n=0,l!=="*"&&l!=="?"&&l!=="+"&&a--);break;case 2:l===")"?c[c.length-1]=="\\"?c=c.slice(0,-1)+l:n=3:c+=l;break;case 3:d(),n=0,l!=="*"&&l!=="?"&&l!=="+"&&a--,c="";break;default:e("Unknown state");break}}return n===2&&e(`Unfinished custom RegExp for param "${u}"`),d(),o(),r}function Mh(t,e,n){const s=Dh(Ih(t.path),n),r=ce(s,{record:t,parent:e,children:[],alias:[]});return e&&!r.record.aliasOf==!e.record.aliasOf&&e.children.push(r),r}function kh(t,e){const n=[],s=new Map;e=na({strict:!1,end:!0,sensitive:!1},e);function r(d){return s.get(d)}function i(d,_,p){const v=!p,m=ea(d);m.aliasOf=p&&p.record;const C=na(e,d),D=[m];if("alias"in d){const A=typeof d.alias=="string"?[d.alias]:d.alias;for(const k of A)D.push(ea(ce({},m,{components:p?p.record.components:m.components,path:k,aliasOf:p?p.record:m})))}let $,R;for(const A of D){const{path:k}=A;if(_&&k[0]!=="/"){const z=_.record.path,U=z[z.length-1]==="/"?"":"/";A.path=_.record.path+(k&&U+k)}if($=Mh(A,_,C),p?p.alias.push($):(R=R||$,R!==$&&R.alias.push($),v&&d.name&&!ta($)&&o(d.name)),pc($)&&l($),m.children){const z=m.children;for(let U=0;U<z.length;U++)i(z[U],$,p&&p.children[U])}p=p||$}return R?()=>{o(R)}:os}function o(d){if(fc(d)){const _=s.get(d);_&&(s.delete(d),n.splice(n.indexOf(_),1),_.children.forEach(o),_.alias.forEach(o))}else{const _=n.indexOf(d);_>-1&&(n.splice(_,1),d.record.name&&s.delete(d.record.name),d.children.forEach(o),d.alias.forEach(o))}}function a(){return n}function l(d){const _=Vh(d,n);n.splice(_,0,d),d.record.name&&!ta(d)&&s.set(d.record.name,d)}function u(d,_){let p,v={},m,C;if("name"in d&&d.name){if(p=s.get(d.name),!p)throw xn(1,{location:d});C=p.record.name,v=ce(Zo(_.params,p.keys.filter(R=>!R.optional).concat(p.parent?p.parent.keys.filter(R=>R.optional):[]).map(R=>R.name)),d.params&&Zo(d.params,p.keys.map(R=>R.name))),m=p.stringify(v)}else if(d.path!=null)m=d.path,p=n.find(R=>R.re.test(m)),p&&(v=p.parse(m),C=p.record.name);else{if(p=_.name?s.get(_.name):n.find(R=>R.re.test(_.path)),!p)throw xn(1,{location:d,currentLocation:_});C=p.record.name,v=ce({},_.params,d.params),m=p.stringify(v)}const D=[];let $=p;for(;$;)D.unshift($.record),$=$.parent;return{name:C,path:m,params:v,matched:D,meta:Fh(D)}}t.forEach(d=>i(d));function c(){n.length=0,s.clear()}return{addRoute:i,resolve:u,removeRoute:o,clearRoutes:c,getRoutes:a,getRecordMatcher:r}}function Zo(t,e){const n={};for(const s of e)s in t&&(n[s]=t[s]);return n}function ea(t){const e={path:t.path,redirect:t.redirect,name:t.name,meta:t.meta||{},aliasOf:t.aliasOf,beforeEnter:t.beforeEnter,props:Hh(t),children:t.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in t?t.components||null:t.component&&{default:t.component}};return Object.defineProperty(e,"mods",{value:{}}),e}function Hh(t){const e={},n=t.props||!1;if("component"in t)e.default=n;else for(const s in t.components)e[s]=typeof n=="object"?n[s]:n;return e}function ta(t){for(;t;){if(t.record.aliasOf)return!0;t=t.parent}return!1}function Fh(t){return t.reduce((e,n)=>ce(e,n.meta),{})}function na(t,e){const n={};for(const s in t)n[s]=s in e?e[s]:t[s];return n}function Vh(t,e){let n=0,s=e.length;for(;n!==s;){const i=n+s>>1;hc(t,e[i])<0?s=i:n=i+1}const r=jh(t);return r&&(s=e.lastIndexOf(r,s-1)),s}function jh(t){let e=t;for(;e=e.parent;)if(pc(e)&&hc(t,e)===0)return e}function pc({record:t}){return!!(t.name||t.components&&Object.keys(t.components).length||t.redirect)}function Wh(t){const e={};if(t===""||t==="?")return e;const s=(t[0]==="?"?t.slice(1):t).split("&");for(let r=0;r<s.length;++r){const i=s[r].replace(ic," "),o=i.indexOf("="),a=_s(o<0?i:i.slice(0,o)),l=o<0?null:_s(i.slice(o+1));if(a in e){let u=e[a];at(u)||(u=e[a]=[u]),u.push(l)}else e[a]=l}return e}function sa(t){let e="";for(let n in t){const s=t[n];if(n=lh(n),s==null){s!==void 0&&(e+=(e.length?"&":"")+n);continue}(at(s)?s.map(i=>i&&_i(i)):[s&&_i(s)]).forEach(i=>{i!==void 0&&(e+=(e.length?"&":"")+n,i!=null&&(e+="="+i))})}return e}function Bh(t){const e={};for(const n in t){const s=t[n];s!==void 0&&(e[n]=at(s)?s.map(r=>r==null?null:""+r):s==null?s:""+s)}return e}const Kh=Symbol(""),ra=Symbol(""),Ui=Symbol(""),_c=Symbol(""),mi=Symbol("");function Gn(){let t=[];function e(s){return t.push(s),()=>{const r=t.indexOf(s);r>-1&&t.splice(r,1)}}function n(){t=[]}return{add:e,list:()=>t.slice(),reset:n}}function It(t,e,n,s,r,i=o=>o()){const o=s&&(s.enterCallbacks[r]=s.enterCallbacks[r]||[]);return()=>new Promise((a,l)=>{const u=_=>{_===!1?l(xn(4,{from:n,to:e})):_ instanceof Error?l(_):$h(_)?l(xn(2,{from:e,to:_})):(o&&s.enterCallbacks[r]===o&&typeof _=="function"&&o.push(_),a())},c=i(()=>t.call(s&&s.instances[r],e,n,u));let d=Promise.resolve(c);t.length<3&&(d=d.then(u)),d.catch(_=>l(_))})}function Fr(t,e,n,s,r=i=>i()){const i=[];for(const o of t)for(const a in o.components){let l=o.components[a];if(!(e!=="beforeRouteEnter"&&!o.instances[a]))if(sc(l)){const c=(l.__vccOpts||l)[e];c&&i.push(It(c,n,s,o,a,r))}else{let u=l();i.push(()=>u.then(c=>{if(!c)throw new Error(`Couldn't resolve component "${a}" at "${o.path}"`);const d=Qd(c)?c.default:c;o.mods[a]=c,o.components[a]=d;const p=(d.__vccOpts||d)[e];return p&&It(p,n,s,o,a,r)()}))}}return i}function ia(t){const e=pt(Ui),n=pt(_c),s=Xe(()=>{const l=Nn(t.to);return e.resolve(l)}),r=Xe(()=>{const{matched:l}=s.value,{length:u}=l,c=l[u-1],d=n.matched;if(!c||!d.length)return-1;const _=d.findIndex(Rn.bind(null,c));if(_>-1)return _;const p=oa(l[u-2]);return u>1&&oa(c)===p&&d[d.length-1].path!==p?d.findIndex(Rn.bind(null,l[u-2])):_}),i=Xe(()=>r.value>-1&&Gh(n.params,s.value.params)),o=Xe(()=>r.value>-1&&r.value===n.matched.length-1&&cc(n.params,s.value.params));function a(l={}){return Yh(l)?e[Nn(t.replace)?"replace":"push"](Nn(t.to)).catch(os):Promise.resolve()}return{route:s,href:Xe(()=>s.value.href),isActive:i,isExactActive:o,navigate:a}}const Uh=bt({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:ia,setup(t,{slots:e}){const n=vs(ia(t)),{options:s}=pt(Ui),r=Xe(()=>({[aa(t.activeClass,s.linkActiveClass,"router-link-active")]:n.isActive,[aa(t.exactActiveClass,s.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const i=e.default&&e.default(n);return t.custom?i:Ql("a",{"aria-current":n.isExactActive?t.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:r.value},i)}}}),qh=Uh;function Yh(t){if(!(t.metaKey||t.altKey||t.ctrlKey||t.shiftKey)&&!t.defaultPrevented&&!(t.button!==void 0&&t.button!==0)){if(t.currentTarget&&t.currentTarget.getAttribute){const e=t.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(e))return}return t.preventDefault&&t.preventDefault(),!0}}function Gh(t,e){for(const n in e){const s=e[n],r=t[n];if(typeof s=="string"){if(s!==r)return!1}else if(!at(r)||r.length!==s.length||s.some((i,o)=>i!==r[o]))return!1}return!0}function oa(t){return t?t.aliasOf?t.aliasOf.path:t.path:""}const aa=(t,e,n)=>t??e??n,zh=bt({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(t,{attrs:e,slots:n}){const s=pt(mi),r=Xe(()=>t.route||s.value),i=pt(ra,0),o=Xe(()=>{let u=Nn(i);const{matched:c}=r.value;let d;for(;(d=c[u])&&!d.components;)u++;return u}),a=Xe(()=>r.value.matched[o.value]);ks(ra,Xe(()=>o.value+1)),ks(Kh,a),ks(mi,r);const l=Re();return ss(()=>[l.value,a.value,t.name],([u,c,d],[_,p,v])=>{c&&(c.instances[d]=u,p&&p!==c&&u&&u===_&&(c.leaveGuards.size||(c.leaveGuards=p.leaveGuards),c.updateGuards.size||(c.updateGuards=p.updateGuards))),u&&c&&(!p||!Rn(c,p)||!_)&&(c.enterCallbacks[d]||[]).forEach(m=>m(u))},{flush:"post"}),()=>{const u=r.value,c=t.name,d=a.value,_=d&&d.components[c];if(!_)return la(n.default,{Component:_,route:u});const p=d.props[c],v=p?p===!0?u.params:typeof p=="function"?p(u):p:null,C=Ql(_,ce({},v,e,{onVnodeUnmounted:D=>{D.component.isUnmounted&&(d.instances[c]=null)},ref:l}));return la(n.default,{Component:C,route:u})||C}}});function la(t,e){if(!t)return null;const n=t(e);return n.length===1?n[0]:n}const gc=zh;function Xh(t){const e=kh(t.routes,t),n=t.parseQuery||Wh,s=t.stringifyQuery||sa,r=t.history,i=Gn(),o=Gn(),a=Gn(),l=Gu(Pt);let u=Pt;wn&&t.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const c=kr.bind(null,E=>""+E),d=kr.bind(null,uh),_=kr.bind(null,_s);function p(E,I){let x,H;return fc(E)?(x=e.getRecordMatcher(E),H=I):H=E,e.addRoute(H,x)}function v(E){const I=e.getRecordMatcher(E);I&&e.removeRoute(I)}function m(){return e.getRoutes().map(E=>E.record)}function C(E){return!!e.getRecordMatcher(E)}function D(E,I){if(I=ce({},I||l.value),typeof E=="string"){const h=Hr(n,E,I.path),g=e.resolve({path:h.path},I),y=r.createHref(h.fullPath);return ce(h,g,{params:_(g.params),hash:_s(h.hash),redirectedFrom:void 0,href:y})}let x;if(E.path!=null)x=ce({},E,{path:Hr(n,E.path,I.path).path});else{const h=ce({},E.params);for(const g in h)h[g]==null&&delete h[g];x=ce({},E,{params:d(h)}),I.params=d(I.params)}const H=e.resolve(x,I),ne=E.hash||"";H.params=c(_(H.params));const pe=hh(s,ce({},E,{hash:ah(ne),path:H.path})),f=r.createHref(pe);return ce({fullPath:pe,hash:ne,query:s===sa?Bh(E.query):E.query||{}},H,{redirectedFrom:void 0,href:f})}function $(E){return typeof E=="string"?Hr(n,E,l.value.path):ce({},E)}function R(E,I){if(u!==E)return xn(8,{from:I,to:E})}function A(E){return U(E)}function k(E){return A(ce($(E),{replace:!0}))}function z(E){const I=E.matched[E.matched.length-1];if(I&&I.redirect){const{redirect:x}=I;let H=typeof x=="function"?x(E):x;return typeof H=="string"&&(H=H.includes("?")||H.includes("#")?H=$(H):{path:H},H.params={}),ce({query:E.query,hash:E.hash,params:H.path!=null?{}:E.params},H)}}function U(E,I){const x=u=D(E),H=l.value,ne=E.state,pe=E.force,f=E.replace===!0,h=z(x);if(h)return U(ce($(h),{state:typeof h=="object"?ce({},ne,h.state):ne,force:pe,replace:f}),I||x);const g=x;g.redirectedFrom=I;let y;return!pe&&ph(s,H,x)&&(y=xn(16,{to:g,from:H}),Me(H,H,!0,!1)),(y?Promise.resolve(y):Q(g,H)).catch(b=>yt(b)?yt(b,2)?b:Fe(b):te(b,g,H)).then(b=>{if(b){if(yt(b,2))return U(ce({replace:f},$(b.to),{state:typeof b.to=="object"?ce({},ne,b.to.state):ne,force:pe}),I||g)}else b=he(g,H,!0,f,ne);return se(g,H,b),b})}function j(E,I){const x=R(E,I);return x?Promise.reject(x):Promise.resolve()}function V(E){const I=Ve.values().next().value;return I&&typeof I.runWithContext=="function"?I.runWithContext(E):E()}function Q(E,I){let x;const[H,ne,pe]=Qh(E,I);x=Fr(H.reverse(),"beforeRouteLeave",E,I);for(const h of H)h.leaveGuards.forEach(g=>{x.push(It(g,E,I))});const f=j.bind(null,E,I);return x.push(f),Ee(x).then(()=>{x=[];for(const h of i.list())x.push(It(h,E,I));return x.push(f),Ee(x)}).then(()=>{x=Fr(ne,"beforeRouteUpdate",E,I);for(const h of ne)h.updateGuards.forEach(g=>{x.push(It(g,E,I))});return x.push(f),Ee(x)}).then(()=>{x=[];for(const h of pe)if(h.beforeEnter)if(at(h.beforeEnter))for(const g of h.beforeEnter)x.push(It(g,E,I));else x.push(It(h.beforeEnter,E,I));return x.push(f),Ee(x)}).then(()=>(E.matched.forEach(h=>h.enterCallbacks={}),x=Fr(pe,"beforeRouteEnter",E,I,V),x.push(f),Ee(x))).then(()=>{x=[];for(const h of o.list())x.push(It(h,E,I));return x.push(f),Ee(x)}).catch(h=>yt(h,8)?h:Promise.reject(h))}function se(E,I,x){a.list().forEach(H=>V(()=>H(E,I,x)))}function he(E,I,x,H,ne){const pe=R(E,I);if(pe)return pe;const f=I===Pt,h=wn?history.state:{};x&&(H||f?r.replace(E.fullPath,ce({scroll:f&&h&&h.scroll},ne)):r.push(E.fullPath,ne)),l.value=E,Me(E,I,x,f),Fe()}let ie;function Ne(){ie||(ie=r.listen((E,I,x)=>{if(!je.listening)return;const H=D(E),ne=z(H);if(ne){U(ce(ne,{replace:!0}),H).catch(os);return}u=H;const pe=l.value;wn&&wh(Go(pe.fullPath,x.delta),_r()),Q(H,pe).catch(f=>yt(f,12)?f:yt(f,2)?(U(f.to,H).then(h=>{yt(h,20)&&!x.delta&&x.type===gs.pop&&r.go(-1,!1)}).catch(os),Promise.reject()):(x.delta&&r.go(-x.delta,!1),te(f,H,pe))).then(f=>{f=f||he(H,pe,!1),f&&(x.delta&&!yt(f,8)?r.go(-x.delta,!1):x.type===gs.pop&&yt(f,20)&&r.go(-1,!1)),se(H,pe,f)}).catch(os)}))}let Te=Gn(),Z=Gn(),W;function te(E,I,x){Fe(E);const H=Z.list();return H.length?H.forEach(ne=>ne(E,I,x)):console.error(E),Promise.reject(E)}function we(){return W&&l.value!==Pt?Promise.resolve():new Promise((E,I)=>{Te.add([E,I])})}function Fe(E){return W||(W=!E,Ne(),Te.list().forEach(([I,x])=>E?x(E):I()),Te.reset()),E}function Me(E,I,x,H){const{scrollBehavior:ne}=t;if(!wn||!ne)return Promise.resolve();const pe=!x&&Ah(Go(E.fullPath,0))||(H||!x)&&history.state&&history.state.scroll||null;return Hi().then(()=>ne(E,I,pe)).then(f=>f&&yh(f)).catch(f=>te(f,E,I))}const me=E=>r.go(E);let st;const Ve=new Set,je={currentRoute:l,listening:!0,addRoute:p,removeRoute:v,clearRoutes:e.clearRoutes,hasRoute:C,getRoutes:m,resolve:D,options:t,push:A,replace:k,go:me,back:()=>me(-1),forward:()=>me(1),beforeEach:i.add,beforeResolve:o.add,afterEach:a.add,onError:Z.add,isReady:we,install(E){const I=this;E.component("RouterLink",qh),E.component("RouterView",gc),E.config.globalProperties.$router=I,Object.defineProperty(E.config.globalProperties,"$route",{enumerable:!0,get:()=>Nn(l)}),wn&&!st&&l.value===Pt&&(st=!0,A(r.location).catch(ne=>{}));const x={};for(const ne in Pt)Object.defineProperty(x,ne,{get:()=>l.value[ne],enumerable:!0});E.provide(Ui,I),E.provide(_c,gl(x)),E.provide(mi,l);const H=E.unmount;Ve.add(E),E.unmount=function(){Ve.delete(E),Ve.size<1&&(u=Pt,ie&&ie(),ie=null,l.value=Pt,st=!1,W=!1),H()}}};function Ee(E){return E.reduce((I,x)=>I.then(()=>V(x)),Promise.resolve())}return je}function Qh(t,e){const n=[],s=[],r=[],i=Math.max(e.matched.length,t.matched.length);for(let o=0;o<i;o++){const a=e.matched[o];a&&(t.matched.find(u=>Rn(u,a))?s.push(a):n.push(a));const l=t.matched[o];l&&(e.matched.find(u=>Rn(u,l))||r.push(l))}return[n,s,r]}const Jh=bt({components:{RouterView:gc}}),zt=(t,e)=>{const n=t.__vccOpts||t;for(const[s,r]of e)n[s]=r;return n},Zh={class:"container pt-4"},ep={class:"navigation"};function tp(t,e,n,s,r,i){const o=oi("router-link"),a=oi("RouterView");return B(),Y("main",Zh,[O("nav",ep,[be(o,{class:"nav-link",to:{name:"Main Page"}},{default:En(()=>e[0]||(e[0]=[it(" Home ")])),_:1}),be(o,{class:"nav-link",to:{name:"Profile page"}},{default:En(()=>e[1]||(e[1]=[it(" Profile Page ")])),_:1}),be(o,{class:"nav-link",to:{name:"User Search"}},{default:En(()=>e[2]||(e[2]=[it(" Find Users ")])),_:1}),be(o,{class:"nav-link",to:{name:"Friend Requests"}},{default:En(()=>e[3]||(e[3]=[it(" Friend Requests ")])),_:1}),be(o,{class:"nav-link",to:{name:"Friends List"}},{default:En(()=>e[4]||(e[4]=[it(" Friends ")])),_:1}),e[5]||(e[5]=O("a",{href:"/login/",class:"nav-link logout-link"}," Logout ",-1))]),be(a,{class:"flex-shrink-0"})])}const np=zt(Jh,[["render",tp],["__scopeId","data-v-ae29c586"]]),sp="/api";class rp{async request(e,n={}){var s;try{const i={"Content-Type":"application/json","X-CSRFToken":((s=document.cookie.split("; ").find(l=>l.startsWith("csrftoken=")))==null?void 0:s.split("=")[1])||"",...n.headers},o=await fetch(`${sp}${e}`,{...n,headers:i,credentials:"include"});if(!o.ok)try{const l=await o.json();return{error:l.message||l.detail||"An error occurred",status:o.status}}catch{return{error:"An error occurred",status:o.status}}return{data:await o.json(),status:o.status}}catch(r){return{error:r instanceof Error?r.message:"Network error",status:500}}}async getCurrentProfile(){return this.request("/profile/me/")}async updateProfile(e){return this.request("/profile/update_profile/",{method:"PATCH",body:JSON.stringify(e)})}async getAllHobbies(){return this.request("/hobbies/")}async createHobby(e){return this.request("/hobbies/create_hobby/",{method:"POST",body:JSON.stringify({name:e})})}async addHobbyToProfile(e){return this.request(`/hobbies/${e}/add_to_profile/`,{method:"POST"})}async removeHobbyFromProfile(e){return this.request(`/hobbies/${e}/remove_from_profile/`,{method:"POST"})}async login(e,n){const s=new FormData;return s.append("username",e),s.append("password",n),this.request("/login/",{method:"POST",body:s,headers:{"Content-Type":void 0}})}async logout(){return this.request("/logout/",{method:"POST"})}async register(e){const n=new FormData;return Object.entries(e).forEach(([s,r])=>{n.append(s,r)}),this.request("/register/",{method:"POST",body:n,headers:{"Content-Type":void 0}})}}const Ft=new rp,ip=bt({data(){return{loading:!0,error:"",username:"",profile:null}},async created(){await this.loadUserProfile()},methods:{async loadUserProfile(){try{this.loading=!0;const t=await Ft.getCurrentProfile();t.error?this.error=t.error:t.data&&(this.profile=t.data,this.username=this.profile.username)}catch{this.error="Failed to load profile"}finally{this.loading=!1}}}}),op={class:"main-page"},ap={key:0,class:"loading"},lp={key:1,class:"error"},cp={key:2};function up(t,e,n,s,r,i){return B(),Y("div",op,[t.loading?(B(),Y("div",ap,"Loading...")):t.error?(B(),Y("div",lp,ue(t.error),1)):(B(),Y("div",cp,[O("h1",null,"Hello, "+ue(t.username)+"!",1),e[0]||(e[0]=O("p",{class:"welcome-text"},"Welcome to the Hobbies App. Here you can:",-1)),e[1]||(e[1]=O("ul",{class:"features-list"},[O("li",null,"View and edit your profile"),O("li",null,"Manage your hobbies"),O("li",null,"Connect with users who share your interests"),O("li",null,"Send and receive friend requests"),O("li",null,"View your friends list")],-1))]))])}const fp=zt(ip,[["render",up],["__scopeId","data-v-f14cb4dc"]]),dp=bt({data(){return{title:"Other Page"}}}),hp={class:"h3"};function pp(t,e,n,s,r,i){return B(),Y("div",hp,ue(t.title),1)}const _p=zt(dp,[["render",pp]]),gp=Xd("user",{state:()=>({profile:null,loading:!1,error:null}),getters:{hasProfile:t=>!!t.profile,userHobbies:t=>{var e;return((e=t.profile)==null?void 0:e.hobbies)||[]}},actions:{async fetchProfile(){this.loading=!0,this.error=null;const t=await Ft.getCurrentProfile();if(t.error||!t.data){this.error=t.error||"No data received",this.loading=!1;return}this.profile=t.data,this.loading=!1},async updateProfile(t){this.loading=!0,this.error=null;const e=await Ft.updateProfile(t);return e.error||!e.data?(this.error=e.error||"No data received",this.loading=!1,!1):(this.profile=e.data,this.loading=!1,!0)}}}),mp=bt({name:"ProfileEditForm",props:{initialData:{type:Object,required:!0}},data(){return{formData:{username:this.initialData.username,email:this.initialData.email,date_of_birth:this.initialData.date_of_birth,current_password:"",new_password:""},errors:{username:"",email:"",current_password:"",new_password:""}}},methods:{async handleSubmit(){this.errors={username:"",email:"",current_password:"",new_password:""};const t={};for(const[n,s]of Object.entries(this.formData))s!==""&&s!==null&&s!==void 0&&(t[n]=s);const e=await Ft.updateProfile(t);if(e.status===200)t.new_password?(alert("Password updated successfully!"),this.formData.current_password="",this.formData.new_password=""):(this.$emit("save",this.formData),alert("Profile updated successfully!"));else if(e.error)try{const n=typeof e.error=="string"?JSON.parse(e.error):e.error;for(const s in n)this.errors.hasOwnProperty(s)&&(this.errors[s]=Array.isArray(n[s])?n[s][0]:n[s])}catch{alert("An error occurred while updating the profile")}}}}),vp={class:"section"},bp={class:"form-group"},Ep={key:0,class:"error-message"},yp={class:"form-group"},wp={key:0,class:"error-message"},Ap={class:"form-group"},Tp={class:"section"},Sp={class:"form-group"},Cp={key:0,class:"error-message"},Op={class:"form-group"},$p={key:0,class:"error-message"},Np={class:"form-actions"};function Pp(t,e,n,s,r,i){return B(),Y("form",{onSubmit:e[6]||(e[6]=Id((...o)=>t.handleSubmit&&t.handleSubmit(...o),["prevent"])),class:"edit-form"},[O("div",vp,[e[10]||(e[10]=O("h3",null,"Profile Information",-1)),O("div",bp,[e[7]||(e[7]=O("label",{for:"username"},"Username",-1)),Mt(O("input",{id:"username","onUpdate:modelValue":e[0]||(e[0]=o=>t.formData.username=o),type:"text",class:"form-control"},null,512),[[kt,t.formData.username]]),t.errors.username?(B(),Y("span",Ep,ue(t.errors.username),1)):Ht("",!0)]),O("div",yp,[e[8]||(e[8]=O("label",{for:"email"},"Email",-1)),Mt(O("input",{id:"email","onUpdate:modelValue":e[1]||(e[1]=o=>t.formData.email=o),type:"email",class:"form-control"},null,512),[[kt,t.formData.email]]),t.errors.email?(B(),Y("span",wp,ue(t.errors.email),1)):Ht("",!0)]),O("div",Ap,[e[9]||(e[9]=O("label",{for:"date_of_birth"},"Date of Birth",-1)),Mt(O("input",{id:"date_of_birth","onUpdate:modelValue":e[2]||(e[2]=o=>t.formData.date_of_birth=o),type:"date",class:"form-control"},null,512),[[kt,t.formData.date_of_birth]])])]),O("div",Tp,[e[13]||(e[13]=O("h3",null,"Change Password",-1)),O("div",Sp,[e[11]||(e[11]=O("label",{for:"current_password"},"Current Password",-1)),Mt(O("input",{id:"current_password","onUpdate:modelValue":e[3]||(e[3]=o=>t.formData.current_password=o),type:"password",class:"form-control"},null,512),[[kt,t.formData.current_password]]),t.errors.current_password?(B(),Y("span",Cp,ue(t.errors.current_password),1)):Ht("",!0)]),O("div",Op,[e[12]||(e[12]=O("label",{for:"new_password"},"New Password",-1)),Mt(O("input",{id:"new_password","onUpdate:modelValue":e[4]||(e[4]=o=>t.formData.new_password=o),type:"password",class:"form-control"},null,512),[[kt,t.formData.new_password]]),t.errors.new_password?(B(),Y("span",$p,ue(t.errors.new_password),1)):Ht("",!0)])]),O("div",Np,[e[14]||(e[14]=O("button",{type:"submit",class:"save-btn"},"Save Changes",-1)),O("button",{type:"button",onClick:e[5]||(e[5]=o=>t.$emit("cancel")),class:"cancel-btn"}," Cancel ")])],32)}const Dp=zt(mp,[["render",Pp],["__scopeId","data-v-257f55ff"]]),Rp=bt({name:"ProfilePage",components:{ProfileEditForm:Dp},data(){return{isEditing:!1,newHobby:"",hobbyError:"",availableHobbies:[],loadingHobbies:!1}},computed:{userStore(){return gp()},profile(){return this.userStore.profile},loading(){return this.userStore.loading||this.loadingHobbies},error(){return this.userStore.error}},methods:{async handleProfileUpdate(t){await this.userStore.updateProfile(t)&&(this.isEditing=!1)},async fetchHobbies(){try{this.loadingHobbies=!0;const t=await Ft.getAllHobbies();t.data&&(this.availableHobbies=t.data)}catch{this.hobbyError="Failed to load hobbies"}finally{this.loadingHobbies=!1}},async handleCreateHobby(){if(this.newHobby.trim())try{this.hobbyError="";const t=await Ft.createHobby(this.newHobby.trim());if(t.error){this.hobbyError=t.error;return}await Promise.all([this.userStore.fetchProfile(),this.fetchHobbies()]),this.newHobby=""}catch{this.hobbyError="Failed to create hobby. Please try again."}},async addHobby(t){try{this.hobbyError="";const e=await Ft.addHobbyToProfile(t);if(e.error){this.hobbyError=e.error;return}await Promise.all([this.userStore.fetchProfile(),this.fetchHobbies()])}catch{this.hobbyError="Failed to add hobby. Please try again."}},async removeHobby(t){try{this.hobbyError="";const e=await Ft.removeHobbyFromProfile(t);if(e.error){this.hobbyError=e.error;return}await Promise.all([this.userStore.fetchProfile(),this.fetchHobbies()])}catch{this.hobbyError="Failed to remove hobby. Please try again."}}},async created(){this.profile||await this.userStore.fetchProfile(),await this.fetchHobbies()}}),xp={class:"profile-page"},Lp={key:0,class:"loading"},Ip={key:1,class:"error"},Mp={key:2,class:"profile-container"},kp={key:0,class:"profile-details"},Hp={class:"detail-item"},Fp={class:"detail-item"},Vp={class:"detail-item"},jp={class:"hobbies-section"},Wp={class:"hobbies-list"},Bp=["onClick"],Kp={key:0,class:"no-hobbies"},Up={class:"available-hobbies-section"},qp={class:"hobbies-list"},Yp=["onClick"],Gp={class:"create-hobby-form"},zp=["disabled"],Xp={key:0,class:"error-message"};function Qp(t,e,n,s,r,i){var a,l,u,c,d,_;const o=oi("profile-edit-form");return B(),Y("div",xp,[t.loading?(B(),Y("div",Lp," Loading... ")):t.error?(B(),Y("div",Ip,ue(t.error),1)):(B(),Y("div",Mp,[e[10]||(e[10]=O("h1",null,"Profile",-1)),t.isEditing?(B(),Yl(o,{key:1,"initial-data":t.profile,onSave:t.handleProfileUpdate,onCancel:e[4]||(e[4]=p=>t.isEditing=!1)},null,8,["initial-data","onSave"])):(B(),Y("div",kp,[O("div",Hp,[e[5]||(e[5]=O("strong",null,"Username:",-1)),it(" "+ue((a=t.profile)==null?void 0:a.username),1)]),O("div",Fp,[e[6]||(e[6]=O("strong",null,"Email:",-1)),it(" "+ue((l=t.profile)==null?void 0:l.email),1)]),O("div",Vp,[e[7]||(e[7]=O("strong",null,"Date of Birth:",-1)),it(" "+ue((u=t.profile)!=null&&u.date_of_birth?new Date(t.profile.date_of_birth).toLocaleDateString():"Not set"),1)]),O("div",jp,[e[8]||(e[8]=O("h2",null,"My Hobbies",-1)),O("div",Wp,[(B(!0),Y($e,null,cn((c=t.profile)==null?void 0:c.hobbies,p=>(B(),Y("span",{key:p.id,class:"hobby-tag"},[it(ue(p.name)+" ",1),O("button",{onClick:v=>t.removeHobby(p.id),class:"remove-hobby-btn",title:"Remove hobby"}," × ",8,Bp)]))),128)),(_=(d=t.profile)==null?void 0:d.hobbies)!=null&&_.length?Ht("",!0):(B(),Y("span",Kp," No hobbies added yet "))])]),O("div",Up,[e[9]||(e[9]=O("h2",null,"Available Hobbies",-1)),O("div",qp,[(B(!0),Y($e,null,cn(t.availableHobbies,p=>(B(),Y("span",{key:p.id,class:or(["hobby-tag",{"hobby-added":p.user_has_hobby}])},[it(ue(p.name)+" ",1),p.user_has_hobby?Ht("",!0):(B(),Y("button",{key:0,onClick:v=>t.addHobby(p.id),class:"add-hobby-btn",title:"Add to my hobbies"}," + ",8,Yp))],2))),128))]),O("div",Gp,[Mt(O("input",{"onUpdate:modelValue":e[0]||(e[0]=p=>t.newHobby=p),type:"text",placeholder:"Create a new hobby",class:"hobby-input",onKeyup:e[1]||(e[1]=kd((...p)=>t.handleCreateHobby&&t.handleCreateHobby(...p),["enter"]))},null,544),[[kt,t.newHobby]]),O("button",{onClick:e[2]||(e[2]=(...p)=>t.handleCreateHobby&&t.handleCreateHobby(...p)),class:"create-hobby-btn",disabled:!t.newHobby.trim()}," Create Hobby ",8,zp)]),t.hobbyError?(B(),Y("p",Xp,ue(t.hobbyError),1)):Ht("",!0)]),O("button",{onClick:e[3]||(e[3]=p=>t.isEditing=!0),class:"edit-btn"}," Edit Profile ")]))]))])}const Jp=zt(Rp,[["render",Qp],["__scopeId","data-v-b18ed2e4"]]),Zp={class:"friend-requests"},e_={key:0,class:"loading"},t_={key:1,class:"error"},n_={key:2,class:"no-requests"},s_={key:3,class:"requests-list"},r_={class:"request-info"},i_={class:"user-name"},o_={class:"request-date"},a_={class:"request-actions"},l_=["onClick"],c_=["onClick"],u_=bt({__name:"FriendRequests",setup(t){const e=Re([]),n=Re(!1),s=Re(""),r=async()=>{try{n.value=!0,s.value="";const o=await fetch("/api/friend-requests/pending/");if(!o.ok)throw new Error("Failed to fetch requests");const a=await o.json();e.value=a}catch(o){s.value="Error fetching friend requests",console.error("Error:",o)}finally{n.value=!1}},i=async(o,a)=>{var l;try{const u=(l=document.cookie.split("; ").find(d=>d.startsWith("csrftoken=")))==null?void 0:l.split("=")[1];if(!u)throw new Error("CSRF token not found");const c=await fetch(`/api/friend-requests/${o}/${a}/`,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":u},credentials:"include"});if(!c.ok){const d=await c.json();throw new Error(d.error||`Failed to ${a} request`)}e.value=e.value.filter(d=>d.id!==o)}catch(u){s.value=u instanceof Error?u.message:`Error ${a}ing friend request`,console.error("Error:",u),setTimeout(()=>{s.value=""},3e3)}};return ur(()=>{r()}),(o,a)=>(B(),Y("div",Zp,[a[0]||(a[0]=O("div",{class:"header"},[O("h2",null,"Friend Requests")],-1)),n.value?(B(),Y("div",e_," Loading friend requests... ")):s.value?(B(),Y("div",t_,ue(s.value),1)):e.value.length===0?(B(),Y("div",n_," No pending friend requests ")):(B(),Y("div",s_,[(B(!0),Y($e,null,cn(e.value,l=>(B(),Y("div",{key:l.id,class:"request-item"},[O("div",r_,[O("span",i_,ue(l.sender_username),1),O("span",o_,ue(new Date(l.created_at).toLocaleDateString()),1)]),O("div",a_,[O("button",{onClick:u=>i(l.id,"accept"),class:"accept-btn"}," Accept ",8,l_),O("button",{onClick:u=>i(l.id,"reject"),class:"reject-btn"}," Reject ",8,c_)])]))),128))]))]))}}),f_=zt(u_,[["__scopeId","data-v-7f4cb852"]]),d_={class:"friends-list"},h_={key:0,class:"no-friends"},p_={key:1,class:"friends-grid"},__={class:"friend-header"},g_={class:"age"},m_={class:"hobbies"},v_={class:"hobby-tags"},b_=["onClick"],E_=bt({__name:"FriendsList",setup(t){const e=Re([]),n=async()=>{try{const i=await fetch("/api/friend-requests/friends/");if(!i.ok)throw new Error("Failed to fetch friends");e.value=await i.json()}catch(i){console.error("Error fetching friends:",i)}},s=async i=>{var o;try{const a=(o=document.cookie.split("; ").find(u=>u.startsWith("csrftoken=")))==null?void 0:o.split("=")[1];if(!a)throw new Error("CSRF token not found");const l=await fetch("/api/friend-requests/unfollow/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":a},body:JSON.stringify({user_id:i}),credentials:"include"});if(!l.ok){const u=await l.json();throw new Error(u.error||"Failed to unfollow friend")}e.value=e.value.filter(u=>u.id!==i)}catch(a){console.error("Error unfollowing friend:",a)}},r=i=>{const o=new Date,a=new Date(i);let l=o.getFullYear()-a.getFullYear();const u=o.getMonth()-a.getMonth();return(u<0||u===0&&o.getDate()<a.getDate())&&l--,l};return ur(()=>{n()}),(i,o)=>(B(),Y("div",d_,[o[1]||(o[1]=O("h2",null,"My Friends",-1)),e.value.length===0?(B(),Y("div",h_," You haven't added any friends yet ")):(B(),Y("div",p_,[(B(!0),Y($e,null,cn(e.value,a=>(B(),Y("div",{key:a.id,class:"friend-card"},[O("div",__,[O("h3",null,ue(a.username),1),O("span",g_,ue(r(a.date_of_birth))+" years old",1)]),O("div",m_,[o[0]||(o[0]=O("h4",null,"Hobbies:",-1)),O("div",v_,[(B(!0),Y($e,null,cn(a.hobbies,l=>(B(),Y("span",{key:l.id,class:"hobby-tag"},ue(l.name),1))),128))])]),O("button",{onClick:l=>s(a.id),class:"unfollow-btn"}," Unfollow ",8,b_)]))),128))]))]))}}),y_=zt(E_,[["__scopeId","data-v-55c12fb2"]]),w_={class:"user-search"},A_={class:"filters"},T_={class:"age-filter"},S_={class:"age-inputs"},C_={key:0,class:"loading"},O_={key:1,class:"error"},$_={key:2,class:"users-list"},N_={key:0,class:"no-results"},P_={key:1,class:"user-cards"},D_={class:"user-info"},R_={class:"user-details"},x_={class:"detail-row"},L_={class:"detail-value"},I_={class:"hobbies-section"},M_={class:"hobby-tags"},k_=["onClick"],H_={key:1,class:"friend-request-btn pending-btn",disabled:""},F_=["onClick","disabled"],V_={key:2,class:"pagination"},j_=["disabled"],W_={class:"page-info"},B_=["disabled"],K_=bt({__name:"UserSearch",setup(t){const e=Re([]),n=Re(!1),s=Re(""),r=Re(""),i=Re(""),o=Re(1),a=Re(1),l=Re(0),u=async()=>{try{n.value=!0,s.value="";const p=new URLSearchParams;r.value&&p.append("min_age",r.value),i.value&&p.append("max_age",i.value),p.append("page",o.value.toString());const v=await fetch(`/api/profile/search_users/?${p.toString()}`);if(!v.ok)throw new Error("Failed to fetch users");const m=await v.json();e.value=m.users,a.value=m.total_pages,l.value=m.total_users,o.value=m.current_page}catch(p){s.value="Error fetching users",console.error("Error:",p)}finally{n.value=!1}},c=async p=>{var v;try{const m=(v=document.cookie.split("; ").find(R=>R.startsWith("csrftoken=")))==null?void 0:v.split("=")[1];if(!m)throw new Error("CSRF token not found");const C=await fetch("/api/friend-requests/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":m},body:JSON.stringify({receiver:p}),credentials:"include"}),D=await C.json();if(!C.ok)throw new Error(D.error||"Failed to send friend request");const $=e.value.find(R=>R.id===p);$&&($.has_pending_request=!0,$.friend_request_sent=!0)}catch(m){const C=m instanceof Error?m.message:"Error sending friend request";s.value=C,setTimeout(()=>{s.value=""},3e3),console.error("Error:",m)}},d=async p=>{var v;try{const m=(v=document.cookie.split("; ").find($=>$.startsWith("csrftoken=")))==null?void 0:v.split("=")[1];if(!m)throw new Error("CSRF token not found");const C=await fetch("/api/friend-requests/unfollow/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":m},body:JSON.stringify({user_id:p}),credentials:"include"});if(!C.ok){const $=await C.json();throw new Error($.error||"Failed to unfollow user")}const D=e.value.find($=>$.id===p);D&&(D.is_friend=!1)}catch(m){const C=m instanceof Error?m.message:"Error unfollowing user";s.value=C,setTimeout(()=>{s.value=""},3e3),console.error("Error:",m)}},_=p=>{o.value=p,u()};return ur(()=>{u()}),(p,v)=>(B(),Y("div",w_,[v[7]||(v[7]=O("h2",null,"Find Users with Similar Hobbies",-1)),O("div",A_,[O("div",T_,[v[5]||(v[5]=O("label",null,"Age Range:",-1)),O("div",S_,[Mt(O("input",{type:"number","onUpdate:modelValue":v[0]||(v[0]=m=>r.value=m),placeholder:"Min age",min:"0",max:"150"},null,512),[[kt,r.value]]),v[4]||(v[4]=O("span",null,"to",-1)),Mt(O("input",{type:"number","onUpdate:modelValue":v[1]||(v[1]=m=>i.value=m),placeholder:"Max age",min:"0",max:"150"},null,512),[[kt,i.value]]),O("button",{onClick:u,class:"filter-btn"},"Apply Filters")])])]),n.value?(B(),Y("div",C_," Loading users... ")):s.value?(B(),Y("div",O_,ue(s.value),1)):(B(),Y("div",$_,[e.value.length===0?(B(),Y("div",N_," No users found with similar hobbies ")):(B(),Y("div",P_,[(B(!0),Y($e,null,cn(e.value,m=>(B(),Y("div",{key:m.id,class:"user-card"},[O("div",D_,[O("h3",null,ue(m.username),1)]),O("div",R_,[O("div",x_,[v[6]||(v[6]=O("span",{class:"detail-label"},"Age:",-1)),O("span",L_,ue(m.age||"Not specified"),1)])]),O("div",I_,[O("h4",null,"Common Hobbies ("+ue(m.common_hobbies_count)+"):",1),O("div",M_,[(B(!0),Y($e,null,cn(m.hobbies,C=>(B(),Y("span",{key:C.id,class:"hobby-tag"},ue(C.name),1))),128))])]),m.is_friend?(B(),Y("button",{key:0,onClick:C=>d(m.id),class:"friend-request-btn unfollow-btn"}," Unfollow ",8,k_)):m.has_pending_request?(B(),Y("button",H_," Pending Request ")):(B(),Y("button",{key:2,onClick:C=>c(m.id),class:"friend-request-btn",disabled:m.friend_request_sent},ue(m.friend_request_sent?"Friend Request Sent":"Send Friend Request"),9,F_))]))),128))])),a.value>1?(B(),Y("div",V_,[O("button",{onClick:v[2]||(v[2]=m=>_(o.value-1)),disabled:o.value===1,class:"page-btn"}," Previous ",8,j_),O("span",W_,"Page "+ue(o.value)+" of "+ue(a.value),1),O("button",{onClick:v[3]||(v[3]=m=>_(o.value+1)),disabled:o.value===a.value,class:"page-btn"}," Next ",8,B_)])):Ht("",!0)]))]))}}),U_=zt(K_,[["__scopeId","data-v-d02c34e0"]]);let q_="";const Y_=Xh({history:Oh(q_),routes:[{path:"/",name:"Main Page",component:fp},{path:"/other/",name:"Other Page",component:_p},{path:"/profile/",name:"Profile page",component:Jp},{path:"/friend-requests/",name:"Friend Requests",component:f_},{path:"/friends/",name:"Friends List",component:y_},{path:"/search/",name:"User Search",component:U_}]});var Le="top",Ye="bottom",Ge="right",Ie="left",gr="auto",jn=[Le,Ye,Ge,Ie],fn="start",Ln="end",mc="clippingParents",qi="viewport",An="popper",vc="reference",vi=jn.reduce(function(t,e){return t.concat([e+"-"+fn,e+"-"+Ln])},[]),Yi=[].concat(jn,[gr]).reduce(function(t,e){return t.concat([e,e+"-"+fn,e+"-"+Ln])},[]),bc="beforeRead",Ec="read",yc="afterRead",wc="beforeMain",Ac="main",Tc="afterMain",Sc="beforeWrite",Cc="write",Oc="afterWrite",$c=[bc,Ec,yc,wc,Ac,Tc,Sc,Cc,Oc];function vt(t){return t?(t.nodeName||"").toLowerCase():null}function ze(t){if(t==null)return window;if(t.toString()!=="[object Window]"){var e=t.ownerDocument;return e&&e.defaultView||window}return t}function dn(t){var e=ze(t).Element;return t instanceof e||t instanceof Element}function Je(t){var e=ze(t).HTMLElement;return t instanceof e||t instanceof HTMLElement}function Gi(t){if(typeof ShadowRoot>"u")return!1;var e=ze(t).ShadowRoot;return t instanceof e||t instanceof ShadowRoot}function G_(t){var e=t.state;Object.keys(e.elements).forEach(function(n){var s=e.styles[n]||{},r=e.attributes[n]||{},i=e.elements[n];!Je(i)||!vt(i)||(Object.assign(i.style,s),Object.keys(r).forEach(function(o){var a=r[o];a===!1?i.removeAttribute(o):i.setAttribute(o,a===!0?"":a)}))})}function z_(t){var e=t.state,n={popper:{position:e.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(e.elements.popper.style,n.popper),e.styles=n,e.elements.arrow&&Object.assign(e.elements.arrow.style,n.arrow),function(){Object.keys(e.elements).forEach(function(s){var r=e.elements[s],i=e.attributes[s]||{},o=Object.keys(e.styles.hasOwnProperty(s)?e.styles[s]:n[s]),a=o.reduce(function(l,u){return l[u]="",l},{});!Je(r)||!vt(r)||(Object.assign(r.style,a),Object.keys(i).forEach(function(l){r.removeAttribute(l)}))})}}const zi={name:"applyStyles",enabled:!0,phase:"write",fn:G_,effect:z_,requires:["computeStyles"]};function _t(t){return t.split("-")[0]}var an=Math.max,Qs=Math.min,In=Math.round;function bi(){var t=navigator.userAgentData;return t!=null&&t.brands&&Array.isArray(t.brands)?t.brands.map(function(e){return e.brand+"/"+e.version}).join(" "):navigator.userAgent}function Nc(){return!/^((?!chrome|android).)*safari/i.test(bi())}function Mn(t,e,n){e===void 0&&(e=!1),n===void 0&&(n=!1);var s=t.getBoundingClientRect(),r=1,i=1;e&&Je(t)&&(r=t.offsetWidth>0&&In(s.width)/t.offsetWidth||1,i=t.offsetHeight>0&&In(s.height)/t.offsetHeight||1);var o=dn(t)?ze(t):window,a=o.visualViewport,l=!Nc()&&n,u=(s.left+(l&&a?a.offsetLeft:0))/r,c=(s.top+(l&&a?a.offsetTop:0))/i,d=s.width/r,_=s.height/i;return{width:d,height:_,top:c,right:u+d,bottom:c+_,left:u,x:u,y:c}}function Xi(t){var e=Mn(t),n=t.offsetWidth,s=t.offsetHeight;return Math.abs(e.width-n)<=1&&(n=e.width),Math.abs(e.height-s)<=1&&(s=e.height),{x:t.offsetLeft,y:t.offsetTop,width:n,height:s}}function Pc(t,e){var n=e.getRootNode&&e.getRootNode();if(t.contains(e))return!0;if(n&&Gi(n)){var s=e;do{if(s&&t.isSameNode(s))return!0;s=s.parentNode||s.host}while(s)}return!1}function Ot(t){return ze(t).getComputedStyle(t)}function X_(t){return["table","td","th"].indexOf(vt(t))>=0}function Xt(t){return((dn(t)?t.ownerDocument:t.document)||window.document).documentElement}function mr(t){return vt(t)==="html"?t:t.assignedSlot||t.parentNode||(Gi(t)?t.host:null)||Xt(t)}function ca(t){return!Je(t)||Ot(t).position==="fixed"?null:t.offsetParent}function Q_(t){var e=/firefox/i.test(bi()),n=/Trident/i.test(bi());if(n&&Je(t)){var s=Ot(t);if(s.position==="fixed")return null}var r=mr(t);for(Gi(r)&&(r=r.host);Je(r)&&["html","body"].indexOf(vt(r))<0;){var i=Ot(r);if(i.transform!=="none"||i.perspective!=="none"||i.contain==="paint"||["transform","perspective"].indexOf(i.willChange)!==-1||e&&i.willChange==="filter"||e&&i.filter&&i.filter!=="none")return r;r=r.parentNode}return null}function ys(t){for(var e=ze(t),n=ca(t);n&&X_(n)&&Ot(n).position==="static";)n=ca(n);return n&&(vt(n)==="html"||vt(n)==="body"&&Ot(n).position==="static")?e:n||Q_(t)||e}function Qi(t){return["top","bottom"].indexOf(t)>=0?"x":"y"}function ls(t,e,n){return an(t,Qs(e,n))}function J_(t,e,n){var s=ls(t,e,n);return s>n?n:s}function Dc(){return{top:0,right:0,bottom:0,left:0}}function Rc(t){return Object.assign({},Dc(),t)}function xc(t,e){return e.reduce(function(n,s){return n[s]=t,n},{})}var Z_=function(e,n){return e=typeof e=="function"?e(Object.assign({},n.rects,{placement:n.placement})):e,Rc(typeof e!="number"?e:xc(e,jn))};function eg(t){var e,n=t.state,s=t.name,r=t.options,i=n.elements.arrow,o=n.modifiersData.popperOffsets,a=_t(n.placement),l=Qi(a),u=[Ie,Ge].indexOf(a)>=0,c=u?"height":"width";if(!(!i||!o)){var d=Z_(r.padding,n),_=Xi(i),p=l==="y"?Le:Ie,v=l==="y"?Ye:Ge,m=n.rects.reference[c]+n.rects.reference[l]-o[l]-n.rects.popper[c],C=o[l]-n.rects.reference[l],D=ys(i),$=D?l==="y"?D.clientHeight||0:D.clientWidth||0:0,R=m/2-C/2,A=d[p],k=$-_[c]-d[v],z=$/2-_[c]/2+R,U=ls(A,z,k),j=l;n.modifiersData[s]=(e={},e[j]=U,e.centerOffset=U-z,e)}}function tg(t){var e=t.state,n=t.options,s=n.element,r=s===void 0?"[data-popper-arrow]":s;r!=null&&(typeof r=="string"&&(r=e.elements.popper.querySelector(r),!r)||Pc(e.elements.popper,r)&&(e.elements.arrow=r))}const Lc={name:"arrow",enabled:!0,phase:"main",fn:eg,effect:tg,requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function kn(t){return t.split("-")[1]}var ng={top:"auto",right:"auto",bottom:"auto",left:"auto"};function sg(t,e){var n=t.x,s=t.y,r=e.devicePixelRatio||1;return{x:In(n*r)/r||0,y:In(s*r)/r||0}}function ua(t){var e,n=t.popper,s=t.popperRect,r=t.placement,i=t.variation,o=t.offsets,a=t.position,l=t.gpuAcceleration,u=t.adaptive,c=t.roundOffsets,d=t.isFixed,_=o.x,p=_===void 0?0:_,v=o.y,m=v===void 0?0:v,C=typeof c=="function"?c({x:p,y:m}):{x:p,y:m};p=C.x,m=C.y;var D=o.hasOwnProperty("x"),$=o.hasOwnProperty("y"),R=Ie,A=Le,k=window;if(u){var z=ys(n),U="clientHeight",j="clientWidth";if(z===ze(n)&&(z=Xt(n),Ot(z).position!=="static"&&a==="absolute"&&(U="scrollHeight",j="scrollWidth")),z=z,r===Le||(r===Ie||r===Ge)&&i===Ln){A=Ye;var V=d&&z===k&&k.visualViewport?k.visualViewport.height:z[U];m-=V-s.height,m*=l?1:-1}if(r===Ie||(r===Le||r===Ye)&&i===Ln){R=Ge;var Q=d&&z===k&&k.visualViewport?k.visualViewport.width:z[j];p-=Q-s.width,p*=l?1:-1}}var se=Object.assign({position:a},u&&ng),he=c===!0?sg({x:p,y:m},ze(n)):{x:p,y:m};if(p=he.x,m=he.y,l){var ie;return Object.assign({},se,(ie={},ie[A]=$?"0":"",ie[R]=D?"0":"",ie.transform=(k.devicePixelRatio||1)<=1?"translate("+p+"px, "+m+"px)":"translate3d("+p+"px, "+m+"px, 0)",ie))}return Object.assign({},se,(e={},e[A]=$?m+"px":"",e[R]=D?p+"px":"",e.transform="",e))}function rg(t){var e=t.state,n=t.options,s=n.gpuAcceleration,r=s===void 0?!0:s,i=n.adaptive,o=i===void 0?!0:i,a=n.roundOffsets,l=a===void 0?!0:a,u={placement:_t(e.placement),variation:kn(e.placement),popper:e.elements.popper,popperRect:e.rects.popper,gpuAcceleration:r,isFixed:e.options.strategy==="fixed"};e.modifiersData.popperOffsets!=null&&(e.styles.popper=Object.assign({},e.styles.popper,ua(Object.assign({},u,{offsets:e.modifiersData.popperOffsets,position:e.options.strategy,adaptive:o,roundOffsets:l})))),e.modifiersData.arrow!=null&&(e.styles.arrow=Object.assign({},e.styles.arrow,ua(Object.assign({},u,{offsets:e.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:l})))),e.attributes.popper=Object.assign({},e.attributes.popper,{"data-popper-placement":e.placement})}const Ji={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:rg,data:{}};var Ns={passive:!0};function ig(t){var e=t.state,n=t.instance,s=t.options,r=s.scroll,i=r===void 0?!0:r,o=s.resize,a=o===void 0?!0:o,l=ze(e.elements.popper),u=[].concat(e.scrollParents.reference,e.scrollParents.popper);return i&&u.forEach(function(c){c.addEventListener("scroll",n.update,Ns)}),a&&l.addEventListener("resize",n.update,Ns),function(){i&&u.forEach(function(c){c.removeEventListener("scroll",n.update,Ns)}),a&&l.removeEventListener("resize",n.update,Ns)}}const Zi={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:ig,data:{}};var og={left:"right",right:"left",bottom:"top",top:"bottom"};function Vs(t){return t.replace(/left|right|bottom|top/g,function(e){return og[e]})}var ag={start:"end",end:"start"};function fa(t){return t.replace(/start|end/g,function(e){return ag[e]})}function eo(t){var e=ze(t),n=e.pageXOffset,s=e.pageYOffset;return{scrollLeft:n,scrollTop:s}}function to(t){return Mn(Xt(t)).left+eo(t).scrollLeft}function lg(t,e){var n=ze(t),s=Xt(t),r=n.visualViewport,i=s.clientWidth,o=s.clientHeight,a=0,l=0;if(r){i=r.width,o=r.height;var u=Nc();(u||!u&&e==="fixed")&&(a=r.offsetLeft,l=r.offsetTop)}return{width:i,height:o,x:a+to(t),y:l}}function cg(t){var e,n=Xt(t),s=eo(t),r=(e=t.ownerDocument)==null?void 0:e.body,i=an(n.scrollWidth,n.clientWidth,r?r.scrollWidth:0,r?r.clientWidth:0),o=an(n.scrollHeight,n.clientHeight,r?r.scrollHeight:0,r?r.clientHeight:0),a=-s.scrollLeft+to(t),l=-s.scrollTop;return Ot(r||n).direction==="rtl"&&(a+=an(n.clientWidth,r?r.clientWidth:0)-i),{width:i,height:o,x:a,y:l}}function no(t){var e=Ot(t),n=e.overflow,s=e.overflowX,r=e.overflowY;return/auto|scroll|overlay|hidden/.test(n+r+s)}function Ic(t){return["html","body","#document"].indexOf(vt(t))>=0?t.ownerDocument.body:Je(t)&&no(t)?t:Ic(mr(t))}function cs(t,e){var n;e===void 0&&(e=[]);var s=Ic(t),r=s===((n=t.ownerDocument)==null?void 0:n.body),i=ze(s),o=r?[i].concat(i.visualViewport||[],no(s)?s:[]):s,a=e.concat(o);return r?a:a.concat(cs(mr(o)))}function Ei(t){return Object.assign({},t,{left:t.x,top:t.y,right:t.x+t.width,bottom:t.y+t.height})}function ug(t,e){var n=Mn(t,!1,e==="fixed");return n.top=n.top+t.clientTop,n.left=n.left+t.clientLeft,n.bottom=n.top+t.clientHeight,n.right=n.left+t.clientWidth,n.width=t.clientWidth,n.height=t.clientHeight,n.x=n.left,n.y=n.top,n}function da(t,e,n){return e===qi?Ei(lg(t,n)):dn(e)?ug(e,n):Ei(cg(Xt(t)))}function fg(t){var e=cs(mr(t)),n=["absolute","fixed"].indexOf(Ot(t).position)>=0,s=n&&Je(t)?ys(t):t;return dn(s)?e.filter(function(r){return dn(r)&&Pc(r,s)&&vt(r)!=="body"}):[]}function dg(t,e,n,s){var r=e==="clippingParents"?fg(t):[].concat(e),i=[].concat(r,[n]),o=i[0],a=i.reduce(function(l,u){var c=da(t,u,s);return l.top=an(c.top,l.top),l.right=Qs(c.right,l.right),l.bottom=Qs(c.bottom,l.bottom),l.left=an(c.left,l.left),l},da(t,o,s));return a.width=a.right-a.left,a.height=a.bottom-a.top,a.x=a.left,a.y=a.top,a}function Mc(t){var e=t.reference,n=t.element,s=t.placement,r=s?_t(s):null,i=s?kn(s):null,o=e.x+e.width/2-n.width/2,a=e.y+e.height/2-n.height/2,l;switch(r){case Le:l={x:o,y:e.y-n.height};break;case Ye:l={x:o,y:e.y+e.height};break;case Ge:l={x:e.x+e.width,y:a};break;case Ie:l={x:e.x-n.width,y:a};break;default:l={x:e.x,y:e.y}}var u=r?Qi(r):null;if(u!=null){var c=u==="y"?"height":"width";switch(i){case fn:l[u]=l[u]-(e[c]/2-n[c]/2);break;case Ln:l[u]=l[u]+(e[c]/2-n[c]/2);break}}return l}function Hn(t,e){e===void 0&&(e={});var n=e,s=n.placement,r=s===void 0?t.placement:s,i=n.strategy,o=i===void 0?t.strategy:i,a=n.boundary,l=a===void 0?mc:a,u=n.rootBoundary,c=u===void 0?qi:u,d=n.elementContext,_=d===void 0?An:d,p=n.altBoundary,v=p===void 0?!1:p,m=n.padding,C=m===void 0?0:m,D=Rc(typeof C!="number"?C:xc(C,jn)),$=_===An?vc:An,R=t.rects.popper,A=t.elements[v?$:_],k=dg(dn(A)?A:A.contextElement||Xt(t.elements.popper),l,c,o),z=Mn(t.elements.reference),U=Mc({reference:z,element:R,strategy:"absolute",placement:r}),j=Ei(Object.assign({},R,U)),V=_===An?j:z,Q={top:k.top-V.top+D.top,bottom:V.bottom-k.bottom+D.bottom,left:k.left-V.left+D.left,right:V.right-k.right+D.right},se=t.modifiersData.offset;if(_===An&&se){var he=se[r];Object.keys(Q).forEach(function(ie){var Ne=[Ge,Ye].indexOf(ie)>=0?1:-1,Te=[Le,Ye].indexOf(ie)>=0?"y":"x";Q[ie]+=he[Te]*Ne})}return Q}function hg(t,e){e===void 0&&(e={});var n=e,s=n.placement,r=n.boundary,i=n.rootBoundary,o=n.padding,a=n.flipVariations,l=n.allowedAutoPlacements,u=l===void 0?Yi:l,c=kn(s),d=c?a?vi:vi.filter(function(v){return kn(v)===c}):jn,_=d.filter(function(v){return u.indexOf(v)>=0});_.length===0&&(_=d);var p=_.reduce(function(v,m){return v[m]=Hn(t,{placement:m,boundary:r,rootBoundary:i,padding:o})[_t(m)],v},{});return Object.keys(p).sort(function(v,m){return p[v]-p[m]})}function pg(t){if(_t(t)===gr)return[];var e=Vs(t);return[fa(t),e,fa(e)]}function _g(t){var e=t.state,n=t.options,s=t.name;if(!e.modifiersData[s]._skip){for(var r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,a=o===void 0?!0:o,l=n.fallbackPlacements,u=n.padding,c=n.boundary,d=n.rootBoundary,_=n.altBoundary,p=n.flipVariations,v=p===void 0?!0:p,m=n.allowedAutoPlacements,C=e.options.placement,D=_t(C),$=D===C,R=l||($||!v?[Vs(C)]:pg(C)),A=[C].concat(R).reduce(function(Ve,je){return Ve.concat(_t(je)===gr?hg(e,{placement:je,boundary:c,rootBoundary:d,padding:u,flipVariations:v,allowedAutoPlacements:m}):je)},[]),k=e.rects.reference,z=e.rects.popper,U=new Map,j=!0,V=A[0],Q=0;Q<A.length;Q++){var se=A[Q],he=_t(se),ie=kn(se)===fn,Ne=[Le,Ye].indexOf(he)>=0,Te=Ne?"width":"height",Z=Hn(e,{placement:se,boundary:c,rootBoundary:d,altBoundary:_,padding:u}),W=Ne?ie?Ge:Ie:ie?Ye:Le;k[Te]>z[Te]&&(W=Vs(W));var te=Vs(W),we=[];if(i&&we.push(Z[he]<=0),a&&we.push(Z[W]<=0,Z[te]<=0),we.every(function(Ve){return Ve})){V=se,j=!1;break}U.set(se,we)}if(j)for(var Fe=v?3:1,Me=function(je){var Ee=A.find(function(E){var I=U.get(E);if(I)return I.slice(0,je).every(function(x){return x})});if(Ee)return V=Ee,"break"},me=Fe;me>0;me--){var st=Me(me);if(st==="break")break}e.placement!==V&&(e.modifiersData[s]._skip=!0,e.placement=V,e.reset=!0)}}const kc={name:"flip",enabled:!0,phase:"main",fn:_g,requiresIfExists:["offset"],data:{_skip:!1}};function ha(t,e,n){return n===void 0&&(n={x:0,y:0}),{top:t.top-e.height-n.y,right:t.right-e.width+n.x,bottom:t.bottom-e.height+n.y,left:t.left-e.width-n.x}}function pa(t){return[Le,Ge,Ye,Ie].some(function(e){return t[e]>=0})}function gg(t){var e=t.state,n=t.name,s=e.rects.reference,r=e.rects.popper,i=e.modifiersData.preventOverflow,o=Hn(e,{elementContext:"reference"}),a=Hn(e,{altBoundary:!0}),l=ha(o,s),u=ha(a,r,i),c=pa(l),d=pa(u);e.modifiersData[n]={referenceClippingOffsets:l,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:d},e.attributes.popper=Object.assign({},e.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":d})}const Hc={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:gg};function mg(t,e,n){var s=_t(t),r=[Ie,Le].indexOf(s)>=0?-1:1,i=typeof n=="function"?n(Object.assign({},e,{placement:t})):n,o=i[0],a=i[1];return o=o||0,a=(a||0)*r,[Ie,Ge].indexOf(s)>=0?{x:a,y:o}:{x:o,y:a}}function vg(t){var e=t.state,n=t.options,s=t.name,r=n.offset,i=r===void 0?[0,0]:r,o=Yi.reduce(function(c,d){return c[d]=mg(d,e.rects,i),c},{}),a=o[e.placement],l=a.x,u=a.y;e.modifiersData.popperOffsets!=null&&(e.modifiersData.popperOffsets.x+=l,e.modifiersData.popperOffsets.y+=u),e.modifiersData[s]=o}const Fc={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:vg};function bg(t){var e=t.state,n=t.name;e.modifiersData[n]=Mc({reference:e.rects.reference,element:e.rects.popper,strategy:"absolute",placement:e.placement})}const so={name:"popperOffsets",enabled:!0,phase:"read",fn:bg,data:{}};function Eg(t){return t==="x"?"y":"x"}function yg(t){var e=t.state,n=t.options,s=t.name,r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,a=o===void 0?!1:o,l=n.boundary,u=n.rootBoundary,c=n.altBoundary,d=n.padding,_=n.tether,p=_===void 0?!0:_,v=n.tetherOffset,m=v===void 0?0:v,C=Hn(e,{boundary:l,rootBoundary:u,padding:d,altBoundary:c}),D=_t(e.placement),$=kn(e.placement),R=!$,A=Qi(D),k=Eg(A),z=e.modifiersData.popperOffsets,U=e.rects.reference,j=e.rects.popper,V=typeof m=="function"?m(Object.assign({},e.rects,{placement:e.placement})):m,Q=typeof V=="number"?{mainAxis:V,altAxis:V}:Object.assign({mainAxis:0,altAxis:0},V),se=e.modifiersData.offset?e.modifiersData.offset[e.placement]:null,he={x:0,y:0};if(z){if(i){var ie,Ne=A==="y"?Le:Ie,Te=A==="y"?Ye:Ge,Z=A==="y"?"height":"width",W=z[A],te=W+C[Ne],we=W-C[Te],Fe=p?-j[Z]/2:0,Me=$===fn?U[Z]:j[Z],me=$===fn?-j[Z]:-U[Z],st=e.elements.arrow,Ve=p&&st?Xi(st):{width:0,height:0},je=e.modifiersData["arrow#persistent"]?e.modifiersData["arrow#persistent"].padding:Dc(),Ee=je[Ne],E=je[Te],I=ls(0,U[Z],Ve[Z]),x=R?U[Z]/2-Fe-I-Ee-Q.mainAxis:Me-I-Ee-Q.mainAxis,H=R?-U[Z]/2+Fe+I+E+Q.mainAxis:me+I+E+Q.mainAxis,ne=e.elements.arrow&&ys(e.elements.arrow),pe=ne?A==="y"?ne.clientTop||0:ne.clientLeft||0:0,f=(ie=se==null?void 0:se[A])!=null?ie:0,h=W+x-f-pe,g=W+H-f,y=ls(p?Qs(te,h):te,W,p?an(we,g):we);z[A]=y,he[A]=y-W}if(a){var b,T=A==="x"?Le:Ie,L=A==="x"?Ye:Ge,N=z[k],P=k==="y"?"height":"width",S=N+C[T],q=N-C[L],M=[Le,Ie].indexOf(D)!==-1,F=(b=se==null?void 0:se[k])!=null?b:0,G=M?S:N-U[P]-j[P]-F+Q.altAxis,ee=M?N+U[P]+j[P]-F-Q.altAxis:q,ae=p&&M?J_(G,N,ee):ls(p?G:S,N,p?ee:q);z[k]=ae,he[k]=ae-N}e.modifiersData[s]=he}}const Vc={name:"preventOverflow",enabled:!0,phase:"main",fn:yg,requiresIfExists:["offset"]};function wg(t){return{scrollLeft:t.scrollLeft,scrollTop:t.scrollTop}}function Ag(t){return t===ze(t)||!Je(t)?eo(t):wg(t)}function Tg(t){var e=t.getBoundingClientRect(),n=In(e.width)/t.offsetWidth||1,s=In(e.height)/t.offsetHeight||1;return n!==1||s!==1}function Sg(t,e,n){n===void 0&&(n=!1);var s=Je(e),r=Je(e)&&Tg(e),i=Xt(e),o=Mn(t,r,n),a={scrollLeft:0,scrollTop:0},l={x:0,y:0};return(s||!s&&!n)&&((vt(e)!=="body"||no(i))&&(a=Ag(e)),Je(e)?(l=Mn(e,!0),l.x+=e.clientLeft,l.y+=e.clientTop):i&&(l.x=to(i))),{x:o.left+a.scrollLeft-l.x,y:o.top+a.scrollTop-l.y,width:o.width,height:o.height}}function Cg(t){var e=new Map,n=new Set,s=[];t.forEach(function(i){e.set(i.name,i)});function r(i){n.add(i.name);var o=[].concat(i.requires||[],i.requiresIfExists||[]);o.forEach(function(a){if(!n.has(a)){var l=e.get(a);l&&r(l)}}),s.push(i)}return t.forEach(function(i){n.has(i.name)||r(i)}),s}function Og(t){var e=Cg(t);return $c.reduce(function(n,s){return n.concat(e.filter(function(r){return r.phase===s}))},[])}function $g(t){var e;return function(){return e||(e=new Promise(function(n){Promise.resolve().then(function(){e=void 0,n(t())})})),e}}function Ng(t){var e=t.reduce(function(n,s){var r=n[s.name];return n[s.name]=r?Object.assign({},r,s,{options:Object.assign({},r.options,s.options),data:Object.assign({},r.data,s.data)}):s,n},{});return Object.keys(e).map(function(n){return e[n]})}var _a={placement:"bottom",modifiers:[],strategy:"absolute"};function ga(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return!e.some(function(s){return!(s&&typeof s.getBoundingClientRect=="function")})}function vr(t){t===void 0&&(t={});var e=t,n=e.defaultModifiers,s=n===void 0?[]:n,r=e.defaultOptions,i=r===void 0?_a:r;return function(a,l,u){u===void 0&&(u=i);var c={placement:"bottom",orderedModifiers:[],options:Object.assign({},_a,i),modifiersData:{},elements:{reference:a,popper:l},attributes:{},styles:{}},d=[],_=!1,p={state:c,setOptions:function(D){var $=typeof D=="function"?D(c.options):D;m(),c.options=Object.assign({},i,c.options,$),c.scrollParents={reference:dn(a)?cs(a):a.contextElement?cs(a.contextElement):[],popper:cs(l)};var R=Og(Ng([].concat(s,c.options.modifiers)));return c.orderedModifiers=R.filter(function(A){return A.enabled}),v(),p.update()},forceUpdate:function(){if(!_){var D=c.elements,$=D.reference,R=D.popper;if(ga($,R)){c.rects={reference:Sg($,ys(R),c.options.strategy==="fixed"),popper:Xi(R)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach(function(Q){return c.modifiersData[Q.name]=Object.assign({},Q.data)});for(var A=0;A<c.orderedModifiers.length;A++){if(c.reset===!0){c.reset=!1,A=-1;continue}var k=c.orderedModifiers[A],z=k.fn,U=k.options,j=U===void 0?{}:U,V=k.name;typeof z=="function"&&(c=z({state:c,options:j,name:V,instance:p})||c)}}}},update:$g(function(){return new Promise(function(C){p.forceUpdate(),C(c)})}),destroy:function(){m(),_=!0}};if(!ga(a,l))return p;p.setOptions(u).then(function(C){!_&&u.onFirstUpdate&&u.onFirstUpdate(C)});function v(){c.orderedModifiers.forEach(function(C){var D=C.name,$=C.options,R=$===void 0?{}:$,A=C.effect;if(typeof A=="function"){var k=A({state:c,name:D,instance:p,options:R}),z=function(){};d.push(k||z)}})}function m(){d.forEach(function(C){return C()}),d=[]}return p}}var Pg=vr(),Dg=[Zi,so,Ji,zi],Rg=vr({defaultModifiers:Dg}),xg=[Zi,so,Ji,zi,Fc,kc,Vc,Lc,Hc],ro=vr({defaultModifiers:xg});const jc=Object.freeze(Object.defineProperty({__proto__:null,afterMain:Tc,afterRead:yc,afterWrite:Oc,applyStyles:zi,arrow:Lc,auto:gr,basePlacements:jn,beforeMain:wc,beforeRead:bc,beforeWrite:Sc,bottom:Ye,clippingParents:mc,computeStyles:Ji,createPopper:ro,createPopperBase:Pg,createPopperLite:Rg,detectOverflow:Hn,end:Ln,eventListeners:Zi,flip:kc,hide:Hc,left:Ie,main:Ac,modifierPhases:$c,offset:Fc,placements:Yi,popper:An,popperGenerator:vr,popperOffsets:so,preventOverflow:Vc,read:Ec,reference:vc,right:Ge,start:fn,top:Le,variationPlacements:vi,viewport:qi,write:Cc},Symbol.toStringTag,{value:"Module"}));/*!
+  */const wn=typeof document<"u";function sc(t){return typeof t=="object"||"displayName"in t||"props"in t||"__vccOpts"in t}function Qd(t){return t.__esModule||t[Symbol.toStringTag]==="Module"||t.default&&sc(t.default)}const ce=Object.assign;function kr(t,e){const n={};for(const s in e){const r=e[s];n[s]=at(r)?r.map(t):t(r)}return n}const os=()=>{},at=Array.isArray,rc=/#/g,Jd=/&/g,Zd=/\//g,eh=/=/g,th=/\?/g,ic=/\+/g,nh=/%5B/g,sh=/%5D/g,oc=/%5E/g,rh=/%60/g,ac=/%7B/g,ih=/%7C/g,lc=/%7D/g,oh=/%20/g;function Ki(t){return encodeURI(""+t).replace(ih,"|").replace(nh,"[").replace(sh,"]")}function ah(t){return Ki(t).replace(ac,"{").replace(lc,"}").replace(oc,"^")}function _i(t){return Ki(t).replace(ic,"%2B").replace(oh,"+").replace(rc,"%23").replace(Jd,"%26").replace(rh,"`").replace(ac,"{").replace(lc,"}").replace(oc,"^")}function lh(t){return _i(t).replace(eh,"%3D")}function ch(t){return Ki(t).replace(rc,"%23").replace(th,"%3F")}function uh(t){return t==null?"":ch(t).replace(Zd,"%2F")}function _s(t){try{return decodeURIComponent(""+t)}catch{}return""+t}const fh=/\/$/,dh=t=>t.replace(fh,"");function Hr(t,e,n="/"){let s,r={},i="",o="";const a=e.indexOf("#");let l=e.indexOf("?");return a<l&&a>=0&&(l=-1),l>-1&&(s=e.slice(0,l),i=e.slice(l+1,a>-1?a:e.length),r=t(i)),a>-1&&(s=s||e.slice(0,a),o=e.slice(a,e.length)),s=gh(s??e,n),{fullPath:s+(i&&"?")+i+o,path:s,query:r,hash:_s(o)}}function hh(t,e){const n=e.query?t(e.query):"";return e.path+(n&&"?")+n+(e.hash||"")}function qo(t,e){return!e||!t.toLowerCase().startsWith(e.toLowerCase())?t:t.slice(e.length)||"/"}function ph(t,e,n){const s=e.matched.length-1,r=n.matched.length-1;return s>-1&&s===r&&Rn(e.matched[s],n.matched[r])&&cc(e.params,n.params)&&t(e.query)===t(n.query)&&e.hash===n.hash}function Rn(t,e){return(t.aliasOf||t)===(e.aliasOf||e)}function cc(t,e){if(Object.keys(t).length!==Object.keys(e).length)return!1;for(const n in t)if(!_h(t[n],e[n]))return!1;return!0}function _h(t,e){return at(t)?Yo(t,e):at(e)?Yo(e,t):t===e}function Yo(t,e){return at(e)?t.length===e.length&&t.every((n,s)=>n===e[s]):t.length===1&&t[0]===e}function gh(t,e){if(t.startsWith("/"))return t;if(!t)return e;const n=e.split("/"),s=t.split("/"),r=s[s.length-1];(r===".."||r===".")&&s.push("");let i=n.length-1,o,a;for(o=0;o<s.length;o++)if(a=s[o],a!==".")if(a==="..")i>1&&i--;else break;return n.slice(0,i).join("/")+"/"+s.slice(o).join("/")}const Pt={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var gs;(function(t){t.pop="pop",t.push="push"})(gs||(gs={}));var as;(function(t){t.back="back",t.forward="forward",t.unknown=""})(as||(as={}));function mh(t){if(!t)if(wn){const e=document.querySelector("base");t=e&&e.getAttribute("href")||"/",t=t.replace(/^\w+:\/\/[^\/]+/,"")}else t="/";return t[0]!=="/"&&t[0]!=="#"&&(t="/"+t),dh(t)}const vh=/^[^#]+#/;function bh(t,e){return t.replace(vh,"#")+e}function Eh(t,e){const n=document.documentElement.getBoundingClientRect(),s=t.getBoundingClientRect();return{behavior:e.behavior,left:s.left-n.left-(e.left||0),top:s.top-n.top-(e.top||0)}}const _r=()=>({left:window.scrollX,top:window.scrollY});function yh(t){let e;if("el"in t){const n=t.el,s=typeof n=="string"&&n.startsWith("#"),r=typeof n=="string"?s?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!r)return;e=Eh(r,t)}else e=t;"scrollBehavior"in document.documentElement.style?window.scrollTo(e):window.scrollTo(e.left!=null?e.left:window.scrollX,e.top!=null?e.top:window.scrollY)}function Go(t,e){return(history.state?history.state.position-e:-1)+t}const gi=new Map;function wh(t,e){gi.set(t,e)}function Ah(t){const e=gi.get(t);return gi.delete(t),e}let Th=()=>location.protocol+"//"+location.host;function uc(t,e){const{pathname:n,search:s,hash:r}=e,i=t.indexOf("#");if(i>-1){let a=r.includes(t.slice(i))?t.slice(i).length:1,l=r.slice(a);return l[0]!=="/"&&(l="/"+l),qo(l,"")}return qo(n,t)+s+r}function Sh(t,e,n,s){let r=[],i=[],o=null;const a=({state:_})=>{const p=uc(t,location),v=n.value,m=e.value;let C=0;if(_){if(n.value=p,e.value=_,o&&o===v){o=null;return}C=m?_.position-m.position:0}else s(p);r.forEach(D=>{D(n.value,v,{delta:C,type:gs.pop,direction:C?C>0?as.forward:as.back:as.unknown})})};function l(){o=n.value}function u(_){r.push(_);const p=()=>{const v=r.indexOf(_);v>-1&&r.splice(v,1)};return i.push(p),p}function c(){const{history:_}=window;_.state&&_.replaceState(ce({},_.state,{scroll:_r()}),"")}function d(){for(const _ of i)_();i=[],window.removeEventListener("popstate",a),window.removeEventListener("beforeunload",c)}return window.addEventListener("popstate",a),window.addEventListener("beforeunload",c,{passive:!0}),{pauseListeners:l,listen:u,destroy:d}}function zo(t,e,n,s=!1,r=!1){return{back:t,current:e,forward:n,replaced:s,position:window.history.length,scroll:r?_r():null}}function Ch(t){const{history:e,location:n}=window,s={value:uc(t,n)},r={value:e.state};r.value||i(s.value,{back:null,current:s.value,forward:null,position:e.length-1,replaced:!0,scroll:null},!0);function i(l,u,c){const d=t.indexOf("#"),_=d>-1?(n.host&&document.querySelector("base")?t:t.slice(d))+l:Th()+t+l;try{e[c?"replaceState":"pushState"](u,"",_),r.value=u}catch(p){console.error(p),n[c?"replace":"assign"](_)}}function o(l,u){const c=ce({},e.state,zo(r.value.back,l,r.value.forward,!0),u,{position:r.value.position});i(l,c,!0),s.value=l}function a(l,u){const c=ce({},r.value,e.state,{forward:l,scroll:_r()});i(c.current,c,!0);const d=ce({},zo(s.value,l,null),{position:c.position+1},u);i(l,d,!1),s.value=l}return{location:s,state:r,push:a,replace:o}}function Oh(t){t=mh(t);const e=Ch(t),n=Sh(t,e.state,e.location,e.replace);function s(i,o=!0){o||n.pauseListeners(),history.go(i)}const r=ce({location:"",base:t,go:s,createHref:bh.bind(null,t)},e,n);return Object.defineProperty(r,"location",{enumerable:!0,get:()=>e.location.value}),Object.defineProperty(r,"state",{enumerable:!0,get:()=>e.state.value}),r}function $h(t){return typeof t=="string"||t&&typeof t=="object"}function fc(t){return typeof t=="string"||typeof t=="symbol"}const dc=Symbol("");var Xo;(function(t){t[t.aborted=4]="aborted",t[t.cancelled=8]="cancelled",t[t.duplicated=16]="duplicated"})(Xo||(Xo={}));function xn(t,e){return ce(new Error,{type:t,[dc]:!0},e)}function yt(t,e){return t instanceof Error&&dc in t&&(e==null||!!(t.type&e))}const Qo="[^/]+?",Nh={sensitive:!1,strict:!1,start:!0,end:!0},Ph=/[.+*?^${}()[\]/\\]/g;function Dh(t,e){const n=ce({},Nh,e),s=[];let r=n.start?"^":"";const i=[];for(const u of t){const c=u.length?[]:[90];n.strict&&!u.length&&(r+="/");for(let d=0;d<u.length;d++){const _=u[d];let p=40+(n.sensitive?.25:0);if(_.type===0)d||(r+="/"),r+=_.value.replace(Ph,"\\$&"),p+=40;else if(_.type===1){const{value:v,repeatable:m,optional:C,regexp:D}=_;i.push({name:v,repeatable:m,optional:C});const $=D||Qo;if($!==Qo){p+=10;try{new RegExp(`(${$})`)}catch(A){throw new Error(`Invalid custom RegExp for param "${v}" (${$}): `+A.message)}}let R=m?`((?:${$})(?:/(?:${$}))*)`:`(${$})`;d||(R=C&&u.length<2?`(?:/${R})`:"/"+R),C&&(R+="?"),r+=R,p+=20,C&&(p+=-8),m&&(p+=-20),$===".*"&&(p+=-50)}c.push(p)}s.push(c)}if(n.strict&&n.end){const u=s.length-1;s[u][s[u].length-1]+=.7000000000000001}n.strict||(r+="/?"),n.end?r+="$":n.strict&&(r+="(?:/|$)");const o=new RegExp(r,n.sensitive?"":"i");function a(u){const c=u.match(o),d={};if(!c)return null;for(let _=1;_<c.length;_++){const p=c[_]||"",v=i[_-1];d[v.name]=p&&v.repeatable?p.split("/"):p}return d}function l(u){let c="",d=!1;for(const _ of t){(!d||!c.endsWith("/"))&&(c+="/"),d=!1;for(const p of _)if(p.type===0)c+=p.value;else if(p.type===1){const{value:v,repeatable:m,optional:C}=p,D=v in u?u[v]:"";if(at(D)&&!m)throw new Error(`Provided param "${v}" is an array but it is not repeatable (* or + modifiers)`);const $=at(D)?D.join("/"):D;if(!$)if(C)_.length<2&&(c.endsWith("/")?c=c.slice(0,-1):d=!0);else throw new Error(`Missing required param "${v}"`);c+=$}}return c||"/"}return{re:o,score:s,keys:i,parse:a,stringify:l}}function Rh(t,e){let n=0;for(;n<t.length&&n<e.length;){const s=e[n]-t[n];if(s)return s;n++}return t.length<e.length?t.length===1&&t[0]===80?-1:1:t.length>e.length?e.length===1&&e[0]===80?1:-1:0}function hc(t,e){let n=0;const s=t.score,r=e.score;for(;n<s.length&&n<r.length;){const i=Rh(s[n],r[n]);if(i)return i;n++}if(Math.abs(r.length-s.length)===1){if(Jo(s))return 1;if(Jo(r))return-1}return r.length-s.length}function Jo(t){const e=t[t.length-1];return t.length>0&&e[e.length-1]<0}const xh={type:0,value:""},Lh=/[a-zA-Z0-9_]/;function Ih(t){if(!t)return[[]];if(t==="/")return[[xh]];if(!t.startsWith("/"))throw new Error(`Invalid path "${t}"`);function e(p){throw new Error(`ERR (${n})/"${u}": ${p}`)}let n=0,s=n;const r=[];let i;function o(){i&&r.push(i),i=[]}let a=0,l,u="",c="";function d(){u&&(n===0?i.push({type:0,value:u}):n===1||n===2||n===3?(i.length>1&&(l==="*"||l==="+")&&e(`A repeatable param (${u}) must be alone in its segment. eg: '/:ids+.`),i.push({type:1,value:u,regexp:c,repeatable:l==="*"||l==="+",optional:l==="*"||l==="?"})):e("Invalid state to consume buffer"),u="")}function _(){u+=l}for(;a<t.length;){if(l=t[a++],l==="\\"&&n!==2){s=n,n=4;continue}switch(n){case 0:l==="/"?(u&&d(),o()):l===":"?(d(),n=1):_();break;case 4:_(),n=s;break;case 1:l==="("?n=2:Lh.test(l)?_():(d(),n=0,l!=="*"&&l!=="?"&&l!=="+"&&a--);break;case 2:l===")"?c[c.length-1]=="\\"?c=c.slice(0,-1)+l:n=3:c+=l;break;case 3:d(),n=0,l!=="*"&&l!=="?"&&l!=="+"&&a--,c="";break;default:e("Unknown state");break}}return n===2&&e(`Unfinished custom RegExp for param "${u}"`),d(),o(),r}function Mh(t,e,n){const s=Dh(Ih(t.path),n),r=ce(s,{record:t,parent:e,children:[],alias:[]});return e&&!r.record.aliasOf==!e.record.aliasOf&&e.children.push(r),r}function kh(t,e){const n=[],s=new Map;e=na({strict:!1,end:!0,sensitive:!1},e);function r(d){return s.get(d)}function i(d,_,p){const v=!p,m=ea(d);m.aliasOf=p&&p.record;const C=na(e,d),D=[m];if("alias"in d){const A=typeof d.alias=="string"?[d.alias]:d.alias;for(const k of A)D.push(ea(ce({},m,{components:p?p.record.components:m.components,path:k,aliasOf:p?p.record:m})))}let $,R;for(const A of D){const{path:k}=A;if(_&&k[0]!=="/"){const z=_.record.path,U=z[z.length-1]==="/"?"":"/";A.path=_.record.path+(k&&U+k)}if($=Mh(A,_,C),p?p.alias.push($):(R=R||$,R!==$&&R.alias.push($),v&&d.name&&!ta($)&&o(d.name)),pc($)&&l($),m.children){const z=m.children;for(let U=0;U<z.length;U++)i(z[U],$,p&&p.children[U])}p=p||$}return R?()=>{o(R)}:os}function o(d){if(fc(d)){const _=s.get(d);_&&(s.delete(d),n.splice(n.indexOf(_),1),_.children.forEach(o),_.alias.forEach(o))}else{const _=n.indexOf(d);_>-1&&(n.splice(_,1),d.record.name&&s.delete(d.record.name),d.children.forEach(o),d.alias.forEach(o))}}function a(){return n}function l(d){const _=Vh(d,n);n.splice(_,0,d),d.record.name&&!ta(d)&&s.set(d.record.name,d)}function u(d,_){let p,v={},m,C;if("name"in d&&d.name){if(p=s.get(d.name),!p)throw xn(1,{location:d});C=p.record.name,v=ce(Zo(_.params,p.keys.filter(R=>!R.optional).concat(p.parent?p.parent.keys.filter(R=>R.optional):[]).map(R=>R.name)),d.params&&Zo(d.params,p.keys.map(R=>R.name))),m=p.stringify(v)}else if(d.path!=null)m=d.path,p=n.find(R=>R.re.test(m)),p&&(v=p.parse(m),C=p.record.name);else{if(p=_.name?s.get(_.name):n.find(R=>R.re.test(_.path)),!p)throw xn(1,{location:d,currentLocation:_});C=p.record.name,v=ce({},_.params,d.params),m=p.stringify(v)}const D=[];let $=p;for(;$;)D.unshift($.record),$=$.parent;return{name:C,path:m,params:v,matched:D,meta:Fh(D)}}t.forEach(d=>i(d));function c(){n.length=0,s.clear()}return{addRoute:i,resolve:u,removeRoute:o,clearRoutes:c,getRoutes:a,getRecordMatcher:r}}function Zo(t,e){const n={};for(const s of e)s in t&&(n[s]=t[s]);return n}function ea(t){const e={path:t.path,redirect:t.redirect,name:t.name,meta:t.meta||{},aliasOf:t.aliasOf,beforeEnter:t.beforeEnter,props:Hh(t),children:t.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in t?t.components||null:t.component&&{default:t.component}};return Object.defineProperty(e,"mods",{value:{}}),e}function Hh(t){const e={},n=t.props||!1;if("component"in t)e.default=n;else for(const s in t.components)e[s]=typeof n=="object"?n[s]:n;return e}function ta(t){for(;t;){if(t.record.aliasOf)return!0;t=t.parent}return!1}function Fh(t){return t.reduce((e,n)=>ce(e,n.meta),{})}function na(t,e){const n={};for(const s in t)n[s]=s in e?e[s]:t[s];return n}function Vh(t,e){let n=0,s=e.length;for(;n!==s;){const i=n+s>>1;hc(t,e[i])<0?s=i:n=i+1}const r=jh(t);return r&&(s=e.lastIndexOf(r,s-1)),s}function jh(t){let e=t;for(;e=e.parent;)if(pc(e)&&hc(t,e)===0)return e}function pc({record:t}){return!!(t.name||t.components&&Object.keys(t.components).length||t.redirect)}function Wh(t){const e={};if(t===""||t==="?")return e;const s=(t[0]==="?"?t.slice(1):t).split("&");for(let r=0;r<s.length;++r){const i=s[r].replace(ic," "),o=i.indexOf("="),a=_s(o<0?i:i.slice(0,o)),l=o<0?null:_s(i.slice(o+1));if(a in e){let u=e[a];at(u)||(u=e[a]=[u]),u.push(l)}else e[a]=l}return e}function sa(t){let e="";for(let n in t){const s=t[n];if(n=lh(n),s==null){s!==void 0&&(e+=(e.length?"&":"")+n);continue}(at(s)?s.map(i=>i&&_i(i)):[s&&_i(s)]).forEach(i=>{i!==void 0&&(e+=(e.length?"&":"")+n,i!=null&&(e+="="+i))})}return e}function Bh(t){const e={};for(const n in t){const s=t[n];s!==void 0&&(e[n]=at(s)?s.map(r=>r==null?null:""+r):s==null?s:""+s)}return e}const Kh=Symbol(""),ra=Symbol(""),Ui=Symbol(""),_c=Symbol(""),mi=Symbol("");function Gn(){let t=[];function e(s){return t.push(s),()=>{const r=t.indexOf(s);r>-1&&t.splice(r,1)}}function n(){t=[]}return{add:e,list:()=>t.slice(),reset:n}}function It(t,e,n,s,r,i=o=>o()){const o=s&&(s.enterCallbacks[r]=s.enterCallbacks[r]||[]);return()=>new Promise((a,l)=>{const u=_=>{_===!1?l(xn(4,{from:n,to:e})):_ instanceof Error?l(_):$h(_)?l(xn(2,{from:e,to:_})):(o&&s.enterCallbacks[r]===o&&typeof _=="function"&&o.push(_),a())},c=i(()=>t.call(s&&s.instances[r],e,n,u));let d=Promise.resolve(c);t.length<3&&(d=d.then(u)),d.catch(_=>l(_))})}function Fr(t,e,n,s,r=i=>i()){const i=[];for(const o of t)for(const a in o.components){let l=o.components[a];if(!(e!=="beforeRouteEnter"&&!o.instances[a]))if(sc(l)){const c=(l.__vccOpts||l)[e];c&&i.push(It(c,n,s,o,a,r))}else{let u=l();i.push(()=>u.then(c=>{if(!c)throw new Error(`Couldn't resolve component "${a}" at "${o.path}"`);const d=Qd(c)?c.default:c;o.mods[a]=c,o.components[a]=d;const p=(d.__vccOpts||d)[e];return p&&It(p,n,s,o,a,r)()}))}}return i}function ia(t){const e=pt(Ui),n=pt(_c),s=Xe(()=>{const l=Nn(t.to);return e.resolve(l)}),r=Xe(()=>{const{matched:l}=s.value,{length:u}=l,c=l[u-1],d=n.matched;if(!c||!d.length)return-1;const _=d.findIndex(Rn.bind(null,c));if(_>-1)return _;const p=oa(l[u-2]);return u>1&&oa(c)===p&&d[d.length-1].path!==p?d.findIndex(Rn.bind(null,l[u-2])):_}),i=Xe(()=>r.value>-1&&Gh(n.params,s.value.params)),o=Xe(()=>r.value>-1&&r.value===n.matched.length-1&&cc(n.params,s.value.params));function a(l={}){return Yh(l)?e[Nn(t.replace)?"replace":"push"](Nn(t.to)).catch(os):Promise.resolve()}return{route:s,href:Xe(()=>s.value.href),isActive:i,isExactActive:o,navigate:a}}const Uh=bt({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:ia,setup(t,{slots:e}){const n=vs(ia(t)),{options:s}=pt(Ui),r=Xe(()=>({[aa(t.activeClass,s.linkActiveClass,"router-link-active")]:n.isActive,[aa(t.exactActiveClass,s.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const i=e.default&&e.default(n);return t.custom?i:Ql("a",{"aria-current":n.isExactActive?t.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:r.value},i)}}}),qh=Uh;function Yh(t){if(!(t.metaKey||t.altKey||t.ctrlKey||t.shiftKey)&&!t.defaultPrevented&&!(t.button!==void 0&&t.button!==0)){if(t.currentTarget&&t.currentTarget.getAttribute){const e=t.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(e))return}return t.preventDefault&&t.preventDefault(),!0}}function Gh(t,e){for(const n in e){const s=e[n],r=t[n];if(typeof s=="string"){if(s!==r)return!1}else if(!at(r)||r.length!==s.length||s.some((i,o)=>i!==r[o]))return!1}return!0}function oa(t){return t?t.aliasOf?t.aliasOf.path:t.path:""}const aa=(t,e,n)=>t??e??n,zh=bt({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(t,{attrs:e,slots:n}){const s=pt(mi),r=Xe(()=>t.route||s.value),i=pt(ra,0),o=Xe(()=>{let u=Nn(i);const{matched:c}=r.value;let d;for(;(d=c[u])&&!d.components;)u++;return u}),a=Xe(()=>r.value.matched[o.value]);ks(ra,Xe(()=>o.value+1)),ks(Kh,a),ks(mi,r);const l=Re();return ss(()=>[l.value,a.value,t.name],([u,c,d],[_,p,v])=>{c&&(c.instances[d]=u,p&&p!==c&&u&&u===_&&(c.leaveGuards.size||(c.leaveGuards=p.leaveGuards),c.updateGuards.size||(c.updateGuards=p.updateGuards))),u&&c&&(!p||!Rn(c,p)||!_)&&(c.enterCallbacks[d]||[]).forEach(m=>m(u))},{flush:"post"}),()=>{const u=r.value,c=t.name,d=a.value,_=d&&d.components[c];if(!_)return la(n.default,{Component:_,route:u});const p=d.props[c],v=p?p===!0?u.params:typeof p=="function"?p(u):p:null,C=Ql(_,ce({},v,e,{onVnodeUnmounted:D=>{D.component.isUnmounted&&(d.instances[c]=null)},ref:l}));return la(n.default,{Component:C,route:u})||C}}});function la(t,e){if(!t)return null;const n=t(e);return n.length===1?n[0]:n}const gc=zh;function Xh(t){const e=kh(t.routes,t),n=t.parseQuery||Wh,s=t.stringifyQuery||sa,r=t.history,i=Gn(),o=Gn(),a=Gn(),l=Gu(Pt);let u=Pt;wn&&t.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const c=kr.bind(null,E=>""+E),d=kr.bind(null,uh),_=kr.bind(null,_s);function p(E,I){let x,H;return fc(E)?(x=e.getRecordMatcher(E),H=I):H=E,e.addRoute(H,x)}function v(E){const I=e.getRecordMatcher(E);I&&e.removeRoute(I)}function m(){return e.getRoutes().map(E=>E.record)}function C(E){return!!e.getRecordMatcher(E)}function D(E,I){if(I=ce({},I||l.value),typeof E=="string"){const h=Hr(n,E,I.path),g=e.resolve({path:h.path},I),y=r.createHref(h.fullPath);return ce(h,g,{params:_(g.params),hash:_s(h.hash),redirectedFrom:void 0,href:y})}let x;if(E.path!=null)x=ce({},E,{path:Hr(n,E.path,I.path).path});else{const h=ce({},E.params);for(const g in h)h[g]==null&&delete h[g];x=ce({},E,{params:d(h)}),I.params=d(I.params)}const H=e.resolve(x,I),ne=E.hash||"";H.params=c(_(H.params));const pe=hh(s,ce({},E,{hash:ah(ne),path:H.path})),f=r.createHref(pe);return ce({fullPath:pe,hash:ne,query:s===sa?Bh(E.query):E.query||{}},H,{redirectedFrom:void 0,href:f})}function $(E){return typeof E=="string"?Hr(n,E,l.value.path):ce({},E)}function R(E,I){if(u!==E)return xn(8,{from:I,to:E})}function A(E){return U(E)}function k(E){return A(ce($(E),{replace:!0}))}function z(E){const I=E.matched[E.matched.length-1];if(I&&I.redirect){const{redirect:x}=I;let H=typeof x=="function"?x(E):x;return typeof H=="string"&&(H=H.includes("?")||H.includes("#")?H=$(H):{path:H},H.params={}),ce({query:E.query,hash:E.hash,params:H.path!=null?{}:E.params},H)}}function U(E,I){const x=u=D(E),H=l.value,ne=E.state,pe=E.force,f=E.replace===!0,h=z(x);if(h)return U(ce($(h),{state:typeof h=="object"?ce({},ne,h.state):ne,force:pe,replace:f}),I||x);const g=x;g.redirectedFrom=I;let y;return!pe&&ph(s,H,x)&&(y=xn(16,{to:g,from:H}),Me(H,H,!0,!1)),(y?Promise.resolve(y):Q(g,H)).catch(b=>yt(b)?yt(b,2)?b:Fe(b):te(b,g,H)).then(b=>{if(b){if(yt(b,2))return U(ce({replace:f},$(b.to),{state:typeof b.to=="object"?ce({},ne,b.to.state):ne,force:pe}),I||g)}else b=he(g,H,!0,f,ne);return se(g,H,b),b})}function j(E,I){const x=R(E,I);return x?Promise.reject(x):Promise.resolve()}function V(E){const I=Ve.values().next().value;return I&&typeof I.runWithContext=="function"?I.runWithContext(E):E()}function Q(E,I){let x;const[H,ne,pe]=Qh(E,I);x=Fr(H.reverse(),"beforeRouteLeave",E,I);for(const h of H)h.leaveGuards.forEach(g=>{x.push(It(g,E,I))});const f=j.bind(null,E,I);return x.push(f),Ee(x).then(()=>{x=[];for(const h of i.list())x.push(It(h,E,I));return x.push(f),Ee(x)}).then(()=>{x=Fr(ne,"beforeRouteUpdate",E,I);for(const h of ne)h.updateGuards.forEach(g=>{x.push(It(g,E,I))});return x.push(f),Ee(x)}).then(()=>{x=[];for(const h of pe)if(h.beforeEnter)if(at(h.beforeEnter))for(const g of h.beforeEnter)x.push(It(g,E,I));else x.push(It(h.beforeEnter,E,I));return x.push(f),Ee(x)}).then(()=>(E.matched.forEach(h=>h.enterCallbacks={}),x=Fr(pe,"beforeRouteEnter",E,I,V),x.push(f),Ee(x))).then(()=>{x=[];for(const h of o.list())x.push(It(h,E,I));return x.push(f),Ee(x)}).catch(h=>yt(h,8)?h:Promise.reject(h))}function se(E,I,x){a.list().forEach(H=>V(()=>H(E,I,x)))}function he(E,I,x,H,ne){const pe=R(E,I);if(pe)return pe;const f=I===Pt,h=wn?history.state:{};x&&(H||f?r.replace(E.fullPath,ce({scroll:f&&h&&h.scroll},ne)):r.push(E.fullPath,ne)),l.value=E,Me(E,I,x,f),Fe()}let ie;function Ne(){ie||(ie=r.listen((E,I,x)=>{if(!je.listening)return;const H=D(E),ne=z(H);if(ne){U(ce(ne,{replace:!0}),H).catch(os);return}u=H;const pe=l.value;wn&&wh(Go(pe.fullPath,x.delta),_r()),Q(H,pe).catch(f=>yt(f,12)?f:yt(f,2)?(U(f.to,H).then(h=>{yt(h,20)&&!x.delta&&x.type===gs.pop&&r.go(-1,!1)}).catch(os),Promise.reject()):(x.delta&&r.go(-x.delta,!1),te(f,H,pe))).then(f=>{f=f||he(H,pe,!1),f&&(x.delta&&!yt(f,8)?r.go(-x.delta,!1):x.type===gs.pop&&yt(f,20)&&r.go(-1,!1)),se(H,pe,f)}).catch(os)}))}let Te=Gn(),Z=Gn(),W;function te(E,I,x){Fe(E);const H=Z.list();return H.length?H.forEach(ne=>ne(E,I,x)):console.error(E),Promise.reject(E)}function we(){return W&&l.value!==Pt?Promise.resolve():new Promise((E,I)=>{Te.add([E,I])})}function Fe(E){return W||(W=!E,Ne(),Te.list().forEach(([I,x])=>E?x(E):I()),Te.reset()),E}function Me(E,I,x,H){const{scrollBehavior:ne}=t;if(!wn||!ne)return Promise.resolve();const pe=!x&&Ah(Go(E.fullPath,0))||(H||!x)&&history.state&&history.state.scroll||null;return Hi().then(()=>ne(E,I,pe)).then(f=>f&&yh(f)).catch(f=>te(f,E,I))}const me=E=>r.go(E);let st;const Ve=new Set,je={currentRoute:l,listening:!0,addRoute:p,removeRoute:v,clearRoutes:e.clearRoutes,hasRoute:C,getRoutes:m,resolve:D,options:t,push:A,replace:k,go:me,back:()=>me(-1),forward:()=>me(1),beforeEach:i.add,beforeResolve:o.add,afterEach:a.add,onError:Z.add,isReady:we,install(E){const I=this;E.component("RouterLink",qh),E.component("RouterView",gc),E.config.globalProperties.$router=I,Object.defineProperty(E.config.globalProperties,"$route",{enumerable:!0,get:()=>Nn(l)}),wn&&!st&&l.value===Pt&&(st=!0,A(r.location).catch(ne=>{}));const x={};for(const ne in Pt)Object.defineProperty(x,ne,{get:()=>l.value[ne],enumerable:!0});E.provide(Ui,I),E.provide(_c,gl(x)),E.provide(mi,l);const H=E.unmount;Ve.add(E),E.unmount=function(){Ve.delete(E),Ve.size<1&&(u=Pt,ie&&ie(),ie=null,l.value=Pt,st=!1,W=!1),H()}}};function Ee(E){return E.reduce((I,x)=>I.then(()=>V(x)),Promise.resolve())}return je}function Qh(t,e){const n=[],s=[],r=[],i=Math.max(e.matched.length,t.matched.length);for(let o=0;o<i;o++){const a=e.matched[o];a&&(t.matched.find(u=>Rn(u,a))?s.push(a):n.push(a));const l=t.matched[o];l&&(e.matched.find(u=>Rn(u,l))||r.push(l))}return[n,s,r]}const Jh=bt({components:{RouterView:gc}}),zt=(t,e)=>{const n=t.__vccOpts||t;for(const[s,r]of e)n[s]=r;return n},Zh={class:"container pt-4"},ep={class:"navigation"};function tp(t,e,n,s,r,i){const o=oi("router-link"),a=oi("RouterView");return B(),Y("main",Zh,[O("nav",ep,[be(o,{class:"nav-link",to:{name:"Main Page"}},{default:En(()=>e[0]||(e[0]=[it(" Home ")])),_:1}),be(o,{class:"nav-link",to:{name:"Profile page"}},{default:En(()=>e[1]||(e[1]=[it(" Profile Page ")])),_:1}),be(o,{class:"nav-link",to:{name:"User Search"}},{default:En(()=>e[2]||(e[2]=[it(" Find Users ")])),_:1}),be(o,{class:"nav-link",to:{name:"Friend Requests"}},{default:En(()=>e[3]||(e[3]=[it(" Friend Requests ")])),_:1}),be(o,{class:"nav-link",to:{name:"Friends List"}},{default:En(()=>e[4]||(e[4]=[it(" Friends ")])),_:1}),e[5]||(e[5]=O("a",{href:"/login/",class:"nav-link logout-link"}," Logout ",-1))]),be(a,{class:"flex-shrink-0"})])}const np=zt(Jh,[["render",tp],["__scopeId","data-v-ae29c586"]]),sp="/api";class rp{async request(e,n={}){var s;try{const i={"Content-Type":"application/json","X-CSRFToken":((s=document.cookie.split("; ").find(l=>l.startsWith("csrftoken=")))==null?void 0:s.split("=")[1])||"",...n.headers},o=await fetch(`${sp}${e}`,{...n,headers:i,credentials:"include"});if(!o.ok)try{const l=await o.json();return{error:l.message||l.detail||"An error occurred",status:o.status}}catch{return{error:"An error occurred",status:o.status}}return{data:await o.json(),status:o.status}}catch(r){return{error:r instanceof Error?r.message:"Network error",status:500}}}async getCurrentProfile(){return this.request("/profile/me/")}async updateProfile(e){return this.request("/profile/update_profile/",{method:"PATCH",body:JSON.stringify(e)})}async getAllHobbies(){return this.request("/hobbies/")}async createHobby(e){return this.request("/hobbies/create_hobby/",{method:"POST",body:JSON.stringify({name:e})})}async addHobbyToProfile(e){return this.request(`/hobbies/${e}/add_to_profile/`,{method:"POST"})}async removeHobbyFromProfile(e){return this.request(`/hobbies/${e}/remove_from_profile/`,{method:"POST"})}async login(e,n){const s=new FormData;return s.append("username",e),s.append("password",n),this.request("/login/",{method:"POST",body:s,headers:{"Content-Type":void 0}})}async logout(){return this.request("/logout/",{method:"POST"})}async register(e){const n=new FormData;return Object.entries(e).forEach(([s,r])=>{n.append(s,r)}),this.request("/register/",{method:"POST",body:n,headers:{"Content-Type":void 0}})}}const Ft=new rp,ip=bt({data(){return{loading:!0,error:"",username:"",profile:null}},async created(){await this.loadUserProfile()},methods:{async loadUserProfile(){try{this.loading=!0;const t=await Ft.getCurrentProfile();t.error?this.error=t.error:t.data&&(this.profile=t.data,this.username=this.profile.username)}catch{this.error="Failed to load profile"}finally{this.loading=!1}}}}),op={class:"main-page"},ap={key:0,class:"loading"},lp={key:1,class:"error"},cp={key:2};function up(t,e,n,s,r,i){return B(),Y("div",op,[t.loading?(B(),Y("div",ap,"Loading...")):t.error?(B(),Y("div",lp,ue(t.error),1)):(B(),Y("div",cp,[O("h1",null,"Hello, "+ue(t.username)+"!",1),e[0]||(e[0]=O("p",{class:"welcome-text"},"Welcome to the Hobbies App. Here you can:",-1)),e[1]||(e[1]=O("ul",{class:"features-list"},[O("li",null,"View and edit your profile"),O("li",null,"Manage your hobbies"),O("li",null,"Connect with users who share your interests"),O("li",null,"Send and receive friend requests"),O("li",null,"View your friends list")],-1))]))])}const fp=zt(ip,[["render",up],["__scopeId","data-v-f14cb4dc"]]),dp=bt({data(){return{title:"Other Page"}}}),hp={class:"h3"};function pp(t,e,n,s,r,i){return B(),Y("div",hp,ue(t.title),1)}const _p=zt(dp,[["render",pp]]),gp=Xd("user",{state:()=>({profile:null,loading:!1,error:null}),getters:{hasProfile:t=>!!t.profile,userHobbies:t=>{var e;return((e=t.profile)==null?void 0:e.hobbies)||[]}},actions:{async fetchProfile(){this.loading=!0,this.error=null;const t=await Ft.getCurrentProfile();if(t.error||!t.data){this.error=t.error||"No data received",this.loading=!1;return}this.profile=t.data,this.loading=!1},async updateProfile(t){this.loading=!0,this.error=null;const e=await Ft.updateProfile(t);return e.error||!e.data?(this.error=e.error||"No data received",this.loading=!1,!1):(this.profile=e.data,this.loading=!1,!0)}}}),mp=bt({name:"ProfileEditForm",props:{initialData:{type:Object,required:!0}},data(){return{formData:{username:this.initialData.username,email:this.initialData.email,date_of_birth:this.initialData.date_of_birth,current_password:"",new_password:""},errors:{username:"",email:"",current_password:"",new_password:""}}},methods:{async handleSubmit(){this.errors={username:"",email:"",current_password:"",new_password:""};const t={};for(const[n,s]of Object.entries(this.formData))s!==""&&s!==null&&s!==void 0&&(t[n]=s);const e=await Ft.updateProfile(t);if(e.status===200)t.new_password?(alert("Password updated successfully!"),this.formData.current_password="",this.formData.new_password=""):(this.$emit("save",this.formData),alert("Profile updated successfully!"));else if(e.error)try{const n=typeof e.error=="string"?JSON.parse(e.error):e.error;for(const s in n)this.errors.hasOwnProperty(s)&&(this.errors[s]=Array.isArray(n[s])?n[s][0]:n[s])}catch{alert("An error occurred while updating the profile")}}}}),vp={class:"section"},bp={class:"form-group"},Ep={key:0,class:"error-message"},yp={class:"form-group"},wp={key:0,class:"error-message"},Ap={class:"form-group"},Tp={class:"section"},Sp={class:"form-group"},Cp={key:0,class:"error-message"},Op={class:"form-group"},$p={key:0,class:"error-message"},Np={class:"form-actions"};function Pp(t,e,n,s,r,i){return B(),Y("form",{onSubmit:e[6]||(e[6]=Id((...o)=>t.handleSubmit&&t.handleSubmit(...o),["prevent"])),class:"edit-form"},[O("div",vp,[e[10]||(e[10]=O("h3",null,"Profile Information",-1)),O("div",bp,[e[7]||(e[7]=O("label",{for:"username"},"Username",-1)),Mt(O("input",{id:"username","onUpdate:modelValue":e[0]||(e[0]=o=>t.formData.username=o),type:"text",class:"form-control"},null,512),[[kt,t.formData.username]]),t.errors.username?(B(),Y("span",Ep,ue(t.errors.username),1)):Ht("",!0)]),O("div",yp,[e[8]||(e[8]=O("label",{for:"email"},"Email",-1)),Mt(O("input",{id:"email","onUpdate:modelValue":e[1]||(e[1]=o=>t.formData.email=o),type:"email",class:"form-control"},null,512),[[kt,t.formData.email]]),t.errors.email?(B(),Y("span",wp,ue(t.errors.email),1)):Ht("",!0)]),O("div",Ap,[e[9]||(e[9]=O("label",{for:"date_of_birth"},"Date of Birth",-1)),Mt(O("input",{id:"date_of_birth","onUpdate:modelValue":e[2]||(e[2]=o=>t.formData.date_of_birth=o),type:"date",class:"form-control"},null,512),[[kt,t.formData.date_of_birth]])])]),O("div",Tp,[e[13]||(e[13]=O("h3",null,"Change Password",-1)),O("div",Sp,[e[11]||(e[11]=O("label",{for:"current_password"},"Current Password",-1)),Mt(O("input",{id:"current_password","onUpdate:modelValue":e[3]||(e[3]=o=>t.formData.current_password=o),type:"password",class:"form-control"},null,512),[[kt,t.formData.current_password]]),t.errors.current_password?(B(),Y("span",Cp,ue(t.errors.current_password),1)):Ht("",!0)]),O("div",Op,[e[12]||(e[12]=O("label",{for:"new_password"},"New Password",-1)),Mt(O("input",{id:"new_password","onUpdate:modelValue":e[4]||(e[4]=o=>t.formData.new_password=o),type:"password",class:"form-control"},null,512),[[kt,t.formData.new_password]]),t.errors.new_password?(B(),Y("span",$p,ue(t.errors.new_password),1)):Ht("",!0)])]),O("div",Np,[e[14]||(e[14]=O("button",{type:"submit",class:"save-btn"},"Save Changes",-1)),O("button",{type:"button",onClick:e[5]||(e[5]=o=>t.$emit("cancel")),class:"cancel-btn"}," Cancel ")])],32)}const Dp=zt(mp,[["render",Pp],["__scopeId","data-v-257f55ff"]]),Rp=bt({name:"ProfilePage",components:{ProfileEditForm:Dp},data(){return{isEditing:!1,newHobby:"",hobbyError:"",availableHobbies:[],loadingHobbies:!1}},computed:{userStore(){return gp()},profile(){return this.userStore.profile},loading(){return this.userStore.loading||this.loadingHobbies},error(){return this.userStore.error}},methods:{async handleProfileUpdate(t){await this.userStore.updateProfile(t)&&(this.isEditing=!1)},async fetchHobbies(){try{this.loadingHobbies=!0;const t=await Ft.getAllHobbies();t.data&&(this.availableHobbies=t.data)}catch{this.hobbyError="Failed to load hobbies"}finally{this.loadingHobbies=!1}},async handleCreateHobby(){if(this.newHobby.trim())try{this.hobbyError="";const t=await Ft.createHobby(this.newHobby.trim());if(t.error){this.hobbyError=t.error;return}await Promise.all([this.userStore.fetchProfile(),this.fetchHobbies()]),this.newHobby=""}catch{this.hobbyError="Failed to create hobby. Please try again."}},async addHobby(t){try{this.hobbyError="";const e=await Ft.addHobbyToProfile(t);if(e.error){this.hobbyError=e.error;return}await Promise.all([this.userStore.fetchProfile(),this.fetchHobbies()])}catch{this.hobbyError="Failed to add hobby. Please try again."}},async removeHobby(t){try{this.hobbyError="";const e=await Ft.removeHobbyFromProfile(t);if(e.error){this.hobbyError=e.error;return}await Promise.all([this.userStore.fetchProfile(),this.fetchHobbies()])}catch{this.hobbyError="Failed to remove hobby. Please try again."}}},async created(){this.profile||await this.userStore.fetchProfile(),await this.fetchHobbies()}}),xp={class:"profile-page"},Lp={key:0,class:"loading"},Ip={key:1,class:"error"},Mp={key:2,class:"profile-container"},kp={key:0,class:"profile-details"},Hp={class:"detail-item"},Fp={class:"detail-item"},Vp={class:"detail-item"},jp={class:"hobbies-section"},Wp={class:"hobbies-list"},Bp=["onClick"],Kp={key:0,class:"no-hobbies"},Up={class:"available-hobbies-section"},qp={class:"hobbies-list"},Yp=["onClick"],Gp={class:"create-hobby-form"},zp=["disabled"],Xp={key:0,class:"error-message"};function Qp(t,e,n,s,r,i){var a,l,u,c,d,_;const o=oi("profile-edit-form");return B(),Y("div",xp,[t.loading?(B(),Y("div",Lp," Loading... ")):t.error?(B(),Y("div",Ip,ue(t.error),1)):(B(),Y("div",Mp,[e[10]||(e[10]=O("h1",null,"Profile",-1)),t.isEditing?(B(),Yl(o,{key:1,"initial-data":t.profile,onSave:t.handleProfileUpdate,onCancel:e[4]||(e[4]=p=>t.isEditing=!1)},null,8,["initial-data","onSave"])):(B(),Y("div",kp,[O("div",Hp,[e[5]||(e[5]=O("strong",null,"Username:",-1)),it(" "+ue((a=t.profile)==null?void 0:a.username),1)]),O("div",Fp,[e[6]||(e[6]=O("strong",null,"Email:",-1)),it(" "+ue((l=t.profile)==null?void 0:l.email),1)]),O("div",Vp,[e[7]||(e[7]=O("strong",null,"Date of Birth:",-1)),it(" "+ue((u=t.profile)!=null&&u.date_of_birth?new Date(t.profile.date_of_birth).toLocaleDateString():"Not set"),1)]),O("div",jp,[e[8]||(e[8]=O("h2",null,"My Hobbies",-1)),O("div",Wp,[(B(!0),Y($e,null,cn((c=t.profile)==null?void 0:c.hobbies,p=>(B(),Y("span",{key:p.id,class:"hobby-tag"},[it(ue(p.name)+" ",1),O("button",{onClick:v=>t.removeHobby(p.id),class:"remove-hobby-btn",title:"Remove hobby"}," × ",8,Bp)]))),128)),(_=(d=t.profile)==null?void 0:d.hobbies)!=null&&_.length?Ht("",!0):(B(),Y("span",Kp," No hobbies added yet "))])]),O("div",Up,[e[9]||(e[9]=O("h2",null,"Available Hobbies",-1)),O("div",qp,[(B(!0),Y($e,null,cn(t.availableHobbies,p=>(B(),Y("span",{key:p.id,class:or(["hobby-tag",{"hobby-added":p.user_has_hobby}])},[it(ue(p.name)+" ",1),p.user_has_hobby?Ht("",!0):(B(),Y("button",{key:0,onClick:v=>t.addHobby(p.id),class:"add-hobby-btn",title:"Add to my hobbies"}," + ",8,Yp))],2))),128))]),O("div",Gp,[Mt(O("input",{"onUpdate:modelValue":e[0]||(e[0]=p=>t.newHobby=p),type:"text",placeholder:"Create a new hobby",class:"hobby-input",onKeyup:e[1]||(e[1]=kd((...p)=>t.handleCreateHobby&&t.handleCreateHobby(...p),["enter"]))},null,544),[[kt,t.newHobby]]),O("button",{onClick:e[2]||(e[2]=(...p)=>t.handleCreateHobby&&t.handleCreateHobby(...p)),class:"create-hobby-btn",disabled:!t.newHobby.trim()}," Create Hobby ",8,zp)]),t.hobbyError?(B(),Y("p",Xp,ue(t.hobbyError),1)):Ht("",!0)]),O("button",{onClick:e[3]||(e[3]=p=>t.isEditing=!0),class:"edit-btn"}," Edit Profile ")]))]))])}const Jp=zt(Rp,[["render",Qp],["__scopeId","data-v-b18ed2e4"]]),Zp={class:"friend-requests"},e_={key:0,class:"loading"},t_={key:1,class:"error"},n_={key:2,class:"no-requests"},s_={key:3,class:"requests-list"},r_={class:"request-info"},i_={class:"user-name"},o_={class:"request-date"},a_={class:"request-actions"},l_=["onClick"],c_=["onClick"],u_=bt({__name:"FriendRequests",setup(t){const e=Re([]),n=Re(!1),s=Re(""),r=async()=>{try{n.value=!0,s.value="";const o=await fetch("/api/friend-requests/pending/?unpaginated=true");if(!o.ok)throw new Error("Failed to fetch requests");const a=await o.json();e.value=a}catch(o){s.value="Error fetching friend requests",console.error("Error:",o)}finally{n.value=!1}},i=async(o,a)=>{var l;try{const u=(l=document.cookie.split("; ").find(d=>d.startsWith("csrftoken=")))==null?void 0:l.split("=")[1];if(!u)throw new Error("CSRF token not found");const c=await fetch(`/api/friend-requests/${o}/${a}/`,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":u},credentials:"include"});if(!c.ok){const d=await c.json();throw new Error(d.error||`Failed to ${a} request`)}e.value=e.value.filter(d=>d.id!==o)}catch(u){s.value=u instanceof Error?u.message:`Error ${a}ing friend request`,console.error("Error:",u),setTimeout(()=>{s.value=""},3e3)}};return ur(()=>{r()}),(o,a)=>(B(),Y("div",Zp,[a[0]||(a[0]=O("div",{class:"header"},[O("h2",null,"Friend Requests")],-1)),n.value?(B(),Y("div",e_," Loading friend requests... ")):s.value?(B(),Y("div",t_,ue(s.value),1)):e.value.length===0?(B(),Y("div",n_," No pending friend requests ")):(B(),Y("div",s_,[(B(!0),Y($e,null,cn(e.value,l=>(B(),Y("div",{key:l.id,class:"request-item"},[O("div",r_,[O("span",i_,ue(l.sender_username),1),O("span",o_,ue(new Date(l.created_at).toLocaleDateString()),1)]),O("div",a_,[O("button",{onClick:u=>i(l.id,"accept"),class:"accept-btn"}," Accept ",8,l_),O("button",{onClick:u=>i(l.id,"reject"),class:"reject-btn"}," Reject ",8,c_)])]))),128))]))]))}}),f_=zt(u_,[["__scopeId","data-v-7f4cb852"]]),d_={class:"friends-list"},h_={key:0,class:"no-friends"},p_={key:1,class:"friends-grid"},__={class:"friend-header"},g_={class:"age"},m_={class:"hobbies"},v_={class:"hobby-tags"},b_=["onClick"],E_=bt({__name:"FriendsList",setup(t){const e=Re([]),n=async()=>{try{const i=await fetch("/api/friend-requests/friends/?unpaginated=true");if(!i.ok)throw new Error("Failed to fetch friends");e.value=await i.json()}catch(i){console.error("Error fetching friends:",i)}},s=async i=>{var o;try{const a=(o=document.cookie.split("; ").find(u=>u.startsWith("csrftoken=")))==null?void 0:o.split("=")[1];if(!a)throw new Error("CSRF token not found");const l=await fetch("/api/friend-requests/unfollow/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":a},body:JSON.stringify({user_id:i}),credentials:"include"});if(!l.ok){const u=await l.json();throw new Error(u.error||"Failed to unfollow friend")}e.value=e.value.filter(u=>u.id!==i)}catch(a){console.error("Error unfollowing friend:",a)}},r=i=>{const o=new Date,a=new Date(i);let l=o.getFullYear()-a.getFullYear();const u=o.getMonth()-a.getMonth();return(u<0||u===0&&o.getDate()<a.getDate())&&l--,l};return ur(()=>{n()}),(i,o)=>(B(),Y("div",d_,[o[1]||(o[1]=O("h2",null,"My Friends",-1)),e.value.length===0?(B(),Y("div",h_," You haven't added any friends yet ")):(B(),Y("div",p_,[(B(!0),Y($e,null,cn(e.value,a=>(B(),Y("div",{key:a.id,class:"friend-card"},[O("div",__,[O("h3",null,ue(a.username),1),O("span",g_,ue(r(a.date_of_birth))+" years old",1)]),O("div",m_,[o[0]||(o[0]=O("h4",null,"Hobbies:",-1)),O("div",v_,[(B(!0),Y($e,null,cn(a.hobbies,l=>(B(),Y("span",{key:l.id,class:"hobby-tag"},ue(l.name),1))),128))])]),O("button",{onClick:l=>s(a.id),class:"unfollow-btn"}," Unfollow ",8,b_)]))),128))]))]))}}),y_=zt(E_,[["__scopeId","data-v-55c12fb2"]]),w_={class:"user-search"},A_={class:"filters"},T_={class:"age-filter"},S_={class:"age-inputs"},C_={key:0,class:"loading"},O_={key:1,class:"error"},$_={key:2,class:"users-list"},N_={key:0,class:"no-results"},P_={key:1,class:"user-cards"},D_={class:"user-info"},R_={class:"user-details"},x_={class:"detail-row"},L_={class:"detail-value"},I_={class:"hobbies-section"},M_={class:"hobby-tags"},k_=["onClick"],H_={key:1,class:"friend-request-btn pending-btn",disabled:""},F_=["onClick","disabled"],V_={key:2,class:"pagination"},j_=["disabled"],W_={class:"page-info"},B_=["disabled"],K_=bt({__name:"UserSearch",setup(t){const e=Re([]),n=Re(!1),s=Re(""),r=Re(""),i=Re(""),o=Re(1),a=Re(1),l=Re(0),u=async()=>{try{n.value=!0,s.value="";const p=new URLSearchParams;r.value&&p.append("min_age",r.value),i.value&&p.append("max_age",i.value),p.append("page",o.value.toString());const v=await fetch(`/api/profile/search_users/?${p.toString()}`);if(!v.ok)throw new Error("Failed to fetch users");const m=await v.json();e.value=m.users,a.value=m.total_pages,l.value=m.total_users,o.value=m.current_page}catch(p){s.value="Error fetching users",console.error("Error:",p)}finally{n.value=!1}},c=async p=>{var v;try{const m=(v=document.cookie.split("; ").find(R=>R.startsWith("csrftoken=")))==null?void 0:v.split("=")[1];if(!m)throw new Error("CSRF token not found");const C=await fetch("/api/friend-requests/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":m},body:JSON.stringify({receiver:p}),credentials:"include"}),D=await C.json();if(!C.ok)throw new Error(D.error||"Failed to send friend request");const $=e.value.find(R=>R.id===p);$&&($.has_pending_request=!0,$.friend_request_sent=!0)}catch(m){const C=m instanceof Error?m.message:"Error sending friend request";s.value=C,setTimeout(()=>{s.value=""},3e3),console.error("Error:",m)}},d=async p=>{var v;try{const m=(v=document.cookie.split("; ").find($=>$.startsWith("csrftoken=")))==null?void 0:v.split("=")[1];if(!m)throw new Error("CSRF token not found");const C=await fetch("/api/friend-requests/unfollow/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":m},body:JSON.stringify({user_id:p}),credentials:"include"});if(!C.ok){const $=await C.json();throw new Error($.error||"Failed to unfollow user")}const D=e.value.find($=>$.id===p);D&&(D.is_friend=!1)}catch(m){const C=m instanceof Error?m.message:"Error unfollowing user";s.value=C,setTimeout(()=>{s.value=""},3e3),console.error("Error:",m)}},_=p=>{o.value=p,u()};return ur(()=>{u()}),(p,v)=>(B(),Y("div",w_,[v[7]||(v[7]=O("h2",null,"Find Users with Similar Hobbies",-1)),O("div",A_,[O("div",T_,[v[5]||(v[5]=O("label",null,"Age Range:",-1)),O("div",S_,[Mt(O("input",{type:"number","onUpdate:modelValue":v[0]||(v[0]=m=>r.value=m),placeholder:"Min age",min:"0",max:"150"},null,512),[[kt,r.value]]),v[4]||(v[4]=O("span",null,"to",-1)),Mt(O("input",{type:"number","onUpdate:modelValue":v[1]||(v[1]=m=>i.value=m),placeholder:"Max age",min:"0",max:"150"},null,512),[[kt,i.value]]),O("button",{onClick:u,class:"filter-btn"},"Apply Filters")])])]),n.value?(B(),Y("div",C_," Loading users... ")):s.value?(B(),Y("div",O_,ue(s.value),1)):(B(),Y("div",$_,[e.value.length===0?(B(),Y("div",N_," No users found with similar hobbies ")):(B(),Y("div",P_,[(B(!0),Y($e,null,cn(e.value,m=>(B(),Y("div",{key:m.id,class:"user-card"},[O("div",D_,[O("h3",null,ue(m.username),1)]),O("div",R_,[O("div",x_,[v[6]||(v[6]=O("span",{class:"detail-label"},"Age:",-1)),O("span",L_,ue(m.age||"Not specified"),1)])]),O("div",I_,[O("h4",null,"Common Hobbies ("+ue(m.common_hobbies_count)+"):",1),O("div",M_,[(B(!0),Y($e,null,cn(m.hobbies,C=>(B(),Y("span",{key:C.id,class:"hobby-tag"},ue(C.name),1))),128))])]),m.is_friend?(B(),Y("button",{key:0,onClick:C=>d(m.id),class:"friend-request-btn unfollow-btn"}," Unfollow ",8,k_)):m.has_pending_request?(B(),Y("button",H_," Pending Request ")):(B(),Y("button",{key:2,onClick:C=>c(m.id),class:"friend-request-btn",disabled:m.friend_request_sent},ue(m.friend_request_sent?"Friend Request Sent":"Send Friend Request"),9,F_))]))),128))])),a.value>1?(B(),Y("div",V_,[O("button",{onClick:v[2]||(v[2]=m=>_(o.value-1)),disabled:o.value===1,class:"page-btn"}," Previous ",8,j_),O("span",W_,"Page "+ue(o.value)+" of "+ue(a.value),1),O("button",{onClick:v[3]||(v[3]=m=>_(o.value+1)),disabled:o.value===a.value,class:"page-btn"}," Next ",8,B_)])):Ht("",!0)]))]))}}),U_=zt(K_,[["__scopeId","data-v-d02c34e0"]]);let q_="";const Y_=Xh({history:Oh(q_),routes:[{path:"/",name:"Main Page",component:fp},{path:"/other/",name:"Other Page",component:_p},{path:"/profile/",name:"Profile page",component:Jp},{path:"/friend-requests/",name:"Friend Requests",component:f_},{path:"/friends/",name:"Friends List",component:y_},{path:"/search/",name:"User Search",component:U_}]});var Le="top",Ye="bottom",Ge="right",Ie="left",gr="auto",jn=[Le,Ye,Ge,Ie],fn="start",Ln="end",mc="clippingParents",qi="viewport",An="popper",vc="reference",vi=jn.reduce(function(t,e){return t.concat([e+"-"+fn,e+"-"+Ln])},[]),Yi=[].concat(jn,[gr]).reduce(function(t,e){return t.concat([e,e+"-"+fn,e+"-"+Ln])},[]),bc="beforeRead",Ec="read",yc="afterRead",wc="beforeMain",Ac="main",Tc="afterMain",Sc="beforeWrite",Cc="write",Oc="afterWrite",$c=[bc,Ec,yc,wc,Ac,Tc,Sc,Cc,Oc];function vt(t){return t?(t.nodeName||"").toLowerCase():null}function ze(t){if(t==null)return window;if(t.toString()!=="[object Window]"){var e=t.ownerDocument;return e&&e.defaultView||window}return t}function dn(t){var e=ze(t).Element;return t instanceof e||t instanceof Element}function Je(t){var e=ze(t).HTMLElement;return t instanceof e||t instanceof HTMLElement}function Gi(t){if(typeof ShadowRoot>"u")return!1;var e=ze(t).ShadowRoot;return t instanceof e||t instanceof ShadowRoot}function G_(t){var e=t.state;Object.keys(e.elements).forEach(function(n){var s=e.styles[n]||{},r=e.attributes[n]||{},i=e.elements[n];!Je(i)||!vt(i)||(Object.assign(i.style,s),Object.keys(r).forEach(function(o){var a=r[o];a===!1?i.removeAttribute(o):i.setAttribute(o,a===!0?"":a)}))})}function z_(t){var e=t.state,n={popper:{position:e.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(e.elements.popper.style,n.popper),e.styles=n,e.elements.arrow&&Object.assign(e.elements.arrow.style,n.arrow),function(){Object.keys(e.elements).forEach(function(s){var r=e.elements[s],i=e.attributes[s]||{},o=Object.keys(e.styles.hasOwnProperty(s)?e.styles[s]:n[s]),a=o.reduce(function(l,u){return l[u]="",l},{});!Je(r)||!vt(r)||(Object.assign(r.style,a),Object.keys(i).forEach(function(l){r.removeAttribute(l)}))})}}const zi={name:"applyStyles",enabled:!0,phase:"write",fn:G_,effect:z_,requires:["computeStyles"]};function _t(t){return t.split("-")[0]}var an=Math.max,Qs=Math.min,In=Math.round;function bi(){var t=navigator.userAgentData;return t!=null&&t.brands&&Array.isArray(t.brands)?t.brands.map(function(e){return e.brand+"/"+e.version}).join(" "):navigator.userAgent}function Nc(){return!/^((?!chrome|android).)*safari/i.test(bi())}function Mn(t,e,n){e===void 0&&(e=!1),n===void 0&&(n=!1);var s=t.getBoundingClientRect(),r=1,i=1;e&&Je(t)&&(r=t.offsetWidth>0&&In(s.width)/t.offsetWidth||1,i=t.offsetHeight>0&&In(s.height)/t.offsetHeight||1);var o=dn(t)?ze(t):window,a=o.visualViewport,l=!Nc()&&n,u=(s.left+(l&&a?a.offsetLeft:0))/r,c=(s.top+(l&&a?a.offsetTop:0))/i,d=s.width/r,_=s.height/i;return{width:d,height:_,top:c,right:u+d,bottom:c+_,left:u,x:u,y:c}}function Xi(t){var e=Mn(t),n=t.offsetWidth,s=t.offsetHeight;return Math.abs(e.width-n)<=1&&(n=e.width),Math.abs(e.height-s)<=1&&(s=e.height),{x:t.offsetLeft,y:t.offsetTop,width:n,height:s}}function Pc(t,e){var n=e.getRootNode&&e.getRootNode();if(t.contains(e))return!0;if(n&&Gi(n)){var s=e;do{if(s&&t.isSameNode(s))return!0;s=s.parentNode||s.host}while(s)}return!1}function Ot(t){return ze(t).getComputedStyle(t)}function X_(t){return["table","td","th"].indexOf(vt(t))>=0}function Xt(t){return((dn(t)?t.ownerDocument:t.document)||window.document).documentElement}function mr(t){return vt(t)==="html"?t:t.assignedSlot||t.parentNode||(Gi(t)?t.host:null)||Xt(t)}function ca(t){return!Je(t)||Ot(t).position==="fixed"?null:t.offsetParent}function Q_(t){var e=/firefox/i.test(bi()),n=/Trident/i.test(bi());if(n&&Je(t)){var s=Ot(t);if(s.position==="fixed")return null}var r=mr(t);for(Gi(r)&&(r=r.host);Je(r)&&["html","body"].indexOf(vt(r))<0;){var i=Ot(r);if(i.transform!=="none"||i.perspective!=="none"||i.contain==="paint"||["transform","perspective"].indexOf(i.willChange)!==-1||e&&i.willChange==="filter"||e&&i.filter&&i.filter!=="none")return r;r=r.parentNode}return null}function ys(t){for(var e=ze(t),n=ca(t);n&&X_(n)&&Ot(n).position==="static";)n=ca(n);return n&&(vt(n)==="html"||vt(n)==="body"&&Ot(n).position==="static")?e:n||Q_(t)||e}function Qi(t){return["top","bottom"].indexOf(t)>=0?"x":"y"}function ls(t,e,n){return an(t,Qs(e,n))}function J_(t,e,n){var s=ls(t,e,n);return s>n?n:s}function Dc(){return{top:0,right:0,bottom:0,left:0}}function Rc(t){return Object.assign({},Dc(),t)}function xc(t,e){return e.reduce(function(n,s){return n[s]=t,n},{})}var Z_=function(e,n){return e=typeof e=="function"?e(Object.assign({},n.rects,{placement:n.placement})):e,Rc(typeof e!="number"?e:xc(e,jn))};function eg(t){var e,n=t.state,s=t.name,r=t.options,i=n.elements.arrow,o=n.modifiersData.popperOffsets,a=_t(n.placement),l=Qi(a),u=[Ie,Ge].indexOf(a)>=0,c=u?"height":"width";if(!(!i||!o)){var d=Z_(r.padding,n),_=Xi(i),p=l==="y"?Le:Ie,v=l==="y"?Ye:Ge,m=n.rects.reference[c]+n.rects.reference[l]-o[l]-n.rects.popper[c],C=o[l]-n.rects.reference[l],D=ys(i),$=D?l==="y"?D.clientHeight||0:D.clientWidth||0:0,R=m/2-C/2,A=d[p],k=$-_[c]-d[v],z=$/2-_[c]/2+R,U=ls(A,z,k),j=l;n.modifiersData[s]=(e={},e[j]=U,e.centerOffset=U-z,e)}}function tg(t){var e=t.state,n=t.options,s=n.element,r=s===void 0?"[data-popper-arrow]":s;r!=null&&(typeof r=="string"&&(r=e.elements.popper.querySelector(r),!r)||Pc(e.elements.popper,r)&&(e.elements.arrow=r))}const Lc={name:"arrow",enabled:!0,phase:"main",fn:eg,effect:tg,requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function kn(t){return t.split("-")[1]}var ng={top:"auto",right:"auto",bottom:"auto",left:"auto"};function sg(t,e){var n=t.x,s=t.y,r=e.devicePixelRatio||1;return{x:In(n*r)/r||0,y:In(s*r)/r||0}}function ua(t){var e,n=t.popper,s=t.popperRect,r=t.placement,i=t.variation,o=t.offsets,a=t.position,l=t.gpuAcceleration,u=t.adaptive,c=t.roundOffsets,d=t.isFixed,_=o.x,p=_===void 0?0:_,v=o.y,m=v===void 0?0:v,C=typeof c=="function"?c({x:p,y:m}):{x:p,y:m};p=C.x,m=C.y;var D=o.hasOwnProperty("x"),$=o.hasOwnProperty("y"),R=Ie,A=Le,k=window;if(u){var z=ys(n),U="clientHeight",j="clientWidth";if(z===ze(n)&&(z=Xt(n),Ot(z).position!=="static"&&a==="absolute"&&(U="scrollHeight",j="scrollWidth")),z=z,r===Le||(r===Ie||r===Ge)&&i===Ln){A=Ye;var V=d&&z===k&&k.visualViewport?k.visualViewport.height:z[U];m-=V-s.height,m*=l?1:-1}if(r===Ie||(r===Le||r===Ye)&&i===Ln){R=Ge;var Q=d&&z===k&&k.visualViewport?k.visualViewport.width:z[j];p-=Q-s.width,p*=l?1:-1}}var se=Object.assign({position:a},u&&ng),he=c===!0?sg({x:p,y:m},ze(n)):{x:p,y:m};if(p=he.x,m=he.y,l){var ie;return Object.assign({},se,(ie={},ie[A]=$?"0":"",ie[R]=D?"0":"",ie.transform=(k.devicePixelRatio||1)<=1?"translate("+p+"px, "+m+"px)":"translate3d("+p+"px, "+m+"px, 0)",ie))}return Object.assign({},se,(e={},e[A]=$?m+"px":"",e[R]=D?p+"px":"",e.transform="",e))}function rg(t){var e=t.state,n=t.options,s=n.gpuAcceleration,r=s===void 0?!0:s,i=n.adaptive,o=i===void 0?!0:i,a=n.roundOffsets,l=a===void 0?!0:a,u={placement:_t(e.placement),variation:kn(e.placement),popper:e.elements.popper,popperRect:e.rects.popper,gpuAcceleration:r,isFixed:e.options.strategy==="fixed"};e.modifiersData.popperOffsets!=null&&(e.styles.popper=Object.assign({},e.styles.popper,ua(Object.assign({},u,{offsets:e.modifiersData.popperOffsets,position:e.options.strategy,adaptive:o,roundOffsets:l})))),e.modifiersData.arrow!=null&&(e.styles.arrow=Object.assign({},e.styles.arrow,ua(Object.assign({},u,{offsets:e.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:l})))),e.attributes.popper=Object.assign({},e.attributes.popper,{"data-popper-placement":e.placement})}const Ji={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:rg,data:{}};var Ns={passive:!0};function ig(t){var e=t.state,n=t.instance,s=t.options,r=s.scroll,i=r===void 0?!0:r,o=s.resize,a=o===void 0?!0:o,l=ze(e.elements.popper),u=[].concat(e.scrollParents.reference,e.scrollParents.popper);return i&&u.forEach(function(c){c.addEventListener("scroll",n.update,Ns)}),a&&l.addEventListener("resize",n.update,Ns),function(){i&&u.forEach(function(c){c.removeEventListener("scroll",n.update,Ns)}),a&&l.removeEventListener("resize",n.update,Ns)}}const Zi={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:ig,data:{}};var og={left:"right",right:"left",bottom:"top",top:"bottom"};function Vs(t){return t.replace(/left|right|bottom|top/g,function(e){return og[e]})}var ag={start:"end",end:"start"};function fa(t){return t.replace(/start|end/g,function(e){return ag[e]})}function eo(t){var e=ze(t),n=e.pageXOffset,s=e.pageYOffset;return{scrollLeft:n,scrollTop:s}}function to(t){return Mn(Xt(t)).left+eo(t).scrollLeft}function lg(t,e){var n=ze(t),s=Xt(t),r=n.visualViewport,i=s.clientWidth,o=s.clientHeight,a=0,l=0;if(r){i=r.width,o=r.height;var u=Nc();(u||!u&&e==="fixed")&&(a=r.offsetLeft,l=r.offsetTop)}return{width:i,height:o,x:a+to(t),y:l}}function cg(t){var e,n=Xt(t),s=eo(t),r=(e=t.ownerDocument)==null?void 0:e.body,i=an(n.scrollWidth,n.clientWidth,r?r.scrollWidth:0,r?r.clientWidth:0),o=an(n.scrollHeight,n.clientHeight,r?r.scrollHeight:0,r?r.clientHeight:0),a=-s.scrollLeft+to(t),l=-s.scrollTop;return Ot(r||n).direction==="rtl"&&(a+=an(n.clientWidth,r?r.clientWidth:0)-i),{width:i,height:o,x:a,y:l}}function no(t){var e=Ot(t),n=e.overflow,s=e.overflowX,r=e.overflowY;return/auto|scroll|overlay|hidden/.test(n+r+s)}function Ic(t){return["html","body","#document"].indexOf(vt(t))>=0?t.ownerDocument.body:Je(t)&&no(t)?t:Ic(mr(t))}function cs(t,e){var n;e===void 0&&(e=[]);var s=Ic(t),r=s===((n=t.ownerDocument)==null?void 0:n.body),i=ze(s),o=r?[i].concat(i.visualViewport||[],no(s)?s:[]):s,a=e.concat(o);return r?a:a.concat(cs(mr(o)))}function Ei(t){return Object.assign({},t,{left:t.x,top:t.y,right:t.x+t.width,bottom:t.y+t.height})}function ug(t,e){var n=Mn(t,!1,e==="fixed");return n.top=n.top+t.clientTop,n.left=n.left+t.clientLeft,n.bottom=n.top+t.clientHeight,n.right=n.left+t.clientWidth,n.width=t.clientWidth,n.height=t.clientHeight,n.x=n.left,n.y=n.top,n}function da(t,e,n){return e===qi?Ei(lg(t,n)):dn(e)?ug(e,n):Ei(cg(Xt(t)))}function fg(t){var e=cs(mr(t)),n=["absolute","fixed"].indexOf(Ot(t).position)>=0,s=n&&Je(t)?ys(t):t;return dn(s)?e.filter(function(r){return dn(r)&&Pc(r,s)&&vt(r)!=="body"}):[]}function dg(t,e,n,s){var r=e==="clippingParents"?fg(t):[].concat(e),i=[].concat(r,[n]),o=i[0],a=i.reduce(function(l,u){var c=da(t,u,s);return l.top=an(c.top,l.top),l.right=Qs(c.right,l.right),l.bottom=Qs(c.bottom,l.bottom),l.left=an(c.left,l.left),l},da(t,o,s));return a.width=a.right-a.left,a.height=a.bottom-a.top,a.x=a.left,a.y=a.top,a}function Mc(t){var e=t.reference,n=t.element,s=t.placement,r=s?_t(s):null,i=s?kn(s):null,o=e.x+e.width/2-n.width/2,a=e.y+e.height/2-n.height/2,l;switch(r){case Le:l={x:o,y:e.y-n.height};break;case Ye:l={x:o,y:e.y+e.height};break;case Ge:l={x:e.x+e.width,y:a};break;case Ie:l={x:e.x-n.width,y:a};break;default:l={x:e.x,y:e.y}}var u=r?Qi(r):null;if(u!=null){var c=u==="y"?"height":"width";switch(i){case fn:l[u]=l[u]-(e[c]/2-n[c]/2);break;case Ln:l[u]=l[u]+(e[c]/2-n[c]/2);break}}return l}function Hn(t,e){e===void 0&&(e={});var n=e,s=n.placement,r=s===void 0?t.placement:s,i=n.strategy,o=i===void 0?t.strategy:i,a=n.boundary,l=a===void 0?mc:a,u=n.rootBoundary,c=u===void 0?qi:u,d=n.elementContext,_=d===void 0?An:d,p=n.altBoundary,v=p===void 0?!1:p,m=n.padding,C=m===void 0?0:m,D=Rc(typeof C!="number"?C:xc(C,jn)),$=_===An?vc:An,R=t.rects.popper,A=t.elements[v?$:_],k=dg(dn(A)?A:A.contextElement||Xt(t.elements.popper),l,c,o),z=Mn(t.elements.reference),U=Mc({reference:z,element:R,strategy:"absolute",placement:r}),j=Ei(Object.assign({},R,U)),V=_===An?j:z,Q={top:k.top-V.top+D.top,bottom:V.bottom-k.bottom+D.bottom,left:k.left-V.left+D.left,right:V.right-k.right+D.right},se=t.modifiersData.offset;if(_===An&&se){var he=se[r];Object.keys(Q).forEach(function(ie){var Ne=[Ge,Ye].indexOf(ie)>=0?1:-1,Te=[Le,Ye].indexOf(ie)>=0?"y":"x";Q[ie]+=he[Te]*Ne})}return Q}function hg(t,e){e===void 0&&(e={});var n=e,s=n.placement,r=n.boundary,i=n.rootBoundary,o=n.padding,a=n.flipVariations,l=n.allowedAutoPlacements,u=l===void 0?Yi:l,c=kn(s),d=c?a?vi:vi.filter(function(v){return kn(v)===c}):jn,_=d.filter(function(v){return u.indexOf(v)>=0});_.length===0&&(_=d);var p=_.reduce(function(v,m){return v[m]=Hn(t,{placement:m,boundary:r,rootBoundary:i,padding:o})[_t(m)],v},{});return Object.keys(p).sort(function(v,m){return p[v]-p[m]})}function pg(t){if(_t(t)===gr)return[];var e=Vs(t);return[fa(t),e,fa(e)]}function _g(t){var e=t.state,n=t.options,s=t.name;if(!e.modifiersData[s]._skip){for(var r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,a=o===void 0?!0:o,l=n.fallbackPlacements,u=n.padding,c=n.boundary,d=n.rootBoundary,_=n.altBoundary,p=n.flipVariations,v=p===void 0?!0:p,m=n.allowedAutoPlacements,C=e.options.placement,D=_t(C),$=D===C,R=l||($||!v?[Vs(C)]:pg(C)),A=[C].concat(R).reduce(function(Ve,je){return Ve.concat(_t(je)===gr?hg(e,{placement:je,boundary:c,rootBoundary:d,padding:u,flipVariations:v,allowedAutoPlacements:m}):je)},[]),k=e.rects.reference,z=e.rects.popper,U=new Map,j=!0,V=A[0],Q=0;Q<A.length;Q++){var se=A[Q],he=_t(se),ie=kn(se)===fn,Ne=[Le,Ye].indexOf(he)>=0,Te=Ne?"width":"height",Z=Hn(e,{placement:se,boundary:c,rootBoundary:d,altBoundary:_,padding:u}),W=Ne?ie?Ge:Ie:ie?Ye:Le;k[Te]>z[Te]&&(W=Vs(W));var te=Vs(W),we=[];if(i&&we.push(Z[he]<=0),a&&we.push(Z[W]<=0,Z[te]<=0),we.every(function(Ve){return Ve})){V=se,j=!1;break}U.set(se,we)}if(j)for(var Fe=v?3:1,Me=function(je){var Ee=A.find(function(E){var I=U.get(E);if(I)return I.slice(0,je).every(function(x){return x})});if(Ee)return V=Ee,"break"},me=Fe;me>0;me--){var st=Me(me);if(st==="break")break}e.placement!==V&&(e.modifiersData[s]._skip=!0,e.placement=V,e.reset=!0)}}const kc={name:"flip",enabled:!0,phase:"main",fn:_g,requiresIfExists:["offset"],data:{_skip:!1}};function ha(t,e,n){return n===void 0&&(n={x:0,y:0}),{top:t.top-e.height-n.y,right:t.right-e.width+n.x,bottom:t.bottom-e.height+n.y,left:t.left-e.width-n.x}}function pa(t){return[Le,Ge,Ye,Ie].some(function(e){return t[e]>=0})}function gg(t){var e=t.state,n=t.name,s=e.rects.reference,r=e.rects.popper,i=e.modifiersData.preventOverflow,o=Hn(e,{elementContext:"reference"}),a=Hn(e,{altBoundary:!0}),l=ha(o,s),u=ha(a,r,i),c=pa(l),d=pa(u);e.modifiersData[n]={referenceClippingOffsets:l,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:d},e.attributes.popper=Object.assign({},e.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":d})}const Hc={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:gg};function mg(t,e,n){var s=_t(t),r=[Ie,Le].indexOf(s)>=0?-1:1,i=typeof n=="function"?n(Object.assign({},e,{placement:t})):n,o=i[0],a=i[1];return o=o||0,a=(a||0)*r,[Ie,Ge].indexOf(s)>=0?{x:a,y:o}:{x:o,y:a}}function vg(t){var e=t.state,n=t.options,s=t.name,r=n.offset,i=r===void 0?[0,0]:r,o=Yi.reduce(function(c,d){return c[d]=mg(d,e.rects,i),c},{}),a=o[e.placement],l=a.x,u=a.y;e.modifiersData.popperOffsets!=null&&(e.modifiersData.popperOffsets.x+=l,e.modifiersData.popperOffsets.y+=u),e.modifiersData[s]=o}const Fc={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:vg};function bg(t){var e=t.state,n=t.name;e.modifiersData[n]=Mc({reference:e.rects.reference,element:e.rects.popper,strategy:"absolute",placement:e.placement})}const so={name:"popperOffsets",enabled:!0,phase:"read",fn:bg,data:{}};function Eg(t){return t==="x"?"y":"x"}function yg(t){var e=t.state,n=t.options,s=t.name,r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,a=o===void 0?!1:o,l=n.boundary,u=n.rootBoundary,c=n.altBoundary,d=n.padding,_=n.tether,p=_===void 0?!0:_,v=n.tetherOffset,m=v===void 0?0:v,C=Hn(e,{boundary:l,rootBoundary:u,padding:d,altBoundary:c}),D=_t(e.placement),$=kn(e.placement),R=!$,A=Qi(D),k=Eg(A),z=e.modifiersData.popperOffsets,U=e.rects.reference,j=e.rects.popper,V=typeof m=="function"?m(Object.assign({},e.rects,{placement:e.placement})):m,Q=typeof V=="number"?{mainAxis:V,altAxis:V}:Object.assign({mainAxis:0,altAxis:0},V),se=e.modifiersData.offset?e.modifiersData.offset[e.placement]:null,he={x:0,y:0};if(z){if(i){var ie,Ne=A==="y"?Le:Ie,Te=A==="y"?Ye:Ge,Z=A==="y"?"height":"width",W=z[A],te=W+C[Ne],we=W-C[Te],Fe=p?-j[Z]/2:0,Me=$===fn?U[Z]:j[Z],me=$===fn?-j[Z]:-U[Z],st=e.elements.arrow,Ve=p&&st?Xi(st):{width:0,height:0},je=e.modifiersData["arrow#persistent"]?e.modifiersData["arrow#persistent"].padding:Dc(),Ee=je[Ne],E=je[Te],I=ls(0,U[Z],Ve[Z]),x=R?U[Z]/2-Fe-I-Ee-Q.mainAxis:Me-I-Ee-Q.mainAxis,H=R?-U[Z]/2+Fe+I+E+Q.mainAxis:me+I+E+Q.mainAxis,ne=e.elements.arrow&&ys(e.elements.arrow),pe=ne?A==="y"?ne.clientTop||0:ne.clientLeft||0:0,f=(ie=se==null?void 0:se[A])!=null?ie:0,h=W+x-f-pe,g=W+H-f,y=ls(p?Qs(te,h):te,W,p?an(we,g):we);z[A]=y,he[A]=y-W}if(a){var b,T=A==="x"?Le:Ie,L=A==="x"?Ye:Ge,N=z[k],P=k==="y"?"height":"width",S=N+C[T],q=N-C[L],M=[Le,Ie].indexOf(D)!==-1,F=(b=se==null?void 0:se[k])!=null?b:0,G=M?S:N-U[P]-j[P]-F+Q.altAxis,ee=M?N+U[P]+j[P]-F-Q.altAxis:q,ae=p&&M?J_(G,N,ee):ls(p?G:S,N,p?ee:q);z[k]=ae,he[k]=ae-N}e.modifiersData[s]=he}}const Vc={name:"preventOverflow",enabled:!0,phase:"main",fn:yg,requiresIfExists:["offset"]};function wg(t){return{scrollLeft:t.scrollLeft,scrollTop:t.scrollTop}}function Ag(t){return t===ze(t)||!Je(t)?eo(t):wg(t)}function Tg(t){var e=t.getBoundingClientRect(),n=In(e.width)/t.offsetWidth||1,s=In(e.height)/t.offsetHeight||1;return n!==1||s!==1}function Sg(t,e,n){n===void 0&&(n=!1);var s=Je(e),r=Je(e)&&Tg(e),i=Xt(e),o=Mn(t,r,n),a={scrollLeft:0,scrollTop:0},l={x:0,y:0};return(s||!s&&!n)&&((vt(e)!=="body"||no(i))&&(a=Ag(e)),Je(e)?(l=Mn(e,!0),l.x+=e.clientLeft,l.y+=e.clientTop):i&&(l.x=to(i))),{x:o.left+a.scrollLeft-l.x,y:o.top+a.scrollTop-l.y,width:o.width,height:o.height}}function Cg(t){var e=new Map,n=new Set,s=[];t.forEach(function(i){e.set(i.name,i)});function r(i){n.add(i.name);var o=[].concat(i.requires||[],i.requiresIfExists||[]);o.forEach(function(a){if(!n.has(a)){var l=e.get(a);l&&r(l)}}),s.push(i)}return t.forEach(function(i){n.has(i.name)||r(i)}),s}function Og(t){var e=Cg(t);return $c.reduce(function(n,s){return n.concat(e.filter(function(r){return r.phase===s}))},[])}function $g(t){var e;return function(){return e||(e=new Promise(function(n){Promise.resolve().then(function(){e=void 0,n(t())})})),e}}function Ng(t){var e=t.reduce(function(n,s){var r=n[s.name];return n[s.name]=r?Object.assign({},r,s,{options:Object.assign({},r.options,s.options),data:Object.assign({},r.data,s.data)}):s,n},{});return Object.keys(e).map(function(n){return e[n]})}var _a={placement:"bottom",modifiers:[],strategy:"absolute"};function ga(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return!e.some(function(s){return!(s&&typeof s.getBoundingClientRect=="function")})}function vr(t){t===void 0&&(t={});var e=t,n=e.defaultModifiers,s=n===void 0?[]:n,r=e.defaultOptions,i=r===void 0?_a:r;return function(a,l,u){u===void 0&&(u=i);var c={placement:"bottom",orderedModifiers:[],options:Object.assign({},_a,i),modifiersData:{},elements:{reference:a,popper:l},attributes:{},styles:{}},d=[],_=!1,p={state:c,setOptions:function(D){var $=typeof D=="function"?D(c.options):D;m(),c.options=Object.assign({},i,c.options,$),c.scrollParents={reference:dn(a)?cs(a):a.contextElement?cs(a.contextElement):[],popper:cs(l)};var R=Og(Ng([].concat(s,c.options.modifiers)));return c.orderedModifiers=R.filter(function(A){return A.enabled}),v(),p.update()},forceUpdate:function(){if(!_){var D=c.elements,$=D.reference,R=D.popper;if(ga($,R)){c.rects={reference:Sg($,ys(R),c.options.strategy==="fixed"),popper:Xi(R)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach(function(Q){return c.modifiersData[Q.name]=Object.assign({},Q.data)});for(var A=0;A<c.orderedModifiers.length;A++){if(c.reset===!0){c.reset=!1,A=-1;continue}var k=c.orderedModifiers[A],z=k.fn,U=k.options,j=U===void 0?{}:U,V=k.name;typeof z=="function"&&(c=z({state:c,options:j,name:V,instance:p})||c)}}}},update:$g(function(){return new Promise(function(C){p.forceUpdate(),C(c)})}),destroy:function(){m(),_=!0}};if(!ga(a,l))return p;p.setOptions(u).then(function(C){!_&&u.onFirstUpdate&&u.onFirstUpdate(C)});function v(){c.orderedModifiers.forEach(function(C){var D=C.name,$=C.options,R=$===void 0?{}:$,A=C.effect;if(typeof A=="function"){var k=A({state:c,name:D,instance:p,options:R}),z=function(){};d.push(k||z)}})}function m(){d.forEach(function(C){return C()}),d=[]}return p}}var Pg=vr(),Dg=[Zi,so,Ji,zi],Rg=vr({defaultModifiers:Dg}),xg=[Zi,so,Ji,zi,Fc,kc,Vc,Lc,Hc],ro=vr({defaultModifiers:xg});const jc=Object.freeze(Object.defineProperty({__proto__:null,afterMain:Tc,afterRead:yc,afterWrite:Oc,applyStyles:zi,arrow:Lc,auto:gr,basePlacements:jn,beforeMain:wc,beforeRead:bc,beforeWrite:Sc,bottom:Ye,clippingParents:mc,computeStyles:Ji,createPopper:ro,createPopperBase:Pg,createPopperLite:Rg,detectOverflow:Hn,end:Ln,eventListeners:Zi,flip:kc,hide:Hc,left:Ie,main:Ac,modifierPhases:$c,offset:Fc,placements:Yi,popper:An,popperGenerator:vr,popperOffsets:so,preventOverflow:Vc,read:Ec,reference:vc,right:Ge,start:fn,top:Le,variationPlacements:vi,viewport:qi,write:Cc},Symbol.toStringTag,{value:"Module"}));/*!
   * Bootstrap v5.3.3 (https://getbootstrap.com/)
   * Copyright 2011-2024 The Bootstrap Authors (https://github.com/twbs/bootstrap/graphs/contributors)
   * Licensed under MIT (https://github.com/twbs/bootstrap/blob/main/LICENSE)
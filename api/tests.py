@@ -1,4 +1,15 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
+from django.core.cache.backends.db import DatabaseCache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.utils import ConnectionHandler
+from django.db.models.signals import m2m_changed
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path
+from django.utils import timezone
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,7 +17,46 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.keys import Keys
+import importlib.util
+import os
 import time
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock, skipUnless
+
+from prometheus_client import REGISTRY
+
+from api.catalog import hobby_catalog
+from api.conditional import PROFILE, resource_versions
+from api.events import FRIEND_REQUEST_ACCEPTED, FRIEND_REQUEST_CREATED, FRIENDSHIP_REMOVED, EventBroker, get_broker
+from api.friend_graph import friend_graph
+from api.hobby_suggest import hobby_suggester
+from api.lsh import lsh_index
+from api.metrics import MetricsMiddleware
+from api.models import CustomUser, Hobby, FriendRequest, FriendRequestArchive
+from api.pagination import FriendPagination, FriendRequestPagination
+from api.scoring import similarity_engine
+from api.search_cache import search_cache
+from api.search_index import hobby_index
+from api.urls import async_api_urlpatterns
+from project import database
+
+
+def make_user(name, hobbies, date_of_birth=None):
+    user = CustomUser.objects.create_user(
+        username=name, email=f'{name}@example.com', password='password123', date_of_birth=date_of_birth
+    )
+    user.hobbies.add(*hobbies)
+    return user
+
+
+def app_queries(context):
+    # Without the stamp and catalog lookups, which only hit the database with the database cache backend
+    # (its writes also run in a savepoint)
+    return [
+        query for query in context.captured_queries
+        if 'django_cache' not in query['sql'] and 'SAVEPOINT' not in query['sql']
+    ]
 
 
 class ProfileTest(StaticLiveServerTestCase):
@@ -280,7 +330,7 @@ class ProfileTest(StaticLiveServerTestCase):
             )
 
             from api.models import Hobby
-            hobby = Hobby.objects.create(name='reading')
+            hobby, _ = Hobby.objects.upsert('reading')
             target_user.hobbies.add(hobby)
 
             main_window = self.driver.current_window_handle
@@ -365,4 +415,1308 @@ class ProfileTest(StaticLiveServerTestCase):
             print(f"Current URL: {self.driver.current_url}")
             print("Page source at time of error:")
             print(self.driver.page_source)
-            raise
\ No newline at end of file
+            raise
+
+
+class SearchUsersQueryTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        self.hobby = Hobby.objects.create(name='query-budget')
+        self.user = CustomUser.objects.create_user(
+            username='searcher', email='searcher@example.com', password='password123'
+        )
+        self.user.hobbies.add(self.hobby)
+        self.client.force_login(self.user)
+
+    def add_matches(self, count, offset=0):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(offset, offset + count):
+                other = CustomUser.objects.create_user(
+                    username=f'match{i}', email=f'match{i}@example.com', password='password123'
+                )
+                other.hobbies.add(self.hobby)
+                # Mix in friends and pending requests so every lookup path is exercised
+                if i % 3 == 0:
+                    self.user.friends.add(other)
+                elif i % 3 == 1:
+                    FriendRequest.objects.create(sender=other, receiver=self.user)
+
+    def count_search_queries(self):
+        # Keep the one-off index build out of the per-request budget
+        hobby_index.ensure_loaded()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/profile/search_users/')
+        self.assertEqual(response.status_code, 200)
+        return len(app_queries(ctx)), response.json()
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self.add_matches(2)
+        small_count, small_data = self.count_search_queries()
+        self.assertEqual(len(small_data['users']), 2)
+
+        self.add_matches(8, offset=2)
+        full_count, full_data = self.count_search_queries()
+        self.assertEqual(len(full_data['users']), 10)
+
+        self.assertEqual(small_count, full_count)
+
+    def test_friend_and_pending_flags(self):
+        self.add_matches(3)
+        _, data = self.count_search_queries()
+        flags = {u['username']: (u['is_friend'], u['has_pending_request']) for u in data['users']}
+        self.assertEqual(flags['match0'], (True, False))
+        self.assertEqual(flags['match1'], (False, True))
+        self.assertEqual(flags['match2'], (False, False))
+
+    def test_cursor_pages_match_numbered_pages(self):
+        self.add_matches(15)
+        hobby_index.ensure_loaded()
+
+        numbered = []
+        for page in (1, 2):
+            numbered += [u['id'] for u in self.client.get(
+                '/api/profile/search_users/', {'page': page}
+            ).json()['users']]
+
+        walked = []
+        params = {'cursor': '', 'include_total': 'true'}
+        while True:
+            data = self.client.get('/api/profile/search_users/', params).json()
+            self.assertEqual(data['total_users'], 15)
+            walked += [u['id'] for u in data['users']]
+            if not data['next']:
+                break
+            params['cursor'] = data['next']
+
+        self.assertEqual(walked, numbered)
+        self.assertEqual(len(walked), 15)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/profile/search_users/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+
+class HobbyIndexTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        self.hobbies = [Hobby.objects.create(name=f'index-hobby{i}') for i in range(3)]
+        self.user = CustomUser.objects.create_user(
+            username='indexed', email='indexed@example.com', password='password123'
+        )
+        self.user.hobbies.add(*self.hobbies)
+
+    def test_rank_orders_by_common_count_then_id(self):
+        one = make_user('one', self.hobbies[:1])
+        three = make_user('three', self.hobbies)
+        two = make_user('two', self.hobbies[:2])
+        also_one = make_user('also_one', self.hobbies[2:])
+
+        ranked = hobby_index.rank(self.user.id)
+        self.assertEqual(ranked, [(three.id, 3), (two.id, 2), (one.id, 1), (also_one.id, 1)])
+
+    def test_index_follows_hobby_and_user_changes(self):
+        other = make_user('other', self.hobbies[:1])
+        hobby_index.ensure_loaded()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.hobbies.add(self.hobbies[1])
+        self.assertEqual(hobby_index.rank(self.user.id), [(other.id, 2)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hobbies[1].users.remove(other)
+        self.assertEqual(hobby_index.rank(self.user.id), [(other.id, 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.hobbies.clear()
+        self.assertEqual(hobby_index.rank(self.user.id), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.hobbies.add(self.hobbies[2])
+            other.delete()
+        self.assertEqual(hobby_index.rank(self.user.id), [])
+
+    def test_rolled_back_changes_never_reach_the_index(self):
+        other = make_user('other', self.hobbies[:1])
+        hobby_index.ensure_loaded()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    other.hobbies.add(self.hobbies[1])
+                    raise IntegrityError
+            except IntegrityError:
+                pass
+        self.assertEqual(hobby_index.rank(self.user.id), [(other.id, 1)])
+
+
+class SearchCacheTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        search_cache.clear()
+        self.hobby = Hobby.objects.create(name='cache-hobby')
+        self.user = CustomUser.objects.create_user(
+            username='cached', email='cached@example.com', password='password123'
+        )
+        self.other = CustomUser.objects.create_user(
+            username='cache-other', email='cache-other@example.com', password='password123'
+        )
+        self.user.hobbies.add(self.hobby)
+        self.other.hobbies.add(self.hobby)
+
+    def test_repeat_searches_hit_the_cache(self):
+        first = search_cache.ranked(self.user.id)
+        second = search_cache.ranked(self.user.id)
+        self.assertIs(first, second)
+        self.assertEqual(search_cache.stats()['hits'], 1)
+        self.assertEqual(search_cache.stats()['misses'], 1)
+
+    def test_signals_invalidate_entries(self):
+        self.assertEqual(search_cache.ranked(self.user.id), [(self.other.id, 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.hobbies.remove(self.hobby)
+        self.assertEqual(search_cache.ranked(self.user.id), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.hobbies.add(self.hobby)
+        self.assertEqual(search_cache.ranked(self.user.id, max_birth_date=date(2000, 1, 1)), [])
+        self.other.date_of_birth = date(1990, 1, 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.save()
+        self.assertEqual(
+            search_cache.ranked(self.user.id, max_birth_date=date(2000, 1, 1)), [(self.other.id, 1)]
+        )
+
+        # Request status is annotated after ranking, so the entry stays valid
+        search_cache.ranked(self.user.id)
+        hits = search_cache.stats()['hits']
+        with self.captureOnCommitCallbacks(execute=True):
+            FriendRequest.objects.create(sender=self.other, receiver=self.user)
+        search_cache.ranked(self.user.id)
+        self.assertEqual(search_cache.stats()['hits'], hits + 1)
+
+    @override_settings(SEARCH_CACHE_SIZE=2)
+    def test_least_recently_used_entries_are_evicted(self):
+        search_cache.ranked(self.user.id, max_birth_date=date(2000, 1, 1))
+        search_cache.ranked(self.user.id, max_birth_date=date(2001, 1, 1))
+        search_cache.ranked(self.user.id, max_birth_date=date(2000, 1, 1))
+        search_cache.ranked(self.user.id, max_birth_date=date(2002, 1, 1))
+        self.assertEqual(search_cache.stats()['size'], 2)
+
+        search_cache.ranked(self.user.id, max_birth_date=date(2000, 1, 1))
+        self.assertEqual(search_cache.stats()['hits'], 2)
+        search_cache.ranked(self.user.id, max_birth_date=date(2001, 1, 1))
+        self.assertEqual(search_cache.stats()['misses'], 4)
+
+
+class SimilarityScoringTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        self.hobbies = [Hobby.objects.create(name=f'score-hobby{i}') for i in range(6)]
+        self.user = make_user('scorer', self.hobbies[:2])
+        self.collector = make_user('collector', self.hobbies, date_of_birth=date(1980, 1, 1))
+        self.twin = make_user('twin', self.hobbies[:2], date_of_birth=date(2000, 1, 1))
+        self.client.force_login(self.user)
+
+    def ranked_ids(self, score, **filters):
+        return [user_id for user_id, _ in similarity_engine.rank(self.user.id, score, **filters)]
+
+    def test_count_ties_but_normalised_scores_prefer_closer_match(self):
+        self.assertEqual(self.ranked_ids('count'), [self.collector.id, self.twin.id])
+        self.assertEqual(self.ranked_ids('jaccard'), [self.twin.id, self.collector.id])
+        self.assertEqual(self.ranked_ids('cosine'), [self.twin.id, self.collector.id])
+
+    def test_idf_weights_rare_hobbies_higher(self):
+        common = make_user('common', self.hobbies[:1])
+        make_user('common2', self.hobbies[:1])
+        rare = make_user('rare', self.hobbies[3:4])
+        self.user.hobbies.add(self.hobbies[3])
+
+        scores = dict(similarity_engine.rank(self.user.id, 'idf'))
+        self.assertGreater(scores[rare.id], scores[common.id])
+
+    def test_age_mask(self):
+        self.assertEqual(self.ranked_ids('jaccard', min_birth_date=date(1990, 1, 1)), [self.twin.id])
+        self.assertEqual(self.ranked_ids('jaccard', max_birth_date=date(1990, 1, 1)), [self.collector.id])
+
+    def test_search_users_score_parameter(self):
+        response = self.client.get('/api/profile/search_users/', {'score': 'jaccard'})
+        users = response.json()['users']
+        self.assertEqual([u['username'] for u in users], ['twin', 'collector'])
+        self.assertEqual(users[0]['score'], 1.0)
+        self.assertEqual(users[1]['common_hobbies_count'], 2)
+
+        response = self.client.get('/api/profile/search_users/', {'score': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_patched_matrix_matches_rebuilt(self):
+        similarity_engine.rank(self.user.id, 'idf')
+        with self.captureOnCommitCallbacks(execute=True):
+            newcomer = make_user('newcomer', self.hobbies[1:5], date_of_birth=date(1995, 1, 1))
+            self.twin.hobbies.remove(self.hobbies[0])
+            self.collector.date_of_birth = date(2001, 1, 1)
+            self.collector.save()
+            self.user.hobbies.add(Hobby.objects.create(name='score-hobby-new'))
+
+        with mock.patch.object(similarity_engine, '_rebuild', wraps=similarity_engine._rebuild) as rebuild:
+            patched = {score: similarity_engine.rank(self.user.id, score, min_birth_date=date(1990, 1, 1))
+                       for score in ('count', 'jaccard', 'cosine', 'idf')}
+        rebuild.assert_not_called()
+        self.assertEqual([user_id for user_id, _ in patched['count']], [self.collector.id, self.twin.id, newcomer.id])
+
+        similarity_engine._revision = None
+        for score, ranked in patched.items():
+            rebuilt = similarity_engine.rank(self.user.id, score, min_birth_date=date(1990, 1, 1))
+            self.assertEqual([user_id for user_id, _ in ranked], [user_id for user_id, _ in rebuilt])
+            for (_, patched_score), (_, rebuilt_score) in zip(ranked, rebuilt):
+                self.assertAlmostEqual(patched_score, rebuilt_score, places=5)
+
+    def test_unindexed_changes_keep_revision(self):
+        hobby_index.ensure_loaded()
+        revision = hobby_index.revision
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=['last_login'])
+        self.user.hobbies.add(self.hobbies[0])
+        self.assertEqual(hobby_index.revision, revision)
+
+
+class MinHashLSHTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        self.hobbies = [Hobby.objects.create(name=f'lsh-hobby{i}') for i in range(4)]
+        self.user = make_user('lsh-user', self.hobbies[:3])
+        self.twin = make_user('lsh-twin', self.hobbies[:3])
+        self.stranger = make_user('lsh-stranger', self.hobbies[3:])
+        self.client.force_login(self.user)
+
+    def test_identical_hobby_sets_always_collide(self):
+        candidates = lsh_index.candidates(self.user.id)
+        self.assertIn(self.twin.id, candidates)
+        self.assertNotIn(self.stranger.id, candidates)
+        self.assertNotIn(self.user.id, candidates)
+
+    def test_signatures_update_incrementally(self):
+        lsh_index.ensure_loaded()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.stranger.hobbies.set(self.hobbies[:3])
+        self.assertIn(self.stranger.id, lsh_index.candidates(self.user.id))
+
+        twin_id = self.twin.id
+        try:
+            with transaction.atomic():
+                self.twin.delete()
+                raise IntegrityError
+        except IntegrityError:
+            pass
+        self.assertIn(twin_id, lsh_index.candidates(self.user.id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CustomUser.objects.get(pk=twin_id).delete()
+        self.assertNotIn(twin_id, lsh_index.candidates(self.user.id))
+
+    def test_search_users_approximate_mode(self):
+        response = self.client.get('/api/profile/search_users/', {'mode': 'approximate'})
+        users = response.json()['users']
+        self.assertEqual([u['username'] for u in users], ['lsh-twin'])
+        self.assertEqual(users[0]['common_hobbies_count'], 3)
+
+        response = self.client.get('/api/profile/search_users/', {'mode': 'approximate', 'score': 'idf'})
+        self.assertEqual(response.status_code, 400)
+
+
+class MetricsTest(TestCase):
+    def test_requests_are_recorded_per_endpoint(self):
+        user = CustomUser.objects.create_user(
+            username='metrics-user', email='metrics-user@example.com', password='password123'
+        )
+        self.client.force_login(user)
+        self.client.get('/api/profile/me/')
+
+        body = self.client.get('/metrics').content.decode()
+        self.assertIn('http_request_duration_seconds_count{method="GET",view="profile-me"}', body)
+        self.assertIn('http_requests_total{method="GET",status="200",view="profile-me"}', body)
+        self.assertIn('http_db_queries_count{method="GET",view="profile-me"}', body)
+        self.assertIn('http_response_size_bytes_bucket{le="1000.0",method="GET",view="profile-me"}', body)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_token_protects_metrics(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+
+    def test_pool_stats_are_exported(self):
+        pooled = mock.MagicMock()
+        pooled.__iter__.return_value = ['default']
+        pooled.settings = {'default': {'OPTIONS': {'pool': {'max_size': 10}}}}
+        pooled['default'].pool.get_stats.return_value = {'pool_size': 4, 'pool_available': 3}
+        with mock.patch('api.metrics.connections', pooled):
+            body = self.client.get('/metrics').content.decode()
+        self.assertIn(f'db_pool_pool_available{{alias="default",pid="{os.getpid()}"}} 3.0', body)
+        self.assertNotIn('db_pool', self.client.get('/metrics').content.decode())
+
+    def test_async_chain_is_not_wrapped(self):
+        chain = ASGIHandler()._middleware_chain
+        # Outermost and awaited directly, not run through sync_to_async; every layer below is async too
+        self.assertTrue(iscoroutinefunction(chain))
+        self.assertIsInstance(chain.__wrapped__, MetricsMiddleware)
+        self.assertTrue(iscoroutinefunction(chain.__wrapped__.get_response))
+
+    @override_settings(ROOT_URLCONF='api.tests')
+    def test_async_requests_count_their_queries(self):
+        user = CustomUser.objects.create_user(
+            username='metrics-async', email='metrics-async@example.com', password='password123'
+        )
+        self.async_client.force_login(user)
+        labels = {'view': 'profile-me', 'method': 'GET'}
+        before = [REGISTRY.get_sample_value(f'http_db_queries_{sample}', labels) or 0 for sample in ('count', 'sum')]
+
+        response = async_to_sync(self.async_client.get)('/async/profile/me/')
+        self.assertEqual(response.status_code, 200)
+        count, queries = (
+            REGISTRY.get_sample_value(f'http_db_queries_{sample}', labels) - value
+            for sample, value in zip(('count', 'sum'), before)
+        )
+        self.assertEqual(count, 1)
+        self.assertGreater(queries, 0)
+
+
+class HobbyCatalogTest(TestCase):
+    def setUp(self):
+        self.hobby = Hobby.objects.create(name='catalog-hobby')
+        self.user = CustomUser.objects.create_user(
+            username='catalog-user', email='catalog-user@example.com', password='password123'
+        )
+        self.user.hobbies.add(self.hobby)
+        self.client.force_login(self.user)
+        hobby_catalog.bump()
+
+    def test_catalog_is_serialized_once_per_version(self):
+        with CaptureQueriesContext(connection) as first_queries:
+            first = self.client.get('/api/hobbies/').json()
+        self.assertIn({'id': self.hobby.id, 'name': 'catalog-hobby', 'user_has_hobby': True}, first)
+        self.assertTrue(all(not h['user_has_hobby'] for h in first if h['id'] != self.hobby.id))
+
+        with CaptureQueriesContext(connection) as second_queries:
+            second = self.client.get('/api/hobbies/').json()
+        self.assertEqual(first, second)
+        # Only the user's own hobby IDs are read once the catalog is cached
+        self.assertEqual(len(app_queries(second_queries)), len(app_queries(first_queries)) - 1)
+
+    def test_catalog_changes_with_hobbies(self):
+        self.client.get('/api/hobbies/')
+        with self.captureOnCommitCallbacks(execute=True):
+            Hobby.objects.create(name='catalog-new')
+        names = [h['name'] for h in self.client.get('/api/hobbies/').json()]
+        self.assertIn('catalog-new', names)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hobby.delete()
+        names = [h['name'] for h in self.client.get('/api/hobbies/').json()]
+        self.assertNotIn('catalog-hobby', names)
+
+    @override_settings(
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}, HOBBY_INDEX_MAX_AGE=0
+    )
+    def test_per_process_version_expires(self):
+        self.client.get('/api/hobbies/')
+        # As if another worker renamed it; its bump would not reach this process's cache
+        Hobby.objects.filter(pk=self.hobby.pk).update(name='catalog-renamed')
+        names = [h['name'] for h in self.client.get('/api/hobbies/').json()]
+        self.assertIn('catalog-renamed', names)
+
+
+class HobbySuggestTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        hobby_suggester.invalidate()
+        self.user = CustomUser.objects.create_user(
+            username='suggest-user', email='suggest-user@example.com', password='password123'
+        )
+        self.client.force_login(self.user)
+        self.board_games = Hobby.objects.create(name='board games')
+        self.boxing = Hobby.objects.create(name='boxing')
+        self.user.hobbies.add(self.boxing)
+
+    def suggest(self, query, **params):
+        response = self.client.get('/api/hobbies/suggest/', {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [hobby['name'] for hobby in response.json()]
+
+    def test_prefix_matches_ranked_by_popularity(self):
+        self.assertEqual(self.suggest('bo'), ['boxing', 'board games'])
+        self.assertEqual(self.suggest('GAM'), ['Gaming', 'board games'])
+        self.assertEqual(self.suggest('bo', limit=1), ['boxing'])
+        self.assertEqual(self.suggest('  '), [])
+
+    def test_tolerates_a_typo(self):
+        self.assertIn('Photography', self.suggest('photgr'))
+        self.assertIn('boxing', self.suggest('bxoing'))
+        self.assertNotIn('boxing', self.suggest('zzzing'))
+
+    def test_follows_hobby_changes(self):
+        self.suggest('bo')
+        with self.captureOnCommitCallbacks(execute=True):
+            hobby = Hobby.objects.create(name='bouldering')
+        self.assertIn('bouldering', self.suggest('boul'))
+        hobby.name = 'climbing'
+        with self.captureOnCommitCallbacks(execute=True):
+            hobby.save()
+        self.assertEqual(self.suggest('boul'), [])
+        self.assertIn('climbing', self.suggest('clim'))
+        with self.captureOnCommitCallbacks(execute=True):
+            hobby.delete()
+        self.assertEqual(self.suggest('clim'), [])
+
+    def test_rebuilds_when_stale(self):
+        self.suggest('bo')
+        # As if another worker created it; its signal never reaches this process
+        Hobby.objects.bulk_create([Hobby(name='bouldering')])
+        self.assertEqual(self.suggest('boul'), [])
+        with override_settings(HOBBY_INDEX_MAX_AGE=0):
+            self.assertIn('bouldering', self.suggest('boul'))
+
+
+class ProfileHobbiesTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        self.user = CustomUser.objects.create_user(
+            username='bulk-user', email='bulk-user@example.com', password='password123'
+        )
+        self.client.force_login(self.user)
+        self.hobbies = [Hobby.objects.create(name=f'bulk-{i}') for i in range(4)]
+        self.ids = [hobby.id for hobby in self.hobbies]
+        self.user.hobbies.add(*self.ids[:2])
+
+    def test_replace_applies_diff_with_one_signal_per_direction(self):
+        hobby_index.ensure_loaded()
+        events = []
+
+        def record(sender, action, pk_set, **kwargs):
+            events.append((action, set(pk_set)))
+
+        m2m_changed.connect(record, sender=CustomUser.hobbies.through)
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.put(
+                    '/api/profile/hobbies/', {'hobbies': self.ids[1:]}, content_type='application/json'
+                )
+        finally:
+            m2m_changed.disconnect(record, sender=CustomUser.hobbies.through)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'hobbies': sorted(self.ids[1:]), 'added': sorted(self.ids[2:]), 'removed': [self.ids[0]]
+        })
+        self.assertEqual(set(self.user.hobbies.values_list('id', flat=True)), set(self.ids[1:]))
+        self.assertEqual([action for action, _ in events], ['pre_remove', 'post_remove', 'pre_add', 'post_add'])
+        self.assertEqual(events[-1][1], set(self.ids[2:]))
+        self.assertEqual(set(hobby_index.hobby_ids(self.user.id)), set(self.ids[1:]))
+
+    def test_add_and_remove_lists(self):
+        response = self.client.patch(
+            '/api/profile/hobbies/', {'add': self.ids[2:], 'remove': [self.ids[0]]}, content_type='application/json'
+        )
+        self.assertEqual(response.json()['hobbies'], sorted(self.ids[1:]))
+        response = self.client.patch('/api/profile/hobbies/', {'add': [self.ids[1]]}, content_type='application/json')
+        self.assertEqual(response.json()['added'], [])
+
+    def test_rejects_invalid_input(self):
+        for method, data in (
+            ('put', {}),
+            ('put', {'hobbies': ['x']}),
+            ('put', {'hobbies': [0]}),
+            ('patch', {'add': [self.ids[2]], 'remove': [self.ids[2]]}),
+        ):
+            response = getattr(self.client, method)('/api/profile/hobbies/', data, content_type='application/json')
+            self.assertEqual(response.status_code, 400, data)
+        self.assertEqual(set(self.user.hobbies.values_list('id', flat=True)), set(self.ids[:2]))
+
+
+class HobbyNameTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='name-user', email='name-user@example.com', password='password123'
+        )
+        self.client.force_login(self.user)
+
+    def test_names_are_unique_ignoring_case(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Hobby.objects.create(name='reading')
+
+        hobby, created = Hobby.objects.upsert('READING')
+        self.assertFalse(created)
+        self.assertEqual(hobby.name, 'Reading')
+        self.assertEqual(Hobby.objects.by_name('rEaDiNg').get(), hobby)
+
+    def test_create_hobby_reuses_existing_name(self):
+        response = self.client.post('/api/hobbies/create_hobby/', {'name': ' Cooking '}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Cooking')
+        self.assertFalse(response.json()['created'])
+        self.assertEqual(Hobby.objects.by_name('cooking').count(), 1)
+        self.assertTrue(self.user.hobbies.filter(name='Cooking').exists())
+
+        response = self.client.post('/api/hobbies/create_hobby/', {'name': 'Knitting'}, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['name'], 'knitting')
+
+
+@skipUnless(connection.vendor == 'sqlite', 'rebuilds the old hobby table with SQLite DDL')
+class DedupeHobbiesTest(TransactionTestCase):
+    COUNTERS = ('user_count', 'recent_adds')
+
+    def setUp(self):
+        # Back to the hobby table from before the counters and the Lower(name) index, where duplicates exist
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'api_hobby' AND sql IS NOT NULL"
+            )
+            self.indexes = cursor.fetchall()
+            for name, _ in self.indexes:
+                cursor.execute(f'DROP INDEX "{name}"')
+            for column in self.COUNTERS:
+                cursor.execute(f'ALTER TABLE api_hobby DROP COLUMN "{column}"')
+
+    def tearDown(self):
+        with connection.cursor() as cursor:
+            for column in self.COUNTERS:
+                cursor.execute(
+                    f'ALTER TABLE api_hobby ADD COLUMN "{column}" integer unsigned NOT NULL DEFAULT 0 '
+                    f'CHECK ("{column}" >= 0)'
+                )
+            for _, sql in self.indexes:
+                cursor.execute(sql)
+
+    def add_hobby(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute('INSERT INTO api_hobby (name, created_at) VALUES (%s, %s)', [name, timezone.now()])
+            return cursor.lastrowid
+
+    def test_merges_into_the_oldest_on_the_old_schema(self):
+        keeper = self.add_hobby('Origami')
+        duplicates = [self.add_hobby('origami'), self.add_hobby('ORIGAMI')]
+        users = [
+            CustomUser.objects.create_user(username=f'dedupe{i}', email=f'dedupe{i}@example.com', password='pw')
+            for i in range(3)
+        ]
+        through = CustomUser.hobbies.through
+        through.objects.bulk_create([
+            through(customuser=users[0], hobby_id=keeper),
+            through(customuser=users[0], hobby_id=duplicates[0]),
+            through(customuser=users[1], hobby_id=duplicates[0]),
+            through(customuser=users[2], hobby_id=duplicates[1]),
+        ])
+
+        out = StringIO()
+        call_command('dedupe_hobbies', stdout=out)
+        self.assertIn('Removed 2 duplicate hobbies', out.getvalue())
+        self.assertEqual(
+            list(Hobby.objects.filter(name__iexact='origami').values_list('id', flat=True)), [keeper]
+        )
+        self.assertEqual(
+            sorted(through.objects.filter(hobby_id=keeper).values_list('customuser_id', flat=True)),
+            [user.id for user in users]
+        )
+        self.assertFalse(through.objects.filter(hobby_id__in=duplicates).exists())
+
+
+class HobbyCountersTest(TestCase):
+    def setUp(self):
+        self.users = [
+            CustomUser.objects.create_user(username=f'count-user{i}', email=f'count{i}@example.com', password='pw')
+            for i in range(3)
+        ]
+        self.hobby = Hobby.objects.create(name='counted')
+        self.other = Hobby.objects.create(name='counted-other')
+
+    def counts(self, hobby):
+        hobby.refresh_from_db()
+        return hobby.user_count, hobby.recent_adds
+
+    def test_counters_follow_membership_changes(self):
+        self.users[0].hobbies.add(self.hobby, self.other)
+        self.hobby.users.add(self.users[1], self.users[2])
+        self.assertEqual(self.counts(self.hobby), (3, 3))
+
+        self.users[0].hobbies.remove(self.hobby)
+        self.users[0].hobbies.remove(self.hobby)  # Not a member any more, nothing to count
+        self.hobby.users.remove(self.users[0], self.users[1])
+        self.assertEqual(self.counts(self.hobby), (1, 3))
+
+        self.users[0].hobbies.clear()
+        self.assertEqual(self.counts(self.other), (0, 1))
+        self.users[2].delete()
+        self.assertEqual(self.counts(self.hobby), (0, 3))
+
+    def test_reconcile_repairs_drift_and_decays_recent_adds(self):
+        self.hobby.users.add(*self.users)
+        Hobby.objects.filter(id=self.hobby.id).update(user_count=7)
+        call_command('reconcile_hobby_counts', stdout=StringIO())
+        self.assertEqual(self.counts(self.hobby), (3, 1))
+
+    def test_trending_reads_counters(self):
+        call_command('reconcile_hobby_counts', decay=0, stdout=StringIO())
+        self.other.users.add(*self.users)
+        self.client.force_login(self.users[0])
+        trending = self.client.get('/api/hobbies/trending/', {'limit': 2}).json()
+        self.assertEqual(trending[0], {'id': self.other.id, 'name': 'counted-other', 'user_count': 3, 'recent_adds': 3})
+        self.assertEqual(len(trending), 2)
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='etag-user', email='etag-user@example.com', password='password123'
+        )
+        self.friend = CustomUser.objects.create_user(
+            username='etag-friend', email='etag-friend@example.com', password='password123'
+        )
+        self.client.force_login(self.user)
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def assert_changes(self, url, change):
+        etag = self.client.get(url)['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        # Only the session and user lookups of authentication
+        self.assertEqual(len(app_queries(queries)), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            change()
+        response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_profile_and_hobbies(self):
+        hobby = Hobby.objects.get(name='Reading')
+        self.assert_changes('/api/profile/me/', lambda: self.user.hobbies.add(hobby))
+        self.assert_changes('/api/hobbies/', lambda: self.user.hobbies.remove(hobby))
+        self.assert_changes('/api/hobbies/', lambda: Hobby.objects.create(name='etag-hobby'))
+        self.assert_changes('/api/profile/me/', lambda: self.client.patch(
+            '/api/profile/update_profile/', {'date_of_birth': '1990-01-01'}, content_type='application/json'
+        ))
+
+    def test_friend_requests_and_friends(self):
+        self.assert_changes('/api/friend-requests/pending/', lambda: FriendRequest.objects.create(
+            sender=self.friend, receiver=self.user
+        ))
+
+        def rename_friend():
+            self.friend.username = 'etag-renamed'
+            self.friend.save()
+        self.assert_changes('/api/friend-requests/pending/', rename_friend)
+
+        self.assert_changes('/api/friend-requests/friends/', lambda: self.user.friends.add(self.friend))
+        self.assert_changes('/api/friend-requests/friends/', lambda: self.friend.hobbies.add(Hobby.objects.first()))
+
+    def test_etag_is_per_user(self):
+        etag = self.client.get('/api/profile/me/')['ETag']
+        self.client.force_login(self.friend)
+        self.assertEqual(self.revalidate('/api/profile/me/', etag).status_code, 200)
+
+    def test_database_cache_bumps_without_incr(self):
+        # Its incr reads then writes, so two concurrent bumps could share a value
+        before = resource_versions.get(self.user.id, (PROFILE,))
+        with mock.patch.object(DatabaseCache, 'incr', side_effect=AssertionError):
+            resource_versions.bump(PROFILE, [self.user.id])
+        self.assertNotEqual(resource_versions.get(self.user.id, (PROFILE,)), before)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_atomic_backends_increment_stamps(self):
+        resource_versions.bump(PROFILE, [self.user.id])
+        [first] = resource_versions.get(self.user.id, (PROFILE,))
+        resource_versions.bump(PROFILE, [self.user.id])
+        self.assertEqual(resource_versions.get(self.user.id, (PROFILE,)), [first + 1])
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_no_etag_with_per_process_cache(self):
+        # Another worker's cache may have missed a bump, so its stamps prove nothing
+        response = self.client.get('/api/profile/me/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+        self.assertEqual(self.revalidate('/api/profile/me/', '*').status_code, 200)
+
+
+class FriendRequestListTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='inbox-user', email='inbox-user@example.com', password='password123'
+        )
+        self.senders = [
+            CustomUser.objects.create_user(username=f'inbox-sender{i}', email=f'inbox{i}@example.com', password='pw')
+            for i in range(5)
+        ]
+        self.client.force_login(self.user)
+
+    def send(self, senders):
+        for sender in senders:
+            FriendRequest.objects.create(sender=sender, receiver=self.user)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'page_size': 50})
+        return len(app_queries(queries)), len(response.json()['results'])
+
+    def test_query_count_does_not_grow_with_rows(self):
+        urls = ('/api/friend-requests/', '/api/friend-requests/pending/')
+        self.send(self.senders[:1])
+        few = [self.count_queries(url) for url in urls]
+        self.send(self.senders[1:])
+        many = [self.count_queries(url) for url in urls]
+        self.assertEqual([rows for _, rows in many], [5, 5])
+        self.assertEqual([queries for queries, _ in many], [queries for queries, _ in few])
+
+    def test_pending_pages_newest_first(self):
+        self.send(self.senders)
+        FriendRequest.objects.filter(sender=self.senders[0]).update(status=FriendRequest.REJECTED)
+
+        response = self.client.get('/api/friend-requests/pending/', {'page_size': 3}).json()
+        names = [request['sender_username'] for request in response['results']]
+        response = self.client.get(response['next']).json()
+        names += [request['sender_username'] for request in response['results']]
+        self.assertEqual(names, [f'inbox-sender{i}' for i in (4, 3, 2, 1)])
+        self.assertIsNone(response['next'])
+
+    def test_pages_without_page_parameters(self):
+        self.send(self.senders)
+        for url in ('/api/friend-requests/', '/api/friend-requests/pending/'):
+            with mock.patch.object(FriendRequestPagination, 'page_size', 2):
+                response = self.client.get(url).json()
+            self.assertEqual([request['sender_username'] for request in response['results']],
+                             ['inbox-sender4', 'inbox-sender3'])
+            self.assertIsNotNone(response['next'])
+
+    def test_unpaginated_array_is_capped(self):
+        # The shape the built SPA bundle reads
+        self.send(self.senders)
+        for url in ('/api/friend-requests/', '/api/friend-requests/pending/'):
+            with mock.patch.object(FriendRequestPagination, 'max_page_size', 3):
+                response = self.client.get(url, {'unpaginated': 'true', 'page_size': 5}).json()
+            self.assertEqual([request['sender_username'] for request in response],
+                             ['inbox-sender4', 'inbox-sender3', 'inbox-sender2'])
+
+
+class FriendsListTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='friends-user', email='friends-user@example.com', password='password123'
+        )
+        self.hobbies = list(Hobby.objects.all()[:3])
+        self.client.force_login(self.user)
+
+    def befriend(self, names):
+        for name in names:
+            friend = CustomUser.objects.create_user(username=name, email=f'{name}@example.com', password='pw')
+            friend.hobbies.add(*self.hobbies)
+            self.user.friends.add(friend)
+
+    def test_bounded_queries_and_slim_payload(self):
+        self.befriend(['friend-a'])
+        with CaptureQueriesContext(connection) as few:
+            self.client.get('/api/friend-requests/friends/', {'page_size': 50})
+        self.befriend(['friend-b', 'friend-c', 'friend-d'])
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get('/api/friend-requests/friends/', {'page_size': 50})
+        self.assertEqual(len(app_queries(many)), len(app_queries(few)))
+
+        friend = response.json()['results'][0]
+        self.assertEqual(set(friend), {'id', 'username', 'date_of_birth', 'hobbies'})
+        self.assertEqual(len(friend['hobbies']), 3)
+
+    def test_cursor_pages_by_username(self):
+        self.befriend(['friend-c', 'friend-a', 'friend-b'])
+        page = self.client.get('/api/friend-requests/friends/', {'page_size': 2}).json()
+        names = [friend['username'] for friend in page['results']]
+        names += [friend['username'] for friend in self.client.get(page['next']).json()['results']]
+        self.assertEqual(names, ['friend-a', 'friend-b', 'friend-c'])
+
+        page = self.client.get('/api/friend-requests/friends/', {'ordering': '-username', 'page_size': 50}).json()
+        self.assertEqual([friend['username'] for friend in page['results']], ['friend-c', 'friend-b', 'friend-a'])
+
+    def test_pages_without_page_parameters(self):
+        self.befriend(['friend-c', 'friend-a', 'friend-b'])
+        with mock.patch.object(FriendPagination, 'page_size', 2):
+            page = self.client.get('/api/friend-requests/friends/').json()
+        self.assertEqual([friend['username'] for friend in page['results']], ['friend-a', 'friend-b'])
+        self.assertIsNotNone(page['next'])
+
+    def test_unpaginated_array_is_capped(self):
+        # The shape the built SPA bundle reads
+        self.befriend(['friend-c', 'friend-a', 'friend-b'])
+        with mock.patch.object(FriendPagination, 'max_page_size', 2):
+            friends = self.client.get('/api/friend-requests/friends/', {'unpaginated': 'true'}).json()
+        self.assertEqual([friend['username'] for friend in friends], ['friend-a', 'friend-b'])
+
+
+class FriendGraphTest(TestCase):
+    def setUp(self):
+        friend_graph.invalidate()
+        hobby_index.invalidate()
+        names = ['me', 'a', 'b', 'c', 'd', 'e']
+        self.users = {
+            name: CustomUser.objects.create_user(username=f'graph-{name}', email=f'graph-{name}@example.com', password='pw')
+            for name in names
+        }
+        for left, right in (('me', 'a'), ('me', 'b'), ('a', 'c'), ('b', 'c'), ('a', 'd'), ('c', 'e')):
+            self.users[left].friends.add(self.users[right])
+        self.client.force_login(self.users['me'])
+
+    def ids(self, *names):
+        return [self.users[name].id for name in names]
+
+    def suggested(self, **params):
+        return [user['username'] for user in self.client.get('/api/friend-requests/suggestions/', params).json()]
+
+    def test_mutual_friends(self):
+        response = self.client.get('/api/friend-requests/mutual_friends/', {'user_id': self.users['c'].id}).json()
+        self.assertEqual(response['count'], 2)
+        self.assertEqual([friend['username'] for friend in response['friends']], ['graph-a', 'graph-b'])
+        self.assertEqual(self.client.get('/api/friend-requests/mutual_friends/').status_code, 400)
+
+    def test_suggestions_rank_friends_of_friends(self):
+        self.assertEqual(self.suggested(), ['graph-c', 'graph-d'])
+
+        FriendRequest.objects.create(sender=self.users['me'], receiver=self.users['c'])
+        self.assertEqual(self.suggested(), ['graph-d'])
+
+    def test_hobby_overlap_blends_into_score(self):
+        hobbies = list(Hobby.objects.all()[:3])
+        self.users['me'].hobbies.add(*hobbies)
+        self.users['d'].hobbies.add(*hobbies)
+        suggestions = self.client.get('/api/friend-requests/suggestions/', {'hobby_weight': 1}).json()
+        self.assertEqual(suggestions[0]['username'], 'graph-d')
+        self.assertEqual((suggestions[0]['mutual_friends'], suggestions[0]['common_hobbies']), (1, 3))
+
+        for hobby_weight in ('nan', 'inf', '-inf', 'heavy'):
+            response = self.client.get('/api/friend-requests/suggestions/', {'hobby_weight': hobby_weight})
+            self.assertEqual(response.status_code, 400, hobby_weight)
+
+    def test_follows_friendship_changes(self):
+        friend_graph.ensure_loaded()
+        try:
+            with transaction.atomic():
+                self.users['me'].friends.remove(self.users['b'])
+                raise IntegrityError
+        except IntegrityError:
+            pass
+        self.assertEqual(friend_graph.friend_ids(self.users['me'].id).tolist(), self.ids('a', 'b'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users['me'].friends.remove(self.users['a'])
+        self.assertEqual(friend_graph.mutual_friend_ids(*self.ids('me', 'c')).tolist(), self.ids('b'))
+        self.assertEqual(self.suggested(), ['graph-c'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users['c'].friends.clear()
+        self.assertEqual(friend_graph.friend_ids(self.users['b'].id).tolist(), self.ids('me'))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users['d'].delete()
+        self.assertEqual(friend_graph.friend_ids(self.users['a'].id).tolist(), [])
+
+    def test_compaction_keeps_the_graph(self):
+        friend_graph.ensure_loaded()
+        friend_graph.COMPACT_AFTER = 0
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.users['me'].friends.add(self.users['e'])
+                self.users['me'].friends.remove(self.users['b'])
+        finally:
+            del friend_graph.COMPACT_AFTER
+        self.assertEqual(friend_graph.friend_ids(self.users['me'].id).tolist(), sorted(self.ids('a', 'e')))
+        self.assertEqual(friend_graph.friend_ids(self.users['e'].id).tolist(), sorted(self.ids('me', 'c')))
+
+
+class BulkRespondTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='bulk-receiver', email='bulk-receiver@example.com', password='password123'
+        )
+        self.senders = [
+            CustomUser.objects.create_user(username=f'bulk-sender{i}', email=f'bulk-sender{i}@example.com', password='pw')
+            for i in range(4)
+        ]
+        self.requests = [FriendRequest.objects.create(sender=sender, receiver=self.user) for sender in self.senders]
+        self.client.force_login(self.user)
+
+    def post(self, action, data):
+        return self.client.post(f'/api/friend-requests/{action}/', data, content_type='application/json')
+
+    def test_bulk_accept_adds_friendships(self):
+        friend_graph.ensure_loaded()
+        foreign = FriendRequest.objects.create(sender=self.senders[1], receiver=self.senders[0])
+        ids = [request.id for request in self.requests[:3]] + [foreign.id]
+
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as queries:
+            response = self.post('bulk_accept', {'ids': ids})
+        self.assertEqual(response.json(), {'updated': ids[:3], 'skipped': [foreign.id]})
+        # Lock, update, one bulk insert and the pending and friend counters, whatever the number of requests
+        self.assertEqual(len([q for q in queries if q['sql'].startswith(('SELECT "api_friendrequest"', 'UPDATE', 'INSERT'))]), 6)
+
+        self.assertEqual(
+            set(self.user.friends.values_list('id', flat=True)), {sender.id for sender in self.senders[:3]}
+        )
+        self.assertTrue(self.senders[0].friends.filter(id=self.user.id).exists())
+        self.assertEqual(friend_graph.friend_ids(self.user.id).tolist(), [sender.id for sender in self.senders[:3]])
+        self.assertEqual(FriendRequest.objects.get(id=foreign.id).status, FriendRequest.PENDING)
+
+    def test_bulk_reject_all(self):
+        response = self.post('bulk_reject', {'all': True})
+        self.assertEqual(response.json(), {'updated': [request.id for request in self.requests]})
+        self.assertFalse(FriendRequest.objects.filter(receiver=self.user, status=FriendRequest.PENDING).exists())
+        self.assertFalse(self.user.friends.exists())
+        self.assertEqual(self.post('bulk_reject', {'ids': 'all'}).status_code, 400)
+
+
+class FriendRequestPairTest(TestCase):
+    def setUp(self):
+        self.alice = CustomUser.objects.create_user(username='pair-alice', email='pair-a@example.com', password='pw')
+        self.bob = CustomUser.objects.create_user(username='pair-bob', email='pair-b@example.com', password='pw')
+
+    def send(self, sender, receiver):
+        self.client.force_login(sender)
+        return self.client.post('/api/friend-requests/', {'receiver': receiver.id}, content_type='application/json')
+
+    def test_one_request_per_pair(self):
+        self.assertEqual(self.send(self.alice, self.bob).status_code, 201)
+        self.assertEqual(self.send(self.bob, self.alice).status_code, 400)
+        request = FriendRequest.objects.between(self.bob.id, self.alice.id).get()
+        self.assertEqual((request.user_low_id, request.user_high_id), tuple(sorted((self.alice.id, self.bob.id))))
+
+        # A new request after a rejection reuses the row, from the new sender
+        request.reject()
+        self.assertEqual(self.send(self.bob, self.alice).status_code, 200)
+        request.refresh_from_db()
+        self.assertEqual((request.sender, request.receiver, request.status), (self.bob, self.alice, FriendRequest.PENDING))
+
+        # Also after an accepted request whose friendship has since ended
+        request.accept()
+        self.alice.friends.remove(self.bob)
+        self.assertEqual(self.send(self.alice, self.bob).status_code, 200)
+        request.refresh_from_db()
+        self.assertEqual((request.sender, request.status), (self.alice, FriendRequest.PENDING))
+
+    def test_concurrent_request_for_the_pair(self):
+        theirs = FriendRequest.objects.create(sender=self.bob, receiver=self.alice)
+        # As if bob's request committed between alice's lookup and insert
+        lookups = [FriendRequest.objects.none(), FriendRequest.objects.filter(id=theirs.id)]
+        with mock.patch.object(FriendRequest.objects, 'between', side_effect=lookups):
+            response = self.send(self.alice, self.bob)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'A friend request already exists between these users'})
+
+        self.client.force_login(self.alice)
+        response = self.client.post('/api/friend-requests/', {'receiver': 'bob'}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_backfill_fills_pairs_and_drops_opposite_duplicates(self):
+        rejected = FriendRequest.objects.create(sender=self.alice, receiver=self.bob, status=FriendRequest.REJECTED)
+        FriendRequest.objects.update(user_low=None, user_high=None)
+        pending = FriendRequest.objects.create(sender=self.bob, receiver=self.alice)
+        carol = CustomUser.objects.create_user(username='pair-carol', email='pair-c@example.com', password='pw')
+        other = FriendRequest.objects.create(sender=carol, receiver=self.alice)
+        FriendRequest.objects.filter(id=other.id).update(user_low=None, user_high=None)
+
+        call_command('backfill_friend_request_pairs', stdout=StringIO())
+        self.assertFalse(FriendRequest.objects.filter(id=rejected.id).exists())
+        self.assertTrue(FriendRequest.objects.filter(id=pending.id).exists())
+        self.assertEqual(FriendRequest.objects.between(self.alice.id, carol.id).get(), other)
+
+
+class DatabaseConfigTest(TestCase):
+    def test_postgresql_pool_replaces_persistent_connections(self):
+        env = {'DATABASE_POOL': 'True', 'DATABASE_POOL_MAX_SIZE': '20', 'DATABASE_CONN_MAX_AGE': '300'}
+        with mock.patch.dict(os.environ, env):
+            options = database.connection_options(database.engines['postgresql'])
+        self.assertEqual(options['CONN_MAX_AGE'], 0)
+        self.assertTrue(options['CONN_HEALTH_CHECKS'])
+        self.assertEqual(options['OPTIONS']['pool'], {'min_size': 2, 'max_size': 20, 'timeout': 10.0})
+
+        with mock.patch.dict(os.environ, {'DATABASE_CONN_MAX_AGE': '300'}):
+            options = database.connection_options(database.engines['postgresql'])
+        self.assertEqual((options['CONN_MAX_AGE'], options['OPTIONS']), (300, {}))
+
+    def test_sqlite_pragmas(self):
+        with mock.patch.dict(os.environ, {'SQLITE_BUSY_TIMEOUT': '250'}):
+            options = database.connection_options(database.engines['sqlite'])
+        self.assertEqual(
+            options['OPTIONS']['init_command'],
+            'PRAGMA journal_mode=WAL;PRAGMA busy_timeout=250;PRAGMA synchronous=NORMAL;PRAGMA mmap_size=134217728'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], 5000)
+
+    def openshift_config(self, **env):
+        with mock.patch.dict(os.environ, {'OPENSHIFT_BUILD_NAME': 'build-1', **env}):
+            return database.config()
+
+    def test_engines_are_importable(self):
+        # The wrapper itself needs the driver, but the backend module must exist under this name
+        for engine in (*database.engines.values(), self.openshift_config()['ENGINE']):
+            self.assertIsNotNone(importlib.util.find_spec(f'{engine}.base'), engine)
+
+    @skipUnless(importlib.util.find_spec('psycopg') or importlib.util.find_spec('psycopg2'), 'needs a psycopg driver')
+    def test_openshift_config_builds_a_connection(self):
+        config = self.openshift_config(DATABASE_POOL='True')
+        wrapper = ConnectionHandler({'default': config})['default']
+        self.assertEqual(wrapper.vendor, 'postgresql')
+        self.assertEqual(wrapper.settings_dict['OPTIONS']['pool']['max_size'], 10)
+        self.assertEqual(wrapper.settings_dict['CONN_MAX_AGE'], 0)
+
+
+class PruneFriendRequestsTest(TestCase):
+    def setUp(self):
+        self.users = [
+            CustomUser.objects.create_user(username=f'prune{i}', email=f'prune{i}@example.com') for i in range(6)
+        ]
+        u = self.users
+        self.pending = FriendRequest.objects.create(sender=u[0], receiver=u[1])
+        self.accepted = FriendRequest.objects.create(sender=u[0], receiver=u[2])
+        self.accepted.accept()
+        self.recent_rejected = FriendRequest.objects.create(sender=u[0], receiver=u[3])
+        self.recent_rejected.reject()
+        self.old_rejected = [FriendRequest.objects.create(sender=u[i], receiver=u[5]) for i in (1, 2, 3)]
+        for request in self.old_rejected:
+            request.reject()
+        FriendRequest.objects.filter(id__in=[r.id for r in self.old_rejected]).update(
+            updated_at=timezone.now() - timedelta(days=100)
+        )
+
+    def test_removes_resolved_requests_in_batches(self):
+        out = StringIO()
+        call_command('prune_friend_requests', days=30, batch_size=2, archive=True, stdout=out)
+        self.assertIn('Removed 1 accepted and 3 rejected', out.getvalue())
+
+        self.assertEqual(
+            set(FriendRequest.objects.values_list('id', flat=True)), {self.pending.id, self.recent_rejected.id}
+        )
+        self.assertEqual(
+            sorted(FriendRequestArchive.objects.values_list('sender_id', 'receiver_id', 'status')),
+            [(self.users[i].id, self.users[5].id, FriendRequest.REJECTED) for i in (1, 2, 3)]
+        )
+        # The friendship outlives its request, and the pending count is untouched
+        self.assertTrue(self.users[0].friends.filter(id=self.users[2].id).exists())
+        self.assertEqual(CustomUser.objects.get(id=self.users[1].id).pending_in_count, 1)
+
+    def test_dry_run_writes_nothing(self):
+        out = StringIO()
+        call_command('prune_friend_requests', days=30, dry_run=True, stdout=out)
+        self.assertIn('Would remove 1 accepted and 3 rejected', out.getvalue())
+        self.assertEqual(FriendRequest.objects.count(), 6)
+
+
+class RespondToTest(TestCase):
+    def setUp(self):
+        self.sender = CustomUser.objects.create_user(username='race-sender', email='race-sender@example.com')
+        self.receiver = CustomUser.objects.create_user(username='race-receiver', email='race-receiver@example.com')
+        self.request = FriendRequest.objects.create(sender=self.sender, receiver=self.receiver)
+
+    def test_only_the_first_of_concurrent_responses_applies(self):
+        # Both copies were loaded while the request was pending
+        first = FriendRequest.objects.select_related('receiver').get(id=self.request.id)
+        second = FriendRequest.objects.select_related('receiver').get(id=self.request.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(first.accept())
+        self.assertEqual(first.status, FriendRequest.ACCEPTED)
+        # Conditional update, pending counter, friend insert and the two friend counter updates
+        self.assertEqual(len([q for q in queries if q['sql'].startswith(('UPDATE', 'INSERT'))]), 5)
+
+        self.assertFalse(second.accept())
+        self.assertFalse(second.reject())
+        self.request.refresh_from_db()
+        self.assertEqual(self.request.status, FriendRequest.ACCEPTED)
+        self.assertEqual(list(self.receiver.friends.values_list('id', flat=True)), [self.sender.id])
+        self.assertEqual(CustomUser.objects.get(id=self.sender.id).friend_count, 1)
+
+    def test_accept_is_idempotent_for_existing_friendships(self):
+        self.sender.friends.add(self.receiver)
+        self.assertTrue(self.request.accept())
+        self.assertEqual(self.receiver.friends.count(), 1)
+        self.assertEqual(CustomUser.objects.get(id=self.receiver.id).friend_count, 1)
+
+
+class UserCountersTest(TestCase):
+    def setUp(self):
+        self.alice, self.bob, self.carol = [
+            CustomUser.objects.create_user(username=f'count-{name}', email=f'count-{name}@example.com', password='pw')
+            for name in ('alice', 'bob', 'carol')
+        ]
+
+    def counts(self, user):
+        user.refresh_from_db(fields=['friend_count', 'pending_in_count'])
+        return user.friend_count, user.pending_in_count
+
+    def test_request_views_keep_counts(self):
+        self.client.force_login(self.alice)
+        self.client.post('/api/friend-requests/', {'receiver': self.bob.id})
+        self.client.post('/api/friend-requests/', {'receiver': self.carol.id})
+        self.assertEqual(self.counts(self.bob), (0, 1))
+
+        self.client.force_login(self.bob)
+        request = FriendRequest.objects.get(receiver=self.bob)
+        self.client.post(f'/api/friend-requests/{request.id}/accept/')
+        self.assertEqual([self.counts(user) for user in (self.alice, self.bob)], [(1, 0), (1, 0)])
+
+        self.client.force_login(self.carol)
+        self.client.post('/api/friend-requests/bulk_accept/', {'all': True}, content_type='application/json')
+        self.assertEqual([self.counts(user) for user in (self.alice, self.carol)], [(2, 0), (1, 0)])
+
+        self.client.post('/api/friend-requests/unfollow/', {'user_id': self.alice.id})
+        self.assertEqual([self.counts(user) for user in (self.alice, self.carol)], [(1, 0), (0, 0)])
+
+    def test_counts_survive_repeats_deletes_and_stale_saves(self):
+        stale = CustomUser.objects.get(id=self.alice.id)
+        self.alice.friends.add(self.bob, self.carol)
+        self.alice.friends.add(self.bob)
+        self.bob.friends.add(self.alice)
+        FriendRequest.objects.create(sender=self.bob, receiver=self.alice).reject()
+        self.assertEqual(self.counts(self.alice), (2, 0))
+
+        stale.first_name = 'Alice'
+        stale.save()
+        self.assertEqual(self.counts(self.alice), (2, 0))
+
+        FriendRequest.objects.create(sender=self.carol, receiver=self.bob)
+        self.carol.delete()
+        self.assertEqual([self.counts(user) for user in (self.alice, self.bob)], [(1, 0), (1, 0)])
+        self.alice.friends.clear()
+        self.assertEqual([self.counts(user) for user in (self.alice, self.bob)], [(0, 0), (0, 0)])
+
+    def test_reconcile_fixes_drift(self):
+        self.alice.friends.add(self.bob)
+        FriendRequest.objects.create(sender=self.carol, receiver=self.alice)
+        CustomUser.objects.filter(id=self.alice.id).update(friend_count=7, pending_in_count=0)
+        CustomUser.objects.filter(id=self.carol.id).update(friend_count=3)
+
+        out = StringIO()
+        call_command('reconcile_user_counts', stdout=out)
+        self.assertIn('friend_count on 2 users, pending_in_count on 1', out.getvalue())
+        self.assertEqual([self.counts(user) for user in (self.alice, self.bob, self.carol)], [(1, 1), (1, 0), (0, 0)])
+
+
+class RecordingBroker(EventBroker):
+    def __init__(self):
+        self.published = []
+
+    def publish(self, user_ids, event):
+        self.published.append((sorted(set(user_ids)), event))
+
+
+@override_settings(EVENT_BROKER='api.tests.RecordingBroker')
+class EventPublishingTest(TestCase):
+    def setUp(self):
+        self.alice = CustomUser.objects.create_user(username='ev-alice', email='ev-alice@example.com', password='pw')
+        self.bob = CustomUser.objects.create_user(username='ev-bob', email='ev-bob@example.com', password='pw')
+        self.client.force_login(self.bob)
+
+    def test_request_lifecycle_is_published_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            request = FriendRequest.objects.create(sender=self.alice, receiver=self.bob)
+            self.assertEqual(get_broker().published, [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/friend-requests/{request.id}/accept/')
+
+        users = sorted([self.alice.id, self.bob.id])
+        events = [(user_ids, event['type'], event['request_id']) for user_ids, event in get_broker().published]
+        self.assertEqual(events, [
+            (users, FRIEND_REQUEST_CREATED, request.id), (users, FRIEND_REQUEST_ACCEPTED, request.id)
+        ])
+
+    def test_unfollow_publishes_friendship_removed(self):
+        self.alice.friends.add(self.bob)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/friend-requests/unfollow/', {'user_id': self.alice.id})
+
+        removed = [event for _, event in get_broker().published if event['type'] == FRIENDSHIP_REMOVED]
+        self.assertEqual(removed, [{'type': FRIENDSHIP_REMOVED, 'user_ids': sorted([self.alice.id, self.bob.id])}])
+
+
+@override_settings(ROOT_URLCONF='api.tests')
+class EventStreamTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='ev-stream', email='ev-stream@example.com', password='pw')
+
+    async def test_stream_relays_published_events(self):
+        user = self.user
+        self.assertEqual((await self.async_client.get('/async/events/')).status_code, 403)
+
+        await self.async_client.aforce_login(user)
+        self.assertEqual((await self.async_client.head('/async/events/')).status_code, 200)
+        response = await self.async_client.get('/async/events/')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunks = aiter(response.streaming_content)
+        self.assertEqual(await anext(chunks), b'retry: 5000\n\n')
+
+        get_broker().publish([user.id], {'type': FRIEND_REQUEST_CREATED, 'request_id': 1})
+        self.assertEqual(
+            await anext(chunks),
+            b'event: friend_request.created\ndata: {"type": "friend_request.created", "request_id": 1}\n\n'
+        )
+        await chunks.aclose()
+
+    def test_unavailable_without_asgi(self):
+        # Without ASYNC_API the stream isn't routed; 204 stops EventSource reconnecting
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get('/api/events/').status_code, 204)
+        self.assertEqual(self.client.head('/api/events/').status_code, 204)
+
+
+# Used by AsyncViewsTest to serve the async views next to the DRF ones
+urlpatterns = [
+    path('async/', include(async_api_urlpatterns)),
+    path('', include('api.urls')),
+]
+
+
+@override_settings(ROOT_URLCONF='api.tests')
+class AsyncViewsTest(TestCase):
+    def setUp(self):
+        hobby_index.invalidate()
+        hobby = Hobby.objects.create(name='async-hobby')
+        self.user = CustomUser.objects.create_user(
+            username='async-user', email='async-user@example.com', password='password123'
+        )
+        self.friend = CustomUser.objects.create_user(
+            username='async-friend', email='async-friend@example.com', password='password123',
+            date_of_birth=date(1990, 5, 1)
+        )
+        sender = CustomUser.objects.create_user(
+            username='async-sender', email='async-sender@example.com', password='password123'
+        )
+        for user in (self.user, self.friend, sender):
+            user.hobbies.add(hobby)
+        self.user.friends.add(self.friend)
+        FriendRequest.objects.create(sender=sender, receiver=self.user)
+
+    async def test_async_views_match_drf_payloads(self):
+        await self.async_client.aforce_login(self.user)
+        for endpoint in ('profile/me/', 'profile/search_users/', 'profile/search_users/?cursor=',
+                         'friend-requests/pending/', 'friend-requests/pending/?unpaginated=true',
+                         'friend-requests/friends/', 'friend-requests/friends/?unpaginated=true', 'hobbies/'):
+            sync_response = await self.async_client.get(f'/api/{endpoint}')
+            async_response = await self.async_client.get(f'/async/{endpoint}')
+            self.assertEqual(async_response.status_code, 200, endpoint)
+            self.assertEqual(async_response.json(), sync_response.json(), endpoint)
+            if 'ETag' in sync_response:
+                self.assertEqual(async_response['ETag'], sync_response['ETag'], endpoint)
+                revalidated = await self.async_client.get(
+                    f'/async/{endpoint}', headers={'If-None-Match': sync_response['ETag']}
+                )
+                self.assertEqual(revalidated.status_code, 304, endpoint)
+
+    async def test_async_views_require_login(self):
+        response = await self.async_client.get('/async/profile/me/')
+        self.assertEqual(response.status_code, 403)
+
+    async def test_search_failures_match_drf(self):
+        await self.async_client.aforce_login(self.user)
+        with mock.patch.object(search_cache, 'ranked', side_effect=RuntimeError('index unavailable')):
+            for prefix in ('/api/', '/async/'):
+                response = await self.async_client.get(f'{prefix}profile/search_users/')
+                self.assertEqual(response.status_code, 500, prefix)
+                self.assertEqual(response.json(), {'error': 'index unavailable'}, prefix)
@@ -2,7 +2,7 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path, re_path
 from django.http import HttpResponse
-from . import views
+from . import async_views, views
 from django.views.generic import TemplateView
 from rest_framework.routers import DefaultRouter
 from .views import main_spa, HobbyViewSet
@@ -12,7 +12,24 @@ router.register(r'hobbies', HobbyViewSet, basename='hobby')
 router.register(r'profile', views.UserProfileViewSet, basename='profile')
 router.register(r'friend-requests', views.FriendRequestViewSet, basename='friend-request')
 
+# ASGI-native versions of the hottest read endpoints. With ASYNC_API enabled
+# they are matched ahead of the equivalent DRF router routes
+async_api_urlpatterns = [
+    path('profile/me/', async_views.profile_me, name='profile-me'),
+    path('profile/search_users/', async_views.search_users, name='profile-search-users'),
+    path('friend-requests/pending/', async_views.pending_friend_requests, name='friend-request-pending'),
+    path('friend-requests/friends/', async_views.friends, name='friend-request-friends'),
+    path('hobbies/', async_views.hobby_list, name='hobby-list'),
+    # Server-sent events hold the connection open, which only an ASGI server can afford
+    path('events/', async_views.event_stream, name='event-stream'),
+]
+
 urlpatterns = [
+    path('api/', include(async_api_urlpatterns)),
+] if settings.ASYNC_API else []
+
+urlpatterns += [
+    path('api/events/', views.events_unavailable, name='events-unavailable'),
     path('admin/', admin.site.urls),
     path('register/', views.register_view, name='register'),
     path('login/', views.login_view, name='login'),
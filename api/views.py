@@ -1,26 +1,36 @@
-from typing import Dict, Union, Optional, List, Any
+import math
+from typing import Dict, Union, Optional, List, Any, Tuple
 
 from django.contrib.auth.decorators import login_required
 from django.db.models import QuerySet
-from django.http import HttpResponse, HttpRequest, JsonResponse
+from django.http import HttpResponse, HttpRequest
 from django.shortcuts import render, redirect
 from django.contrib.auth import login, logout, update_session_auth_hash
 from django.contrib.auth.forms import AuthenticationForm
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import ensure_csrf_cookie
-from django.db import models, transaction
+from django.db import IntegrityError, models, transaction
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
-from datetime import date, timedelta
 from rest_framework.request import Request
-from rest_framework.serializers import ModelSerializer
 
+from .catalog import hobby_catalog
+from .conditional import FRIENDS, PENDING, PROFILE, conditional_get
 from .forms import CustomUserCreationForm
+from .friend_graph import friend_graph
+from .hobby_suggest import hobby_suggester
+from .pagination import FriendPagination, FriendRequestPagination
 from .models import CustomUser, Hobby, FriendRequest
-from .serializers import HobbySerializer, UserProfileSerializer, FriendRequestSerializer
-
+from .search import (
+    SearchParams, annotate_results, other_party_ids, page_users, paginate_ranked, parse_search_params,
+    pending_between
+)
+from .search_cache import search_cache
+from .serializers import (
+    HobbySerializer, UserProfileSerializer, FriendRequestSerializer, FriendSerializer, friends_with_hobbies
+)
 
 
 def register_view(request: HttpRequest) -> HttpResponse:
@@ -51,23 +61,52 @@ def logout_view(request: HttpRequest) -> HttpResponse:
     return redirect('login')
 
 
+def events_unavailable(request: HttpRequest) -> HttpResponse:
+    """
+    /api/events/ without an ASGI server (ASYNC_API off), where a never-ending
+    stream would hold a worker. 204 tells EventSource not to reconnect.
+    """
+    return HttpResponse(status=204)
+
+
 class HobbyViewSet(viewsets.ModelViewSet):
     queryset: QuerySet[Hobby] = Hobby.objects.all()
     serializer_class: type[HobbySerializer] = HobbySerializer
     permission_classes: list[type[IsAuthenticated]] = [IsAuthenticated]
 
+    @conditional_get(PROFILE, catalog=True)
     def list(self, request: Request) -> Response:
-        # Get all hobbies and mark which ones the user has
-        hobbies: QuerySet[Hobby] = self.get_queryset()
-        user_hobby_ids: QuerySet[int] = request.user.hobbies.values_list('id', flat=True)
+        # Get all hobbies (serialized once per catalog change) and mark which ones the user has
+        user_hobby_ids: List[int] = list(request.user.hobbies.values_list('id', flat=True))
+        data: List[Dict[str, Any]] = hobby_catalog.for_user(user_hobby_ids)
+        return Response(data)
+
+    @action(detail=False, methods=['get'])
+    def suggest(self, request: Request) -> Response:
+        # Autocomplete for hobby names, most popular first, tolerating a typo
+        query: str = request.query_params.get('q', '')
+        try:
+            limit: int = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer: ModelSerializer = self.get_serializer(hobbies, many=True)
-        data: List[Dict[str, Any]] = serializer.data
+        data: List[Dict[str, Union[int, str]]] = [
+            {'id': hobby_id, 'name': name} for hobby_id, name in hobby_suggester.suggest(query, limit)
+        ]
+        return Response(data)
 
-        # Add a field to indicate if user has this hobby
-        for hobby in data:
-            hobby['user_has_hobby'] = hobby['id'] in user_hobby_ids
+    @action(detail=False, methods=['get'])
+    def trending(self, request: Request) -> Response:
+        # Read straight from the maintained counters, no aggregation over the membership table
+        try:
+            limit: int = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
 
+        data: List[Dict[str, Union[int, str]]] = list(
+            Hobby.objects.order_by('-recent_adds', '-user_count', 'name')
+            .values('id', 'name', 'user_count', 'recent_adds')[:limit]
+        )
         return Response(data)
 
     @action(detail=True, methods=['post'])
@@ -95,10 +134,7 @@ class HobbyViewSet(viewsets.ModelViewSet):
 
         hobby: Hobby
         created: bool
-        hobby, created = Hobby.objects.get_or_create(
-            name=name,
-            defaults={'name': name}
-        )
+        hobby, created = Hobby.objects.upsert(name)
 
         # Automatically add to user's profile when creating
         request.user.hobbies.add(hobby)
@@ -125,6 +161,7 @@ class UserProfileViewSet(viewsets.GenericViewSet):
         return self.request.user
 
     @action(detail=False, methods=['get'])
+    @conditional_get(PROFILE, catalog=True)
     def me(self, request: Request) -> Response:
         # Get current user's profile
         serializer: UserProfileSerializer = self.get_serializer(request.user)
@@ -134,104 +171,48 @@ class UserProfileViewSet(viewsets.GenericViewSet):
     def search_users(self, request: Request) -> Response:
         """Search for users with similar hobbies and optional age filtering."""
         try:
-            # Get query parameters
-            min_age: Optional[str] = request.query_params.get('min_age')
-            max_age: Optional[str] = request.query_params.get('max_age')
-            page: int = int(request.query_params.get('page', 1))
-            per_page: int = 10  # Fixed page size
-
-            # Get current user's hobbies
-            user_hobbies: models.QuerySet = request.user.hobbies.all()
-
-            # Base queryset excluding the current user
-            queryset: models.QuerySet[CustomUser] = CustomUser.objects.exclude(id=request.user.id)
-
-            # Filter users who have at least one hobby in common
-            if user_hobbies:
-                queryset = queryset.filter(hobbies__in=user_hobbies).distinct()
-
-            # Apply age filters if provided
-            if min_age or max_age:
-                today: date = date.today()
-
-                if min_age:
-                    try:
-                        max_date: date = today - timedelta(days=int(min_age) * 365)
-                        queryset = queryset.filter(date_of_birth__lte=max_date)
-                    except ValueError:
-                        return Response(
-                            {'error': 'Invalid minimum age value'},
-                            status=status.HTTP_400_BAD_REQUEST
-                        )
-
-                if max_age:
-                    try:
-                        min_date: date = today - timedelta(days=(int(max_age) + 1) * 365)
-                        queryset = queryset.filter(date_of_birth__gt=min_date)
-                    except ValueError:
-                        return Response(
-                            {'error': 'Invalid maximum age value'},
-                            status=status.HTTP_400_BAD_REQUEST
-                        )
-
-            # Calculate hobby similarity and annotate the queryset
-            queryset = queryset.annotate(
-                common_hobbies_count=models.Count(
-                    'hobbies',
-                    filter=models.Q(hobbies__in=user_hobbies)
+            try:
+                params: SearchParams = parse_search_params(request.query_params)
+
+                # Rank users by hobbies in common (or by the requested similarity
+                # score), cached per hobby set and age filters. Users sharing no
+                # hobby are left out unless the current user has none.
+                ranked: List[Tuple[int, float]] = search_cache.ranked(
+                    request.user.id, params.min_birth_date, params.max_birth_date,
+                    params.score, params.approximate
+                )
+                page_ranked: List[Tuple[int, float]]
+                pagination: Dict[str, Any]
+                page_ranked, pagination = paginate_ranked(ranked, request.query_params)
+            except ValueError as e:
+                return Response(
+                    {'error': str(e)},
+                    status=status.HTTP_400_BAD_REQUEST
                 )
-            ).order_by('-common_hobbies_count')
-
-            # Implement pagination
-            total_users: int = queryset.count()
-            total_pages: int = (total_users + per_page - 1) // per_page
-
-            # Validate page number
-            if page < 1:
-                page = 1
-            elif page > total_pages and total_pages > 0:
-                page = total_pages
 
-            start: int = (page - 1) * per_page
-            end: int = start + per_page
-            users_page: List[CustomUser] = list(queryset[start:end])
+            # Only the winning page is loaded from the database
+            users_by_id: Dict[int, CustomUser] = CustomUser.objects.prefetch_related('hobbies').in_bulk(
+                [user_id for user_id, _ in page_ranked]
+            )
+            users_page: List[CustomUser] = page_users(page_ranked, users_by_id, request.user.id, params.score)
 
             # Serialize the results
             serializer: UserProfileSerializer = self.get_serializer(users_page, many=True)
             data: List[Dict[str, Any]] = serializer.data
 
-            # Add the common hobbies count, age, and friendship status to each user
-            today = date.today()
-            for user_data, user_obj in zip(data, users_page):
-                user_data['common_hobbies_count'] = user_obj.common_hobbies_count
-
-                # Add age
-                if user_obj.date_of_birth:
-                    age: int = today.year - user_obj.date_of_birth.year
-                    if today.month < user_obj.date_of_birth.month or (
-                            today.month == user_obj.date_of_birth.month and
-                            today.day < user_obj.date_of_birth.day
-                    ):
-                        age -= 1
-                    user_data['age'] = age
-
-                # Check if users are friends
-                user_data['is_friend'] = request.user.friends.filter(id=user_obj.id).exists()
-
-                # Check for pending friend requests
-                pending_request: Optional[FriendRequest] = FriendRequest.objects.filter(
-                    (models.Q(sender=request.user) & models.Q(receiver=user_obj)) |
-                    (models.Q(sender=user_obj) & models.Q(receiver=request.user)),
-                    status=FriendRequest.PENDING
-                ).first()
-                user_data['has_pending_request'] = bool(pending_request)
-
-            return Response({
-                'users': data,
-                'total_users': total_users,
-                'total_pages': total_pages,
-                'current_page': page
-            })
+            # Look up friendships and pending requests for the whole page at once
+            page_ids: List[int] = [user_obj.id for user_obj in users_page]
+            friend_ids: set[int] = set(
+                request.user.friends.filter(id__in=page_ids).values_list('id', flat=True)
+            )
+            pending_ids: set[int] = other_party_ids(
+                request.user.id,
+                pending_between(request.user.id, page_ids).values_list('sender_id', 'receiver_id')
+            )
+
+            annotate_results(data, users_page, friend_ids, pending_ids)
+
+            return Response({'users': data, **pagination})
 
         except Exception as e:
             return Response(
@@ -239,6 +220,45 @@ class UserProfileViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=False, methods=['put', 'patch'])
+    def hobbies(self, request: Request) -> Response:
+        """Replace the user's hobbies (PUT {'hobbies': [...]}) or add and remove some (PATCH {'add', 'remove'})."""
+        fields: Tuple[str, ...] = ('hobbies',) if request.method == 'PUT' else ('add', 'remove')
+        ids: Dict[str, set[int]] = {}
+        for field in fields:
+            value: Any = request.data.get(field, [] if request.method == 'PATCH' else None)
+            if not isinstance(value, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in value):
+                return Response(
+                    {'error': f'{field} must be a list of hobby IDs'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            ids[field] = set(value)
+
+        if request.method == 'PATCH' and ids['add'] & ids['remove']:
+            return Response(
+                {'error': 'A hobby cannot be both added and removed'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        requested: set[int] = set().union(*ids.values())
+        unknown: set[int] = requested - set(Hobby.objects.filter(id__in=requested).values_list('id', flat=True))
+        if unknown:
+            return Response(
+                {'error': f'Unknown hobby IDs: {sorted(unknown)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        user: CustomUser = self.get_object()
+        if request.method == 'PUT':
+            added, removed, current = user.update_hobbies(replace=ids['hobbies'])
+        else:
+            added, removed, current = user.update_hobbies(add=ids['add'], remove=ids['remove'])
+        return Response({'hobbies': sorted(current), 'added': sorted(added), 'removed': sorted(removed)})
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
+    def search_cache_stats(self, request: Request) -> Response:
+        """Hit and miss counters for the search_users result cache."""
+        return Response(search_cache.stats())
+
     @action(detail=False, methods=['put', 'patch'])
     def update_profile(self, request: Request) -> Response:
         user: CustomUser = self.get_object()
@@ -287,92 +307,178 @@ def other_spa_routes(request: HttpRequest, path: Optional[str] = None) -> HttpRe
 class FriendRequestViewSet(viewsets.ModelViewSet):
     serializer_class = FriendRequestSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = FriendRequestPagination
 
     def get_queryset(self) -> QuerySet[FriendRequest]:
+        # The serializer reads both usernames, so join them into the same query
         return FriendRequest.objects.filter(
             models.Q(sender=self.request.user) |
             models.Q(receiver=self.request.user)
-        )
+        ).select_related('sender', 'receiver')
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        friend_requests: QuerySet[FriendRequest] = self.filter_queryset(self.get_queryset())
+        page: Optional[List[FriendRequest]] = self.paginate_queryset(friend_requests)
+        if page is None:
+            page = self.paginator.unpaginated_list(friend_requests, request, view=self)
+            return Response(self.get_serializer(page, many=True).data)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
 
     @action(detail=False, methods=['get'])
+    @conditional_get(PENDING)
     def pending(self, request: Request) -> Response:
         """Get all pending friend requests for the current user"""
         pending_requests: QuerySet[FriendRequest] = FriendRequest.objects.filter(
             receiver=request.user,
             status=FriendRequest.PENDING
-        )
-        serializer = self.get_serializer(pending_requests, many=True)
-        return Response(serializer.data)
+        ).select_related('sender', 'receiver')
+        page: Optional[List[FriendRequest]] = self.paginate_queryset(pending_requests)
+        if page is None:
+            page = self.paginator.unpaginated_list(pending_requests, request, view=self)
+            return Response(self.get_serializer(page, many=True).data)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @conditional_get(FRIENDS, catalog=True)
     def friends(self, request: Request) -> Response:
         """Get all friends of the current user"""
-        user: CustomUser = request.user
-        friends: QuerySet[CustomUser] = user.friends.all()
-        serializer = UserProfileSerializer(friends, many=True)
-        return Response(serializer.data)
+        friends: QuerySet[CustomUser] = friends_with_hobbies(request.user)
+        paginator: FriendPagination = FriendPagination()
+        page: Optional[List[CustomUser]] = paginator.paginate_queryset(friends, request, view=self)
+        if page is None:
+            page = paginator.unpaginated_list(friends, request, view=self)
+            return Response(FriendSerializer(page, many=True).data)
+        return paginator.get_paginated_response(FriendSerializer(page, many=True).data)
 
-    def create(self, request: Request) -> Response:
+    @action(detail=False, methods=['get'])
+    def mutual_friends(self, request: Request) -> Response:
+        """Friends the current user has in common with ?user_id=, by username."""
         try:
-            receiver_id: Optional[int] = request.data.get('receiver')
-            if not receiver_id:
-                return Response(
-                    {'error': 'Receiver ID is required'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            other_id: int = int(request.query_params['user_id'])
+            limit: int = min(max(int(request.query_params.get('limit', 20)), 1), 200)
+        except (KeyError, ValueError):
+            return Response(
+                {'error': 'user_id and limit must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            try:
-                receiver: CustomUser = CustomUser.objects.get(id=receiver_id)
-            except CustomUser.DoesNotExist:
-                return Response(
-                    {'error': 'Receiver user not found'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
+        mutual_ids: List[int] = friend_graph.mutual_friend_ids(request.user.id, other_id).tolist()
+        friends: List[Dict[str, Any]] = list(
+            CustomUser.objects.filter(id__in=mutual_ids).order_by('username').values('id', 'username')[:limit]
+        )
+        return Response({'user_id': other_id, 'count': len(mutual_ids), 'friends': friends})
 
-            if receiver_id == request.user.id:
-                return Response(
-                    {'error': 'You cannot send a friend request to yourself'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+    @action(detail=False, methods=['get'])
+    def suggestions(self, request: Request) -> Response:
+        """People you may know: friends of friends, optionally favouring shared hobbies (?hobby_weight=)."""
+        try:
+            limit: int = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+            hobby_weight: float = float(request.query_params.get('hobby_weight', 0))
+            if not math.isfinite(hobby_weight):
+                raise ValueError(hobby_weight)
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer and hobby_weight a finite number'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            if request.user.friends.filter(id=receiver_id).exists():
-                return Response(
-                    {'error': 'Users are already friends'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        # Users with a pending request either way already know about each other
+        pending: set[int] = other_party_ids(
+            request.user.id,
+            FriendRequest.objects.filter(
+                models.Q(sender=request.user) | models.Q(receiver=request.user),
+                status=FriendRequest.PENDING
+            ).values_list('sender_id', 'receiver_id')
+        )
+        ranked: List[Tuple[int, int, int, float]] = friend_graph.suggestions(
+            request.user.id, limit, hobby_weight, exclude=pending
+        )
+        usernames: Dict[int, str] = dict(
+            CustomUser.objects.filter(id__in=[user_id for user_id, *_ in ranked]).values_list('id', 'username')
+        )
+        data: List[Dict[str, Any]] = [
+            {
+                'id': user_id,
+                'username': usernames[user_id],
+                'mutual_friends': mutual,
+                'common_hobbies': common,
+                'score': score,
+            }
+            for user_id, mutual, common, score in ranked if user_id in usernames
+        ]
+        return Response(data)
 
-            existing_request: Optional[FriendRequest] = FriendRequest.objects.filter(
-                models.Q(sender=request.user, receiver=receiver) |
-                models.Q(sender=receiver, receiver=request.user)
-            ).first()
+    def create(self, request: Request) -> Response:
+        if not request.data.get('receiver'):
+            return Response(
+                {'error': 'Receiver ID is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            receiver_id: int = int(request.data['receiver'])
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'Receiver ID must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            if existing_request:
-                if existing_request.status == FriendRequest.PENDING:
-                    return Response(
-                        {'error': 'A friend request already exists between these users'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                elif existing_request.status == FriendRequest.REJECTED:
-                    existing_request.status = FriendRequest.PENDING
-                    existing_request.save()
-                    serializer = self.get_serializer(existing_request)
-                    return Response(serializer.data, status=status.HTTP_200_OK)
-
-            friend_request: FriendRequest = FriendRequest.objects.create(
-                sender=request.user,
-                receiver=receiver,
-                status=FriendRequest.PENDING
+        try:
+            receiver: CustomUser = CustomUser.objects.get(id=receiver_id)
+        except CustomUser.DoesNotExist:
+            return Response(
+                {'error': 'Receiver user not found'},
+                status=status.HTTP_404_NOT_FOUND
             )
 
-            serializer = self.get_serializer(friend_request)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        if receiver_id == request.user.id:
+            return Response(
+                {'error': 'You cannot send a friend request to yourself'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        except Exception as e:
+        if request.user.friends.filter(id=receiver_id).exists():
             return Response(
-                {'error': str(e)},
+                {'error': 'Users are already friends'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        existing_request: Optional[FriendRequest] = FriendRequest.objects.between(
+            request.user.id, receiver.id
+        ).first()
+
+        if existing_request is None:
+            try:
+                with transaction.atomic():
+                    friend_request: FriendRequest = FriendRequest.objects.create(
+                        sender=request.user,
+                        receiver=receiver,
+                        status=FriendRequest.PENDING
+                    )
+            except IntegrityError:
+                # The other user's request for the pair committed first
+                existing_request = FriendRequest.objects.between(request.user.id, receiver.id).first()
+                if existing_request is None:
+                    raise
+            else:
+                serializer = self.get_serializer(friend_request)
+                return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+        if existing_request.status == FriendRequest.PENDING:
+            return Response(
+                {'error': 'A friend request already exists between these users'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # One row per pair, so a new request reopens it, whatever became of the old one,
+        # sent by the current user
+        existing_request.sender = request.user
+        existing_request.receiver = receiver
+        existing_request.status = FriendRequest.PENDING
+        existing_request.save()
+        serializer = self.get_serializer(existing_request)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=['post'])
     def accept(self, request: Request, pk: Optional[int] = None) -> Response:
         friend_request: FriendRequest = self.get_object()
@@ -405,6 +511,32 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
             status=status.HTTP_400_BAD_REQUEST
         )
 
+    def _respond_in_bulk(self, request: Request, new_status: str) -> Response:
+        # Either {"ids": [...]} or {"all": true} for every pending request
+        ids: Optional[List[int]] = None
+        if request.data.get('all') is not True:
+            ids = request.data.get('ids')
+            if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+                return Response(
+                    {'error': 'ids must be a list of friend request IDs, or set all to true'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        updated: List[int] = FriendRequest.objects.respond(request.user, new_status, ids)
+        data: Dict[str, List[int]] = {'updated': sorted(updated)}
+        if ids is not None:
+            # Not pending, or not sent to the current user
+            data['skipped'] = sorted(set(ids) - set(updated))
+        return Response(data)
+
+    @action(detail=False, methods=['post'])
+    def bulk_accept(self, request: Request) -> Response:
+        return self._respond_in_bulk(request, FriendRequest.ACCEPTED)
+
+    @action(detail=False, methods=['post'])
+    def bulk_reject(self, request: Request) -> Response:
+        return self._respond_in_bulk(request, FriendRequest.REJECTED)
+
     @action(detail=False, methods=['post'])
     def unfollow(self, request: Request) -> Response:
         """Remove a user from friends list"""
@@ -420,10 +552,7 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
 
             request.user.friends.remove(friend)
 
-            FriendRequest.objects.filter(
-                (models.Q(sender=request.user) & models.Q(receiver=friend)) |
-                (models.Q(sender=friend) & models.Q(receiver=request.user))
-            ).delete()
+            FriendRequest.objects.between(request.user.id, friend.id).delete()
 
             return Response({'status': 'user unfollowed'})
         except CustomUser.DoesNotExist:
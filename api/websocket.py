@@ -0,0 +1,69 @@
+"""
+WebSocket endpoint relaying the events of api.events, for clients that prefer
+it to the /api/events/ server-sent event stream.
+
+This is a plain ASGI application (project.asgi routes websocket connections to
+it), authenticated with the same session cookie as the rest of the API. Events
+are sent as JSON text frames; anything the client sends is ignored.
+"""
+
+import asyncio
+import json
+from http.cookies import SimpleCookie
+from importlib import import_module
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from django.conf import settings
+from django.contrib.auth import aget_user
+
+from .events import Subscription, get_broker
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+
+EVENTS_PATH: str = '/ws/events/'
+
+
+async def _user_id(scope: Scope) -> Optional[int]:
+    headers: Dict[str, str] = {name.decode('latin-1'): value.decode('latin-1') for name, value in scope['headers']}
+    cookie: SimpleCookie = SimpleCookie(headers.get('cookie', ''))
+    morsel = cookie.get(settings.SESSION_COOKIE_NAME)
+    if morsel is None:
+        return None
+    session = import_module(settings.SESSION_ENGINE).SessionStore(morsel.value)
+    # aget_user only needs request.session, and checks the session auth hash like the HTTP views do
+    user = await aget_user(SimpleNamespace(session=session))
+    return user.id if user.is_authenticated else None
+
+
+async def websocket_application(
+        scope: Scope,
+        receive: Callable[[], Awaitable[Message]],
+        send: Callable[[Message], Awaitable[None]]
+) -> None:
+    if (await receive())['type'] != 'websocket.connect':
+        return
+    user_id: Optional[int] = await _user_id(scope) if scope['path'] == EVENTS_PATH else None
+    if user_id is None:
+        await send({'type': 'websocket.close', 'code': 4403})
+        return
+    await send({'type': 'websocket.accept'})
+
+    subscription: Subscription = get_broker().subscribe(user_id)
+    incoming: asyncio.Task = asyncio.ensure_future(receive())
+    outgoing: asyncio.Task = asyncio.ensure_future(subscription.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait({incoming, outgoing}, return_when=asyncio.FIRST_COMPLETED)
+            if outgoing in done:
+                await send({'type': 'websocket.send', 'text': json.dumps(outgoing.result())})
+                outgoing = asyncio.ensure_future(subscription.get())
+            if incoming in done:
+                if incoming.result()['type'] == 'websocket.disconnect':
+                    return
+                incoming = asyncio.ensure_future(receive())
+    finally:
+        incoming.cancel()
+        outgoing.cancel()
+        subscription.close()
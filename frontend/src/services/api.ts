@@ -1,12 +1,23 @@
-import {ApiResponse, Hobby, UserProfile} from "./types.ts";
+import {ApiResponse, Hobby, HobbyDiff, UserProfile} from "./types.ts";
 
 const API_BASE_URL = '/api';
 
+interface CachedResponse {
+    etag: string;
+    data: unknown;
+}
+
 class ApiService {
+    // Last ETag and body per GET endpoint, replayed when the server answers 304
+    private validators = new Map<string, CachedResponse>();
+
     private async request<T>(
         endpoint: string,
         options: RequestInit = {}
     ): Promise<ApiResponse<T>> {
+        const isGet = !options.method || options.method === 'GET';
+        const cached = isGet ? this.validators.get(endpoint) : undefined;
+
         try {
             // Get CSRF token from cookie
             const csrfToken = document.cookie
@@ -17,6 +28,7 @@ class ApiService {
             const headers = {
                 'Content-Type': 'application/json',
                 'X-CSRFToken': csrfToken || '', // Add CSRF token header
+                ...(cached ? {'If-None-Match': cached.etag} : {}),
                 ...options.headers,
             };
 
@@ -26,6 +38,13 @@ class ApiService {
                 credentials: 'include',
             });
 
+            if (response.status === 304 && cached) {
+                return {
+                    data: cached.data as T,
+                    status: 200,
+                };
+            }
+
             if(!response.ok)
             {
                 try {
@@ -43,6 +62,10 @@ class ApiService {
             }
 
             const data = await response.json();
+            const etag = response.headers.get('ETag');
+            if (isGet && etag) {
+                this.validators.set(endpoint, {etag, data});
+            }
             return {
                 data,
                 status: response.status,
@@ -91,6 +114,20 @@ class ApiService {
         });
     }
 
+    async setProfileHobbies(hobbyIds: number[]): Promise<ApiResponse<HobbyDiff>> {
+        return this.request<HobbyDiff>('/profile/hobbies/', {
+            method: 'PUT',
+            body: JSON.stringify({hobbies: hobbyIds}),
+        });
+    }
+
+    async updateProfileHobbies(add: number[], remove: number[]): Promise<ApiResponse<HobbyDiff>> {
+        return this.request<HobbyDiff>('/profile/hobbies/', {
+            method: 'PATCH',
+            body: JSON.stringify({add, remove}),
+        });
+    }
+
     // Auth endpoints
     async login(username: string, password: string): Promise<ApiResponse<void>> {
         const formData = new FormData();
@@ -108,6 +145,7 @@ class ApiService {
     }
 
     async logout(): Promise<ApiResponse<void>> {
+        this.validators.clear();
         return this.request<void>('/logout/', {
             method: 'POST',
         });
@@ -4,12 +4,20 @@ export interface Hobby {
     user_has_hobby: boolean;
 }
 
+export interface HobbyDiff {
+  hobbies: number[];
+  added: number[];
+  removed: number[];
+}
+
 export interface UserProfile {
   id: number;
   username: string;
   email: string;
   date_of_birth?: string | null;
   hobbies: Hobby[];
+  friend_count: number;
+  pending_in_count: number;
 }
 
 export interface ApiResponse<T> {
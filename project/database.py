@@ -3,15 +3,61 @@ from django.conf import settings
 
 engines = {
     'sqlite': 'django.db.backends.sqlite3',
-    'postgresql': 'django.db.backends.postgresql_psycopg2',
+    'postgresql': 'django.db.backends.postgresql',
     'mysql': 'django.db.backends.mysql',
 }
 
 
+def _flag(name, default):
+    return os.getenv(name, str(default)) == 'True'
+
+
+def connection_options(engine):
+    """
+    Connection reuse and tuning for the given engine, from environment variables.
+
+    PostgreSQL keeps connections open for DATABASE_CONN_MAX_AGE seconds (default
+    60), or with DATABASE_POOL=True draws them from Django's psycopg pool
+    (needs psycopg[pool]; DATABASE_POOL_MIN_SIZE, DATABASE_POOL_MAX_SIZE and
+    DATABASE_POOL_TIMEOUT size it). Both are checked before reuse unless
+    DATABASE_CONN_HEALTH_CHECKS=False. SQLite runs the SQLITE_* PRAGMAs on every
+    new connection: WAL lets reads proceed during a write, busy_timeout makes
+    writers wait for the lock instead of failing at once.
+    """
+    if engine == engines['sqlite']:
+        pragmas = {
+            'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+            'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', '5000')),  # milliseconds
+            'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),  # Durable enough with WAL
+            'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', str(128 * 1024 * 1024))),  # bytes
+        }
+        return {
+            'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '0')),
+            'OPTIONS': {
+                'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in pragmas.items()),
+            },
+        }
+
+    options = {
+        'CONN_HEALTH_CHECKS': _flag('DATABASE_CONN_HEALTH_CHECKS', True),
+        'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '60')),
+        'OPTIONS': {},
+    }
+    if engine == engines['postgresql'] and _flag('DATABASE_POOL', False):
+        # The pool replaces persistent connections; Django refuses both at once
+        options['CONN_MAX_AGE'] = 0
+        options['OPTIONS']['pool'] = {
+            'min_size': int(os.getenv('DATABASE_POOL_MIN_SIZE', '2')),
+            'max_size': int(os.getenv('DATABASE_POOL_MAX_SIZE', '10')),
+            'timeout': float(os.getenv('DATABASE_POOL_TIMEOUT', '10')),
+        }
+    return options
+
+
 def config():
     if os.getenv('OPENSHIFT_BUILD_NAME'):  # We're on OpenShift
         return {
-            'ENGINE': 'django.db.backends.postgresql_psycopg2',
+            'ENGINE': engines['postgresql'],
             'NAME': os.getenv('DATABASE_NAME', 'django'),
             'USER': os.getenv('DATABASE_USER', 'django'),
             'PASSWORD': os.getenv('DATABASE_PASSWORD'),
@@ -20,6 +66,7 @@ def config():
             'TEST': {
                 'NAME': os.getenv('DATABASE_NAME', 'django'),
             },
+            **connection_options(engines['postgresql']),
         }
 
     # Local development settings
@@ -38,4 +85,5 @@ def config():
         'PASSWORD': os.getenv('DATABASE_PASSWORD'),
         'HOST': os.getenv('{}_SERVICE_HOST'.format(service_name)),
         'PORT': os.getenv('{}_SERVICE_PORT'.format(service_name)),
-    }
\ No newline at end of file
+        **connection_options(engine),
+    }
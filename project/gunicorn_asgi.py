@@ -0,0 +1,26 @@
+"""
+Gunicorn config for serving the project as ASGI with uvicorn workers.
+
+Run with ASYNC_API=True so the async views in api.async_views are used:
+
+    ASYNC_API=True gunicorn -c project/gunicorn_asgi.py project.asgi:application
+
+The default WSGI deployment (gunicorn project.wsgi) is unaffected. Set
+PROMETHEUS_MULTIPROC_DIR to an empty directory so /metrics aggregates all
+workers.
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+worker_class = 'uvicorn.workers.UvicornWorker'
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+
+def child_exit(server, worker):
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -31,8 +31,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.metrics.MetricsMiddleware',  # First, so it times the whole stack
+    # Every middleware is sync and async capable, so under ASGI no request is run through sync_to_async
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',  # Moved whitenoise to top
+    'api.static.HybridWhiteNoiseMiddleware',  # Moved whitenoise to top; hybrid, so ASGI requests stay async
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -79,7 +81,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'project.wsgi.application'
 
-# Database configuration
+# Database configuration. Connection reuse, pooling and SQLite PRAGMAs are set
+# from environment variables, see project/database.py
 DATABASES = {
     'default': database.config()
 }
@@ -90,6 +93,20 @@ if os.getenv('OPENSHIFT_BUILD_NAME'):
         'NAME': os.getenv('DATABASE_NAME', 'django'),
     }
 
+# Must be shared by every worker process: it holds the version stamps behind
+# the ETags (api.conditional) and the hobby catalog version (api.catalog). The
+# database cache needs no extra service (run createcachetable once); point
+# CACHE_BACKEND/CACHE_LOCATION at Redis or Memcached for lower latency and
+# atomic stamp increments (the database cache overwrites stamps with a fresh
+# value instead). With a per-process backend such as LocMemCache, ETags are
+# switched off.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'django_cache'),
+    }
+}
+
 AUTH_USER_MODEL = 'api.CustomUser'
 TIME_ZONE = 'Europe/London'
 # Rest of your settings remain the same...
@@ -102,4 +119,42 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 # Only include internal IPs in development
 if not os.getenv('OPENSHIFT_BUILD_NAME'):
-    INTERNAL_IPS = ['127.0.0.1']
\ No newline at end of file
+    INTERNAL_IPS = ['127.0.0.1']
+
+# Seconds before the in-process hobby search index is rebuilt from the database,
+# so changes made by other worker processes are picked up. With a per-process
+# cache it also bounds how long the hobby catalog version is trusted
+HOBBY_INDEX_MAX_AGE = int(os.getenv('HOBBY_INDEX_MAX_AGE', '300'))
+
+# Seconds before the in-process friendship graph (mutual friends and friend
+# suggestions) is rebuilt from the database
+FRIEND_GRAPH_MAX_AGE = int(os.getenv('FRIEND_GRAPH_MAX_AGE', '300'))
+
+# Maximum number of ranked search_users results kept in the in-process cache
+SEARCH_CACHE_SIZE = int(os.getenv('SEARCH_CACHE_SIZE', '1024'))
+
+# MinHash signature length and number of LSH bands for approximate search_users
+LSH_NUM_PERM = int(os.getenv('LSH_NUM_PERM', '64'))
+LSH_BANDS = int(os.getenv('LSH_BANDS', '16'))
+
+# Serve the profile, search, friend request and hobby list reads from the async
+# views in api.async_views, and push events from /api/events/. Only set it
+# under an ASGI server (see project/gunicorn_asgi.py): the event stream never
+# ends, so WSGI workers could not serve it
+ASYNC_API = os.getenv('ASYNC_API', 'False') == 'True'
+
+# Days a rejected friend request is kept before prune_friend_requests removes
+# (or archives) it
+FRIEND_REQUEST_RETENTION_DAYS = int(os.getenv('FRIEND_REQUEST_RETENTION_DAYS', '90'))
+
+# Broker relaying friend request events to /api/events/ and the WebSocket
+# endpoint. The in-process default only reaches clients connected to the same
+# worker; point this at an api.events.EventBroker backed by a shared message bus
+# when running several
+EVENT_BROKER = os.getenv('EVENT_BROKER', 'api.events.InProcessBroker')
+
+# Seconds between keep-alive comments on an idle event stream
+EVENTS_HEARTBEAT = int(os.getenv('EVENTS_HEARTBEAT', '15'))
+
+# When set, /metrics requires an "Authorization: Bearer <token>" header
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
@@ -4,8 +4,12 @@ from django.contrib import admin
 from django.urls import include, path
 from django.http import HttpResponse
 
+from api.metrics import metrics_view
+
 
 urlpatterns = [
+    # Ahead of api.urls, whose catch-all route serves the SPA
+    path('metrics', metrics_view, name='metrics'),
     path('', include('api.urls')),
     path('health', lambda request: HttpResponse("OK")),
     path('admin/', admin.site.urls),